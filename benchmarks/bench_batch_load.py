@@ -0,0 +1,68 @@
+"""Batch loading throughput: `load_models_from_paths` with 1 vs N workers.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_batch_load.py --files 20000 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import generate_spec
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_cursor import NodeCursor
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+
+
+class CountingModel(DocConvertible):
+    """Minimal model: keeps only the node count (cheap to send back)."""
+
+    def __init__(self, n_nodes: int):
+        self.n_nodes = n_nodes
+
+    @classmethod
+    def from_cursor(cls, cur: NodeCursor):
+        return cls(len(cur.view))
+
+    def to_nodes(self):
+        return []
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--files", type=int, default=20_000)
+    ap.add_argument("--lines", type=int, default=100, help="lines per file")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = ap.parse_args()
+
+    uc = ConvertFileUsecase(MarkdownParserImpl(), None, FileStorage())
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.files):
+            p = Path(tmp) / f"{i:05d}.md"
+            p.write_text(generate_spec(args.lines, seed=i), encoding="utf-8")
+            paths.append(p)
+
+        timings = {}
+        for workers in sorted({1, args.workers}):
+            t0 = time.perf_counter()
+            results = uc.load_models_from_paths(paths, CountingModel, workers=workers)
+            timings[workers] = time.perf_counter() - t0
+            assert all(r.ok for r in results)
+            print(
+                f"workers={workers:>3}: {timings[workers]:.3f}s "
+                f"({args.files / timings[workers]:,.0f} files/sec)"
+            )
+        print(f"speedup: {timings[1] / timings[args.workers]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Plain `Table` vs. `ColumnarTable` for one very large table.
+
+Reports parse time and retained memory (`tracemalloc`) of a document made of a
+single table with ``--rows`` rows, plus the time to collect all values of one
+column and to look a value up in it.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_columnar.py --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_ir import ColumnarTable, Table
+
+_WORDS = "alpha beta gamma delta 仕様 設計 要件 表".split()
+
+
+def generate_table(n_rows: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = ["| id | name | status | note |", "|----|------|--------|------|"]
+    for i in range(n_rows):
+        note = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(1, 6)))
+        status = rng.choice(["open", "closed", "-"])
+        lines.append(f"| REQ-{i:06d} | {rng.choice(_WORDS)}{i} | {status} | {note} |")
+    return "\n".join(lines) + "\n"
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--rows", type=int, default=100_000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    text = generate_table(args.rows)
+    target = f"REQ-{args.rows - 1:06d}"
+    for name, parser in (
+        ("Table", MarkdownParserImpl()),
+        ("ColumnarTable", MarkdownParserImpl(columnar_min_rows=1024)),
+    ):
+        parse_s = _best(lambda parser=parser: parser.parse(text), args.repeat)
+        gc.collect()
+        tracemalloc.start()
+        table = parser.parse(text).nodes[0]
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        if isinstance(table, ColumnarTable):
+            column = table.column("id")
+            scan_s = _best(lambda column=column: list(column), args.repeat)
+            find_s = _best(lambda column=column: column.index(target), args.repeat)
+        else:
+            assert isinstance(table, Table)
+            scan_s = _best(lambda table=table: [r[0] for r in table.rows], args.repeat)
+            find_s = _best(
+                lambda table=table: next(
+                    i for i, r in enumerate(table.rows) if r[0] == target
+                ),
+                args.repeat,
+            )
+        print(
+            f"{name:>14}: parse {parse_s * 1000:8.1f} ms, "
+            f"retained {retained / 2**20:7.2f} MiB, "
+            f"column scan {scan_s * 1000:7.2f} ms, "
+            f"lookup {find_s * 1000:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
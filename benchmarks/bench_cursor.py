@@ -0,0 +1,119 @@
+"""`from_cursor`-style model on a large document: copying vs. view cursors.
+
+A typical `DocConvertible.from_cursor` walks the document section by section:
+it forks the cursor to look ahead into each section body and then skips the
+body. With the former list-copying cursor every `fork` copied the rest of the
+document (quadratic overall); the view cursor shares the node list, so the
+same model code is linear. A second model uses `section()` / `seek_heading`.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_cursor.py --nodes 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, List, Optional
+
+from mddocs.domain.doc_cursor import NodeCursor
+from mddocs.domain.doc_ir import DocNode, Heading, Paragraph, Table
+
+
+class CopyingCursor:
+    """The previous `NodeCursor` behaviour: own list, `fork` slices a copy."""
+
+    def __init__(self, nodes, front_matter: Optional[dict] = None):
+        self.front_matter: dict = front_matter or {}
+        self.nodes: List[DocNode] = list(nodes)
+        self.index = 0
+
+    @property
+    def done(self) -> bool:
+        return self.index >= len(self.nodes)
+
+    def peek(self) -> Optional[DocNode]:
+        return None if self.done else self.nodes[self.index]
+
+    def next(self) -> DocNode:
+        if self.done:
+            raise StopIteration()
+        node = self.nodes[self.index]
+        self.index += 1
+        return node
+
+    def take_while(self, predicate: Callable[[DocNode], bool]) -> List[DocNode]:
+        out = []
+        while not self.done and predicate(self.nodes[self.index]):
+            out.append(self.next())
+        return out
+
+    def fork(self) -> "CopyingCursor":
+        f = CopyingCursor(self.nodes[self.index :], dict(self.front_matter))
+        return f
+
+
+def make_nodes(n: int) -> list[DocNode]:
+    nodes: list[DocNode] = []
+    i = 0
+    while len(nodes) < n:
+        nodes.append(Heading(level=2, text=f"Item {i}"))
+        nodes.append(Paragraph(text=f"description {i}"))
+        nodes.append(Table(headers=["key", "value"], rows=[["id", str(i)]]))
+        i += 1
+    return nodes[:n]
+
+
+def lookahead_model(cur) -> dict[str, str]:
+    """Fork into each section to read its body, then skip the body."""
+    out: dict[str, str] = {}
+    while not cur.done:
+        node = cur.next()
+        if not isinstance(node, Heading):
+            continue
+        body = cur.fork()
+        paras = body.take_while(lambda n: isinstance(n, Paragraph))
+        out[node.text] = "\n\n".join(p.text for p in paras)
+        cur.take_while(lambda n: not isinstance(n, Heading))
+    return out
+
+
+def section_model(cur: NodeCursor) -> dict[str, str]:
+    """The same model written with `seek_heading` / `section`."""
+    out: dict[str, str] = {}
+    while cur.seek_heading(level=2) is not None:
+        sec = cur.section()
+        heading = sec.expect(Heading)
+        out[heading.text] = sec.collect_paragraph_text()
+    return out
+
+
+def _time(fn) -> tuple[float, object]:
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--nodes", type=int, default=100_000)
+    args = ap.parse_args()
+
+    nodes = make_nodes(args.nodes)
+    rows = [
+        ("copying fork", lambda: lookahead_model(CopyingCursor(nodes))),
+        ("view fork", lambda: lookahead_model(NodeCursor(nodes))),
+        ("view section", lambda: section_model(NodeCursor(nodes))),
+    ]
+    expected = None
+    for name, fn in rows:
+        elapsed, result = _time(fn)
+        if expected is None:
+            expected = result
+        assert result == expected, name
+        print(f"{name:>13}: {elapsed * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
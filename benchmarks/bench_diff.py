@@ -0,0 +1,78 @@
+"""Node-level diff of large documents with a few scattered edits.
+
+Parses a generated spec, applies ``--edits`` random edits (replaced
+paragraphs, inserted/deleted nodes and changed table cells) spread over the
+whole document, and times `diff_documents` against `difflib.SequenceMatcher`
+over the same node keys.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_diff.py --nodes 100000 --edits 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import random
+import time
+
+from corpus import generate_spec
+
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_diff import diff_documents, node_key
+from mddocs.domain.doc_ir import Document, Paragraph, Table, copy_node
+
+
+def _edited(doc: Document, n_edits: int, seed: int) -> Document:
+    rng = random.Random(seed)
+    nodes = [copy_node(n) for n in doc.nodes]
+    for i in range(n_edits):
+        pos = rng.randrange(len(nodes))
+        kind = rng.choice(["paragraph", "insert", "delete", "cell"])
+        if kind == "cell":
+            tables = [k for k, n in enumerate(nodes) if isinstance(n, Table)]
+            table = nodes[rng.choice(tables)]
+            assert isinstance(table, Table)
+            table.rows[rng.randrange(len(table.rows))][0] = f"edited {i}"
+        elif kind == "paragraph":
+            nodes[pos] = Paragraph(f"edited {i}")
+        elif kind == "insert":
+            nodes.insert(pos, Paragraph(f"inserted {i}"))
+        else:
+            del nodes[pos]
+    return Document(dict(doc.front_matter), nodes)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--nodes", type=int, default=100_000)
+    ap.add_argument("--edits", type=int, default=10)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    # generate_spec yields roughly one node per 7 lines
+    old = MarkdownParserImpl().parse(generate_spec(args.nodes * 7, args.seed))
+    new = _edited(old, args.edits, args.seed)
+    print(f"{len(old.nodes)} -> {len(new.nodes)} nodes, {args.edits} edits")
+
+    t0 = time.perf_counter()
+    diff = diff_documents(old, new)
+    elapsed = time.perf_counter() - t0
+    cells = sum(len(e.table.cells) for e in diff.edits if e.table is not None)
+    print(
+        f"   diff_documents: {elapsed * 1000:9.2f} ms "
+        f"({len(diff.edits)} edits, {cells} cell changes)"
+    )
+
+    t0 = time.perf_counter()
+    a = [node_key(n) for n in old.nodes]
+    b = [node_key(n) for n in new.nodes]
+    ops = difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+    elapsed = time.perf_counter() - t0
+    changed = sum(1 for op in ops if op[0] != "equal")
+    print(f"   SequenceMatcher: {elapsed * 1000:9.2f} ms ({changed} edits)")
+
+
+if __name__ == "__main__":
+    main()
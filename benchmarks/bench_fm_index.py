@@ -0,0 +1,96 @@
+"""Front-matter index over a large corpus: build, refresh and query latency.
+
+Writes ``--files`` small generated specs (with varying ``status`` / ``owner``
+front matter), then reports:
+
+- the initial `FrontMatterIndex.update` (reads every file's head),
+- opening the index again and refreshing it with no changes (stat only),
+- a refresh after touching ``--changed`` files,
+- equality and prefix query latency.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_fm_index.py --files 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.front_matter_index import FrontMatterIndex
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+
+_STATUSES = ("draft", "review", "done", "draft-v2")
+
+
+def _write_corpus(root: Path, n: int) -> list[Path]:
+    paths = []
+    for i in range(n):
+        d = root / f"{i // 1000:03d}"
+        if i % 1000 == 0:
+            d.mkdir()
+        p = d / f"{i:06d}.md"
+        p.write_text(
+            f"<!--\ntitle: doc {i}\nstatus: {_STATUSES[i % 4]}\n"
+            f"owner: user{i % 97}\n-->\n\n# doc {i}\n\nbody text\n",
+            encoding="utf-8",
+        )
+        paths.append(p)
+    return paths
+
+
+def _ms(t0: float) -> str:
+    return f"{(time.perf_counter() - t0) * 1000:9.1f} ms"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--files", type=int, default=100_000)
+    ap.add_argument("--changed", type=int, default=100)
+    args = ap.parse_args()
+
+    loader = ConvertFileUsecase(
+        MarkdownParserImpl(), None, FileStorage()
+    ).load_front_matter
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "docs"
+        root.mkdir()
+        paths = _write_corpus(root, args.files)
+        db = Path(tmp) / "fm.db"
+
+        t0 = time.perf_counter()
+        with FrontMatterIndex(db, root, loader) as index:
+            index.update()
+        print(f"{'initial build':>16}: {_ms(t0)}")
+
+        t0 = time.perf_counter()
+        index = FrontMatterIndex(db, root, loader)
+        print(f"{'open':>16}: {_ms(t0)}")
+        t0 = time.perf_counter()
+        result = index.update()
+        assert result.unchanged == args.files
+        print(f"{'refresh (none)':>16}: {_ms(t0)}")
+
+        for p in paths[:: max(1, args.files // args.changed)][: args.changed]:
+            os.utime(p, ns=(1, 1))
+        t0 = time.perf_counter()
+        result = index.update()
+        print(f"{'refresh (' + str(result.updated) + ')':>16}: {_ms(t0)}")
+
+        t0 = time.perf_counter()
+        hits = index.find("owner", "user42")
+        print(f"{'find':>16}: {_ms(t0)} ({len(hits)} hits)")
+        t0 = time.perf_counter()
+        hits = index.find_prefix("status", "draft")
+        print(f"{'find_prefix':>16}: {_ms(t0)} ({len(hits)} hits)")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Listing front matter of a corpus: full load vs. `load_front_matter`.
+
+Writes ``--files`` generated specs, then collects every file's front matter
+once through `load_document` (read + parse the whole file) and once through
+`load_front_matter` (read the head only). Bytes read are counted by a
+`FileStorage` subclass.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_front_matter.py --files 5000 --lines 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import generate_spec
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+
+
+class CountingStorage(FileStorage):
+    def __init__(self) -> None:
+        self.bytes_read = 0
+
+    def read(self, path: Path) -> str:
+        text = super().read(path)
+        self.bytes_read += len(text.encode("utf-8"))
+        return text
+
+    def read_head(self, path: Path, size: int) -> tuple[str, bool]:
+        head, at_eof = super().read_head(path, size)
+        self.bytes_read += len(head.encode("utf-8"))
+        return head, at_eof
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--files", type=int, default=5_000)
+    ap.add_argument("--lines", type=int, default=1_000, help="lines per file")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(args.files):
+            p = Path(tmp) / f"{i:05d}.md"
+            p.write_text(generate_spec(args.lines, seed=i), encoding="utf-8")
+            paths.append(p)
+
+        results = []
+        for name in ("load_document", "load_front_matter"):
+            storage = CountingStorage()
+            uc = ConvertFileUsecase(MarkdownParserImpl(), None, storage)
+            if name == "load_document":
+
+                def load(p: Path, uc: ConvertFileUsecase = uc) -> dict:
+                    return uc.load_document(p).front_matter
+            else:
+                load = uc.load_front_matter
+            t0 = time.perf_counter()
+            results.append([load(p) for p in paths])
+            elapsed = time.perf_counter() - t0
+            print(
+                f"{name:>17}: {elapsed:7.3f}s, "
+                f"{storage.bytes_read / args.files / 1024:8.1f} KiB/file"
+            )
+        assert results[0] == results[1]
+
+
+if __name__ == "__main__":
+    main()
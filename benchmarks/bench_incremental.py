@@ -0,0 +1,87 @@
+"""Edit latency on a large document: full `parse_with_source` vs. `reparse`.
+
+Generates a spec of about ``--size`` MiB and applies ``--edits`` random
+keystroke-like edits (typing a character, deleting one, breaking a line,
+pasting a short block) at random positions. Each edit is parsed both ways;
+the incremental result is checked against the full parse and the per-edit
+latencies are reported (median, 95th percentile, max).
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_incremental.py --size 1 --edits 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+from corpus import generate_spec
+
+from mddocs.adapters.markdown_parser import MarkdownParseError, MarkdownParserImpl
+
+_PASTES = ["\n\nnew paragraph\n\n", "\n- item\n", "\n\n| a | b |\n| - | - |\n"]
+
+
+def _edit(rng: random.Random, text: str) -> tuple[int, int, str]:
+    offset = rng.randrange(len(text))
+    kind = rng.random()
+    if kind < 0.6:
+        return offset, 0, rng.choice("abcxyz ")
+    if kind < 0.8:
+        return offset, 1, ""
+    if kind < 0.9:
+        return offset, 0, "\n"
+    return offset, 0, rng.choice(_PASTES)
+
+
+def _summary(label: str, samples: list[float]) -> str:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"{label:>12}: median {statistics.median(ordered) * 1000:8.3f} ms"
+        f"  p95 {p95 * 1000:8.3f} ms  max {ordered[-1] * 1000:8.3f} ms"
+    )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--size", type=float, default=1.0, help="document size in MiB")
+    ap.add_argument("--edits", type=int, default=200)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    text = generate_spec(int(args.size * 1024 * 1024 / 40), seed=args.seed)
+    parser = MarkdownParserImpl()
+    doc = parser.parse_with_source(text)
+    print(f"document: {len(text) / 1024:.0f} KiB, {len(doc.nodes)} nodes")
+
+    rng = random.Random(args.seed)
+    full: list[float] = []
+    incremental: list[float] = []
+    while len(full) < args.edits:
+        assert doc.source is not None
+        text = doc.source.text
+        offset, removed, inserted = _edit(rng, text)
+        new_text = text[:offset] + inserted + text[offset + removed :]
+        t0 = time.perf_counter()
+        try:
+            expected = parser.parse_with_source(new_text)
+        except MarkdownParseError:
+            continue  # e.g. a heading marker left without text
+        t1 = time.perf_counter()
+        new = parser.reparse(doc, offset, removed, inserted)
+        t2 = time.perf_counter()
+        assert new == expected and new.source == expected.source
+        full.append(t1 - t0)
+        incremental.append(t2 - t1)
+        doc = new
+
+    print(_summary("full parse", full))
+    print(_summary("reparse", incremental))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Many `DocumentInspector` queries against one large document.
+
+Compares the indexed inspector with the previous linear scans (kept here as
+`LinearInspector`) for a mix of ``find_heading`` / ``first_heading`` /
+``tables`` / ``bullet_list_after`` calls, as extraction code issues them.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_inspector.py --lines 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from corpus import generate_spec
+
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_ir import BulletList, DocNode, Heading, Table
+from mddocs.domain.document_inspector import DocumentInspector
+
+
+class LinearInspector:
+    """The pre-index implementation: every query scans all nodes."""
+
+    def __init__(self, nodes: list[DocNode]):
+        self.nodes = nodes
+
+    def find_heading(self, level: int) -> list[Heading]:
+        return [n for n in self.nodes if isinstance(n, Heading) and n.level == level]
+
+    def first_heading(self, level: int) -> Heading | None:
+        for n in self.nodes:
+            if isinstance(n, Heading) and n.level == level:
+                return n
+        return None
+
+    def tables(self) -> list[Table]:
+        return [n for n in self.nodes if isinstance(n, Table)]
+
+    def bullet_list_after(self, heading_text: str, level: int) -> list[str]:
+        for i, n in enumerate(self.nodes):
+            if (
+                isinstance(n, Heading)
+                and n.level == level
+                and n.text == heading_text
+                and i + 1 < len(self.nodes)
+                and isinstance(self.nodes[i + 1], BulletList)
+            ):
+                return self.nodes[i + 1].items  # type: ignore[union-attr]
+        return []
+
+
+def _run(inspector, queries) -> list:
+    out = []
+    for op, arg in queries:
+        if op == 0:
+            out.append(inspector.find_heading(arg))
+        elif op == 1:
+            out.append(inspector.first_heading(arg))
+        elif op == 2:
+            out.append(inspector.tables())
+        else:
+            out.append(inspector.bullet_list_after(arg, 2))
+    return out
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--lines", type=int, default=50_000)
+    ap.add_argument("--queries", type=int, default=200)
+    args = ap.parse_args()
+
+    nodes = MarkdownParserImpl().parse(generate_spec(args.lines)).nodes
+    headings = [n.text for n in nodes if isinstance(n, Heading)]
+    rng = random.Random(0)
+    queries: list[tuple[int, object]] = []
+    for _ in range(args.queries):
+        op = rng.randrange(4)
+        arg = rng.choice(headings) if op == 3 else rng.randint(1, 3)
+        queries.append((op, arg))
+
+    results = {}
+    for name, cls in (("linear", LinearInspector), ("indexed", DocumentInspector)):
+        t0 = time.perf_counter()
+        results[name] = _run(cls(nodes), queries)
+        elapsed = time.perf_counter() - t0
+        print(
+            f"{name:>8}: {elapsed * 1000:8.2f} ms for {len(queries)} queries "
+            f"on {len(nodes)} nodes (including index build)"
+        )
+    assert results["linear"] == results["indexed"]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Warm on-disk IR cache vs. full parse over a synthetic corpus.
+
+Writes ``--files`` generated documents to a temporary directory, then loads
+every file (read + parse) three ways: plain `MarkdownParserImpl`, a cold
+`DiskCachedParser` (parse + store) and a warm one in a fresh instance, as a
+new process would see it.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_ir_cache.py --files 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import generate_spec
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.ir_cache import DiskCachedParser
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+
+
+def _load_all(paths, storage, parser) -> float:
+    t0 = time.perf_counter()
+    for p in paths:
+        parser.parse(storage.read(p))
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--files", type=int, default=10_000)
+    ap.add_argument("--lines", type=int, default=200, help="lines per file")
+    args = ap.parse_args()
+
+    storage = FileStorage()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        docs = root / "docs"
+        docs.mkdir()
+        paths = []
+        for i in range(args.files):
+            p = docs / f"{i:05d}.md"
+            p.write_text(generate_spec(args.lines, seed=i), encoding="utf-8")
+            paths.append(p)
+        n_bytes = sum(p.stat().st_size for p in paths)
+        print(f"corpus: {args.files} files, {n_bytes / 1e6:.1f} MB")
+
+        results = {
+            "full parse": _load_all(paths, storage, MarkdownParserImpl()),
+            "cold cache": _load_all(paths, storage, DiskCachedParser(root / "cache")),
+        }
+        warm = DiskCachedParser(root / "cache")
+        results["warm cache"] = _load_all(paths, storage, warm)
+        assert warm.misses == 0
+
+        for name, elapsed in results.items():
+            print(f"{name:>11}: {elapsed:.3f}s ({args.files / elapsed:,.0f} files/sec)")
+        print(f"{'speedup':>11}: {results['full parse'] / results['warm cache']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Retained memory of the parsed IR, per node type and for a whole corpus.
+
+For every node type, the nodes of that type in the reference corpus are
+rendered back to Markdown and parsed again on their own while `tracemalloc`
+traces allocations; the memory still held afterwards (nodes, their lists and
+strings) divided by the node count is reported as bytes per node. The total
+is the retained memory of parsing the whole corpus.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_memory.py --lines 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from collections import defaultdict
+
+from corpus import generate_spec
+
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_ir import Document
+from mddocs.domain.ir_serializers import document_to_markdown
+
+
+def _retained(parse, text: str) -> tuple[Document, int]:
+    """Parse ``text`` and return the document with the bytes it retains."""
+    gc.collect()
+    tracemalloc.start()
+    doc = parse(text)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return doc, retained
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--lines", type=int, default=100_000)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    parse = MarkdownParserImpl().parse
+    text = generate_spec(args.lines, seed=args.seed)
+    doc, total = _retained(parse, text)
+
+    by_type: dict[type, list] = defaultdict(list)
+    for node in doc.nodes:
+        by_type[type(node)].append(node)
+
+    print(f"{'type':>12} {'nodes':>8} {'bytes/node':>11} {'total KiB':>10}")
+    for cls, nodes in sorted(by_type.items(), key=lambda kv: kv[0].__name__):
+        part, retained = _retained(
+            parse, document_to_markdown(Document(front_matter={}, nodes=nodes))
+        )
+        count = len(part.nodes)
+        print(
+            f"{cls.__name__:>12} {count:>8} {retained / count:>11.1f} "
+            f"{retained / 1024:>10.1f}"
+        )
+    print(
+        f"{'corpus':>12} {len(doc.nodes):>8} {total / len(doc.nodes):>11.1f} "
+        f"{total / 1024:>10.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
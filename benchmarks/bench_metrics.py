@@ -0,0 +1,73 @@
+"""Overhead of per-stage metrics: `ConvertFileUsecase` with and without a collector.
+
+Loads and saves the same generated spec ``--n`` times through `FileStorage`,
+once with ``metrics=None`` and once with a `MetricsAggregator` injected into
+both the usecase and the renderer, and prints the per-stage report.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_metrics.py --n 200 --lines 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import generate_spec
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_adapter import MarkdownRendererAdapter
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+from mddocs.usecase.metrics import MetricsAggregator
+
+
+class NodesModel(DocConvertible):
+    def __init__(self, nodes, front_matter):
+        self.nodes = nodes
+        self.front_matter = front_matter
+
+    @classmethod
+    def from_nodes(cls, nodes, front_matter=None):
+        return cls(nodes, front_matter or {})
+
+    def to_nodes(self):
+        return self.nodes
+
+    def to_front_matter(self):
+        return self.front_matter
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--n", type=int, default=200)
+    ap.add_argument("--lines", type=int, default=2_000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "src.md"
+        dst = Path(tmp) / "dst.md"
+        src.write_text(generate_spec(args.lines, seed=0), encoding="utf-8")
+        agg = MetricsAggregator()
+        for name, metrics in (("metrics=None", None), ("aggregator", agg)):
+            uc = ConvertFileUsecase(
+                MarkdownParserImpl(),
+                MarkdownRendererAdapter(metrics=metrics),
+                FileStorage(),
+                metrics=metrics,
+            )
+            t0 = time.perf_counter()
+            for _ in range(args.n):
+                uc.save_model_to_path(uc.load_model_from_path(src, NodesModel), dst)
+            elapsed = time.perf_counter() - t0
+            print(f"{name:>14}: {elapsed / args.n * 1000:8.3f} ms/roundtrip")
+        print()
+        print(agg.report())
+
+
+if __name__ == "__main__":
+    main()
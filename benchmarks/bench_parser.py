@@ -0,0 +1,65 @@
+"""Parser throughput benchmark (lines/sec).
+
+Compares the single-pass `MarkdownParserImpl` (text and UTF-8 bytes entry
+points) against the original `ReferenceMarkdownParserImpl` on a generated
+spec document.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_parser.py --lines 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from corpus import generate_spec
+
+from mddocs.adapters.markdown_parser import (
+    MarkdownParserImpl,
+    ReferenceMarkdownParserImpl,
+)
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--lines", type=int, default=50_000)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    text = generate_spec(args.lines, seed=args.seed)
+    n_lines = len(text.splitlines())
+    parsers = {
+        "reference": ReferenceMarkdownParserImpl(),
+        "single-pass": MarkdownParserImpl(),
+    }
+    data = text.encode("utf-8")
+    runs = {
+        "reference": lambda: parsers["reference"].parse(text),
+        "single-pass": lambda: parsers["single-pass"].parse(text),
+        "bytes": lambda: parsers["single-pass"].parse_bytes(data),
+    }
+    expected = runs["reference"]()
+    assert all(run() == expected for run in runs.values())
+
+    results = {}
+    for name, run in runs.items():
+        elapsed = _best_of(run, args.repeat)
+        results[name] = elapsed
+        print(f"{name:>12}: {n_lines / elapsed:>12,.0f} lines/sec ({elapsed:.4f}s)")
+    print(f"{'speedup':>12}: {results['reference'] / results['single-pass']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Save latency: mdformat pass vs. the canonical renderer vs. memoized blocks.
+
+Renders a parsed generated spec with `MarkdownRendererAdapter` in each mode
+and writes it with `FileStorage`, i.e. the work `save_model_to_path` does
+after `to_nodes()`. The ``memoized`` row uses a `FormattingCache` and edits
+one table cell before every save (the cache is warmed by one initial save).
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_render.py --lines 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import generate_spec
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_adapter import MarkdownRendererAdapter
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.adapters.markdown_renderer import FormattingCache
+from mddocs.domain.doc_ir import Table
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--lines", type=int, default=5_000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    doc = MarkdownParserImpl().parse(generate_spec(args.lines))
+    storage = FileStorage()
+    outputs = {}
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp) / "out.md"
+        for mode in ("mdformat", "canonical"):
+            renderer = MarkdownRendererAdapter(mode=mode)
+            best = float("inf")
+            for _ in range(args.repeat):
+                t0 = time.perf_counter()
+                text = renderer.render(doc)
+                storage.write(out, text)
+                best = min(best, time.perf_counter() - t0)
+            outputs[mode] = text
+            timings[mode] = best
+            print(f"{mode:>10}: {best * 1000:8.2f} ms per save")
+
+        renderer = MarkdownRendererAdapter(cache=FormattingCache())
+        renderer.render(doc)
+        table = next(n for n in doc.nodes if isinstance(n, Table))
+        best = float("inf")
+        for i in range(args.repeat):
+            table.rows[0][-1] = f"edit {i}"
+            t0 = time.perf_counter()
+            text = renderer.render(doc)
+            storage.write(out, text)
+            best = min(best, time.perf_counter() - t0)
+        timings["memoized"] = best
+        print(f"{'memoized':>10}: {best * 1000:8.2f} ms per save")
+        assert text == MarkdownRendererAdapter().render(doc)
+    assert outputs["mdformat"] == outputs["canonical"]
+    for mode in ("canonical", "memoized"):
+        print(f"{mode:>10}: {timings['mdformat'] / timings[mode]:.1f}x vs mdformat")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Loading many models: hand-written `from_cursor` vs. a compiled `DocSchema`.
+
+Both models read the same fields (title, summary paragraphs, a key/value
+table and a bullet list) from the parsed nodes of many small documents. The
+hand-written model is the usual `NodeCursor` walk; the schema model runs its
+compiled plan. The best of ``--repeat`` runs is reported.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_schema.py --docs 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_cursor import NodeCursor
+from mddocs.domain.doc_ir import BulletList, Heading
+from mddocs.domain.doc_schema import (
+    DocSchema,
+    FrontMatter,
+    Items,
+    KeyValueTable,
+    Text,
+    Title,
+)
+
+
+class HandWritten(DocConvertible):
+    def __init__(self, title, summary, params, tags, author):
+        self.title = title
+        self.summary = summary
+        self.params = params
+        self.tags = tags
+        self.author = author
+
+    @classmethod
+    def from_cursor(cls, cur: NodeCursor):
+        title = cur.expect(Heading).text
+        summary = params = tags = None
+        while not cur.done:
+            node = cur.next()
+            if not isinstance(node, Heading) or node.level != 2:
+                continue
+            if node.text == "Summary":
+                summary = cur.collect_paragraph_text()
+            elif node.text == "Parameters":
+                params = cur.parse_table_as_dict()
+            elif node.text == "Tags":
+                tags = list(cur.expect(BulletList).items)
+        return cls(title, summary, params, tags, cur.front_matter.get("author"))
+
+    def to_nodes(self):
+        return []
+
+
+class Schema(DocSchema):
+    title = Title()
+    summary = Text("Summary")
+    params = KeyValueTable("Parameters")
+    tags = Items("Tags")
+    author = FrontMatter("author")
+
+
+def _doc(i: int) -> str:
+    rows = "\n".join(f"| p{j} | value {j} |" for j in range(8))
+    return (
+        f"<!--\nauthor: user{i}\n-->\n\n# endpoint {i}\n\n## Summary\n\n"
+        f"First paragraph {i}.\n\nSecond paragraph.\n\n## Parameters\n\n"
+        f"| key | value |\n| - | - |\n{rows}\n\n## Tags\n\n- a\n- b\n\n"
+        "## Notes\n\nTrailing section the models do not read.\n"
+    )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--docs", type=int, default=20_000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    parse = MarkdownParserImpl().parse
+    docs = [parse(_doc(i)) for i in range(args.docs)]
+    for name, cls in (("from_cursor", HandWritten), ("DocSchema", Schema)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            models = [cls.from_nodes(d.nodes, d.front_matter) for d in docs]
+            best = min(best, time.perf_counter() - t0)
+            assert models[-1].params["p7"] == "value 7"
+            del models
+        elapsed = best
+        print(
+            f"{name:>12}: {elapsed * 1000:8.1f} ms "
+            f"({args.docs / elapsed:,.0f} models/sec)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Saving after a one-node edit: full re-render vs. ``preserve_source=True``.
+
+Writes a generated spec of ``--lines`` lines, loads it, replaces one node
+and saves it once with the default full render (mdformat over the whole
+document) and once splicing only the changed node into the original text.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_splice.py --lines 20000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import generate_spec
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_adapter import MarkdownRendererAdapter
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_ir import Paragraph
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+
+
+class NodesModel(DocConvertible):
+    def __init__(self, nodes, front_matter):
+        self.nodes = nodes
+        self.front_matter = front_matter
+
+    @classmethod
+    def from_nodes(cls, nodes, front_matter=None):
+        return cls(list(nodes), dict(front_matter or {}))
+
+    def to_nodes(self):
+        return self.nodes
+
+    def to_front_matter(self):
+        return self.front_matter
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--lines", type=int, default=20_000)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    uc = ConvertFileUsecase(
+        MarkdownParserImpl(), MarkdownRendererAdapter(), FileStorage()
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "spec.md"
+        original = generate_spec(args.lines, seed=0)
+        for preserve in (False, True):
+            best = float("inf")
+            for i in range(args.repeat):
+                path.write_text(original, encoding="utf-8")
+                model = uc.load_model_from_path(path, NodesModel)
+                model.nodes[len(model.nodes) // 2] = Paragraph(f"edited {i}")
+                t0 = time.perf_counter()
+                uc.save_model_to_path(model, path, preserve_source=preserve)
+                best = min(best, time.perf_counter() - t0)
+            size = path.stat().st_size
+            label = "preserve_source" if preserve else "full render"
+            print(f"{label:>16}: {best * 1000:9.2f} ms ({size / 1024:.0f} KiB written)")
+
+
+if __name__ == "__main__":
+    main()
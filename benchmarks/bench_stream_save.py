@@ -0,0 +1,76 @@
+"""Peak memory of a save: `render` + `Storage.write` vs. streaming `render_to`.
+
+Parses a generated spec once, then saves it in each renderer mode and reports
+the `tracemalloc` peak of the save alone (the parsed document is allocated
+before tracing starts) together with the wall time.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_stream_save.py --lines 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from corpus import generate_spec
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_adapter import MarkdownRendererAdapter
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_ir import Document
+
+
+def _measure(fn) -> tuple[float, int]:
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--lines", type=int, default=20_000)
+    args = ap.parse_args()
+
+    doc = MarkdownParserImpl().parse(generate_spec(args.lines))
+    storage = FileStorage()
+    with tempfile.TemporaryDirectory() as tmp:
+        whole_path = Path(tmp) / "whole.md"
+        stream_path = Path(tmp) / "stream.md"
+        for mode in ("mdformat", "canonical"):
+            renderer = MarkdownRendererAdapter(mode=mode)
+
+            def whole(
+                renderer: MarkdownRendererAdapter = renderer,
+                doc: Document = doc,
+                path: Path = whole_path,
+            ) -> None:
+                storage.write(path, renderer.render(doc))
+
+            def streamed(
+                renderer: MarkdownRendererAdapter = renderer,
+                doc: Document = doc,
+                path: Path = stream_path,
+            ) -> None:
+                with storage.open_write(path) as fp:
+                    renderer.render_to(doc, fp)
+
+            for name, fn in (("render+write", whole), ("render_to", streamed)):
+                elapsed, peak = _measure(fn)
+                print(
+                    f"{mode:>10} {name:>13}: {elapsed * 1000:9.1f} ms, "
+                    f"peak {peak / 1024:9.1f} KiB"
+                )
+            assert whole_path.read_bytes() == stream_path.read_bytes()
+
+
+if __name__ == "__main__":
+    main()
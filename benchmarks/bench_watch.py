@@ -0,0 +1,93 @@
+"""Watch-mode reload latency vs. corpus size and number of changed files.
+
+For each corpus size in ``--files`` a directory of generated specs is
+written and loaded once by `WatchModelsUsecase`. Then, for each count in
+``--changed``, that many files are rewritten and the time from the last
+write until `poll_once` returns their updates is measured (best of
+``--repeat``). With inotify the time should depend on the number of changed
+files only; with ``--watcher polling`` every poll also stats the whole tree.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/bench_watch.py --files 100 2000 --changed 1 10
+    PYTHONPATH=src python benchmarks/bench_watch.py --watcher polling
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import generate_spec
+
+from mddocs.adapters.dir_watcher import PollingWatcher, open_watcher
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+from mddocs.usecase.watch_usecase import WatchModelsUsecase
+
+
+class NodesModel(DocConvertible):
+    def __init__(self, nodes, front_matter):
+        self.nodes = nodes
+        self.front_matter = front_matter
+
+    @classmethod
+    def from_nodes(cls, nodes, front_matter=None):
+        return cls(list(nodes), dict(front_matter or {}))
+
+    def to_nodes(self):
+        return self.nodes
+
+
+def _run(root: Path, n_files: int, changed: list[int], args) -> None:
+    text = generate_spec(args.lines, seed=0)
+    paths = [root / f"d{i // 100:03d}" / f"spec{i}.md" for i in range(n_files)]
+    for p in paths:
+        p.parent.mkdir(exist_ok=True)
+        p.write_text(text, encoding="utf-8")
+    if args.watcher == "polling":
+        watcher = PollingWatcher(root, interval=0.005)
+    else:
+        watcher = open_watcher(root)
+    uc = ConvertFileUsecase(MarkdownParserImpl(), None, FileStorage())
+    service = WatchModelsUsecase(uc, watcher, NodesModel, debounce=args.debounce)
+    with watcher:
+        service.load_all()
+        for k in changed:
+            best = float("inf")
+            for r in range(args.repeat):
+                for i, p in enumerate(paths[:k]):
+                    p.write_text(text + f"\nedit {r} {i}\n", encoding="utf-8")
+                t0 = time.perf_counter()
+                updates = []
+                while len(updates) < k:
+                    updates += service.poll_once(5.0)
+                best = min(best, time.perf_counter() - t0)
+            print(
+                f"{type(watcher).__name__:>14} files={n_files:>6} changed={k:>4}: "
+                f"{best * 1000:8.1f} ms ({(best - args.debounce) * 1000 / k:6.2f} ms"
+                " per file after the debounce)"
+            )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--files", type=int, nargs="+", default=[100, 2000])
+    ap.add_argument("--changed", type=int, nargs="+", default=[1, 10, 50])
+    ap.add_argument("--lines", type=int, default=200, help="lines per file")
+    ap.add_argument("--watcher", choices=("auto", "polling"), default="auto")
+    ap.add_argument("--debounce", type=float, default=0.02)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    for n_files in args.files:
+        with tempfile.TemporaryDirectory() as tmp:
+            _run(Path(tmp), n_files, [k for k in args.changed if k <= n_files], args)
+
+
+if __name__ == "__main__":
+    main()
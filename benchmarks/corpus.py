@@ -0,0 +1,134 @@
+"""Seedable synthetic Markdown generators shared by the benchmarks.
+
+All generators are deterministic for a given ``seed`` so that results from
+different runs (and different parser implementations) are comparable.
+"""
+
+from __future__ import annotations
+
+import random
+
+_WORDS = (
+    "alpha beta gamma delta epsilon zeta eta theta iota kappa lambda mu "
+    "仕様 設計 要件 表 見出し 段落"
+).split()
+
+
+def _sentence(rng: random.Random, n_words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(n_words))
+
+
+def generate_spec(n_lines: int, seed: int = 0) -> str:
+    """Return a "generated spec"-like document of roughly ``n_lines`` lines.
+
+    The mix of blocks (headings, paragraphs, lists, tables, images) resembles
+    the table-heavy specs the parser is used for in practice.
+    """
+    rng = random.Random(seed)
+    out: list[str] = ["<!--", "title: generated", "status: draft", "-->", ""]
+    section = 0
+    while len(out) < n_lines:
+        section += 1
+        out.append(f"## Section {section}")
+        out.append("")
+        for _ in range(rng.randint(1, 3)):
+            out.append(_sentence(rng, rng.randint(5, 15)))
+        out.append("")
+        r = rng.random()
+        if r < 0.5:
+            n_cols = rng.randint(2, 5)
+            out.append("| " + " | ".join(f"h{c}" for c in range(n_cols)) + " |")
+            out.append("| " + " | ".join(["----"] * n_cols) + " |")
+            for row in range(rng.randint(5, 40)):
+                out.append(
+                    "| "
+                    + " | ".join(f"{_sentence(rng, 2)} {row}" for _ in range(n_cols))
+                    + " |"
+                )
+        elif r < 0.7:
+            for _ in range(rng.randint(2, 8)):
+                out.append(f"- {_sentence(rng, 4)}")
+        elif r < 0.9:
+            for i in range(rng.randint(2, 8)):
+                out.append(f"{i + 1}. {_sentence(rng, 4)}")
+        else:
+            out.append(f"![{_sentence(rng, 2)}](img/{section}.png)")
+        out.append("")
+    return "\n".join(out) + "\n"
+
+
+def generate_huge_table(n_rows: int, n_cols: int = 6, seed: int = 0) -> str:
+    """One table with ``n_rows`` rows (a whole spec dumped as a single table)."""
+    rng = random.Random(seed)
+    out = ["# Table", ""]
+    out.append("| " + " | ".join(f"h{c}" for c in range(n_cols)) + " |")
+    out.append("| " + " | ".join(["---"] * n_cols) + " |")
+    flags = ("yes", "no", "-", "")
+    for row in range(n_rows):
+        cells = [f"id{row}"]
+        for _ in range(n_cols - 1):
+            cells.append(rng.choice(flags) if rng.random() < 0.4 else _sentence(rng, 2))
+        out.append("| " + " | ".join(cells) + " |")
+    return "\n".join(out) + "\n"
+
+
+def generate_many_headings(n_headings: int, seed: int = 0) -> str:
+    """``n_headings`` nested headings (levels 1-6) with one short line each."""
+    rng = random.Random(seed)
+    out: list[str] = []
+    level = 1
+    for i in range(n_headings):
+        level = max(1, min(6, level + rng.choice((-2, -1, 0, 1, 1))))
+        out.append(f"{'#' * level} {_sentence(rng, 2)} {i}")
+        out.append("")
+        if rng.random() < 0.5:
+            out.append(_sentence(rng, 6))
+            out.append("")
+    return "\n".join(out) + "\n"
+
+
+def generate_long_paragraphs(
+    n_paragraphs: int, n_lines: int = 40, seed: int = 0
+) -> str:
+    """Paragraphs of ``n_lines`` wrapped lines each (prose-heavy documents)."""
+    rng = random.Random(seed)
+    out = ["# Prose", ""]
+    for _ in range(n_paragraphs):
+        for _ in range(n_lines):
+            out.append(_sentence(rng, rng.randint(8, 16)))
+        out.append("")
+    return "\n".join(out) + "\n"
+
+
+def generate_deep_front_matter(
+    n_keys: int, body_lines: int = 200, seed: int = 0
+) -> str:
+    """A front matter comment with ``n_keys`` entries followed by a short spec."""
+    rng = random.Random(seed)
+    out = ["<!--"]
+    for i in range(n_keys):
+        out.append(f"key{i}: {_sentence(rng, rng.randint(1, 6))}")
+    out.append("-->")
+    out.append("")
+    body = generate_spec(body_lines, seed=seed)
+    # Drop the body's own front matter (its first five lines).
+    return "\n".join(out) + "\n" + body.split("\n", 5)[5]
+
+
+# Named corpora of the benchmark suite: name -> (scale, seed) -> text. ``scale``
+# 1.0 gives documents of a few MB at most; every generator is deterministic.
+CORPORA = {
+    "spec": lambda scale, seed: generate_spec(int(20_000 * scale), seed),
+    "huge_table": lambda scale, seed: generate_huge_table(
+        int(20_000 * scale), seed=seed
+    ),
+    "many_headings": lambda scale, seed: generate_many_headings(
+        int(10_000 * scale), seed
+    ),
+    "long_paragraphs": lambda scale, seed: generate_long_paragraphs(
+        int(500 * scale), seed=seed
+    ),
+    "deep_front_matter": lambda scale, seed: generate_deep_front_matter(
+        int(5_000 * scale), seed=seed
+    ),
+}
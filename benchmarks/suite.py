@@ -0,0 +1,281 @@
+"""Benchmark suite: per-stage timings on synthetic corpora, with regression gates.
+
+For every corpus in `corpus.CORPORA` the suite times each stage separately
+(best of ``--repeat`` samples, each repeating the stage until it takes at
+least ``--min-time`` seconds; reported as seconds per call):
+
+- ``parse``: `MarkdownParserImpl.parse`
+- ``serialize``: `ir_serializers.document_to_markdown` (raw, unformatted)
+- ``mdformat``: the ``mdformat.text`` pass over the serialized text
+  (skipped when mdformat is not installed)
+- ``cursor_load``: a `NodeCursor`-based `from_cursor` model over the nodes
+- ``roundtrip``: `ConvertFileUsecase` load + save through `FileStorage`
+
+Results are written as JSON (``--out``, default stdout). With
+``--compare BASELINE.json`` every stage present in both runs is compared and
+the process exits with status 1 when one is slower than the baseline by more
+than ``--threshold`` (a fraction, 0.25 = 25 %). Each report also records the
+time of a fixed calibration workload; ``--normalize`` scales the baseline by
+the calibration ratio so that runs on a uniformly faster or slower machine
+(or a busy CI runner) can still be compared. Gates are only as good as the
+machine is quiet: compare runs from the same host and settings.
+
+Usage::
+
+    PYTHONPATH=src python benchmarks/suite.py --out baseline.json
+    PYTHONPATH=src python benchmarks/suite.py --compare baseline.json --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+from corpus import CORPORA
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_adapter import MarkdownRendererAdapter
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_cursor import NodeCursor
+from mddocs.domain.doc_ir import DocNode, Heading, Paragraph, Table
+from mddocs.domain.ir_serializers import document_to_markdown
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+
+try:
+    import mdformat
+except ImportError:  # pragma: no cover - optional dependency
+    mdformat = None
+
+STAGES = ("parse", "serialize", "mdformat", "cursor_load", "roundtrip")
+
+
+class OutlineModel(DocConvertible):
+    """Typical cursor-based model: section texts and table sizes by heading."""
+
+    def __init__(self, front_matter: dict, sections: dict, nodes: list[DocNode]):
+        self.front_matter = front_matter
+        self.sections = sections
+        self._nodes = nodes
+
+    @classmethod
+    def from_cursor(cls, cur: NodeCursor):
+        sections: dict[str, tuple[str, int]] = {}
+        title = ""
+        while not cur.done:
+            node = cur.peek()
+            if isinstance(node, Heading):
+                title = cur.expect(Heading).text
+            elif isinstance(node, Paragraph):
+                text = cur.collect_paragraph_text()
+                sections[title] = (text, sections.get(title, ("", 0))[1])
+            elif isinstance(node, Table):
+                rows = len(cur.expect(Table).rows)
+                sections[title] = (sections.get(title, ("", 0))[0], rows)
+            else:
+                cur.next()
+        return cls(cur.front_matter, sections, cur.view.to_list())
+
+    def to_nodes(self) -> list[DocNode]:
+        return self._nodes
+
+    def to_front_matter(self) -> dict:
+        return self.front_matter
+
+
+def _time_per_call(fn: Callable[[], object], repeat: int, min_time: float) -> float:
+    """Best per-call time of ``repeat`` samples, each at least ``min_time`` long.
+
+    Fast stages are called several times per sample (like `timeit.Timer.autorange`)
+    so that sub-millisecond stages are not dominated by timer noise.
+    """
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()  # as `timeit` does: collector pauses are not part of a stage
+    try:
+        return _samples(fn, repeat, min_time)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _samples(fn: Callable[[], object], repeat: int, min_time: float) -> float:
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed * 10 >= min_time else 10
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - t0) / number)
+    return best
+
+
+def _calibration_workload() -> object:
+    """Fixed pure-Python work used to estimate the speed of the current machine."""
+    parts = {}
+    for i in range(20_000):
+        parts[f"k{i % 512}"] = str(i).split("0")
+    return sorted(parts)
+
+
+def _stages(
+    name: str, text: str, parser: MarkdownParserImpl, tmp: Path
+) -> dict[str, Callable[[], object]]:
+    """The stage callables for one corpus text."""
+    doc = parser.parse(text)
+    raw = document_to_markdown(doc)
+    src = tmp / f"{name}.md"
+    dst = tmp / f"{name}.out.md"
+    src.write_text(text, encoding="utf-8")
+    uc = ConvertFileUsecase(parser, MarkdownRendererAdapter(), FileStorage())
+
+    def roundtrip() -> object:
+        return uc.save_model_to_path(uc.load_model_from_path(src, OutlineModel), dst)
+
+    stages: dict[str, Callable[[], object]] = {
+        "parse": lambda: parser.parse(text),
+        "serialize": lambda: document_to_markdown(doc),
+        "cursor_load": lambda: OutlineModel.from_nodes(doc.nodes, doc.front_matter),
+        "roundtrip": roundtrip,
+    }
+    if mdformat is not None:
+        stages["mdformat"] = lambda: mdformat.text(raw)
+    return stages
+
+
+def run_suite(
+    corpora: list[str],
+    stages: list[str],
+    scale: float,
+    seed: int,
+    repeat: int,
+    min_time: float = 0.05,
+) -> dict:
+    """Run the selected stages on the selected corpora; return the JSON report.
+
+    Times are seconds per call of the stage.
+    """
+    parser = MarkdownParserImpl()
+    results: dict[str, dict[str, float]] = {}
+    calibration = _time_per_call(_calibration_workload, repeat, min_time)
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in corpora:
+            available = _stages(name, CORPORA[name](scale, seed), parser, Path(tmp))
+            results[name] = {
+                stage: _time_per_call(available[stage], repeat, min_time)
+                for stage in stages
+                if stage in available
+            }
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "mdformat": getattr(mdformat, "__version__", None),
+            "scale": scale,
+            "seed": seed,
+            "repeat": repeat,
+            "calibration": calibration,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: dict, baseline: dict, threshold: float, normalize: bool = False
+) -> list[tuple[str, str, float, float, bool]]:
+    """Return ``(corpus, stage, baseline_s, current_s, regressed)`` rows.
+
+    Only stages present in both reports are compared. A stage regresses when
+    it is slower than ``baseline * (1 + threshold)``. With ``normalize`` the
+    baseline times are first scaled by the ratio of the two runs' calibration
+    times, so a uniformly slower (or faster) machine does not count.
+    """
+    factor = 1.0
+    if normalize:
+        old_cal = baseline.get("meta", {}).get("calibration")
+        new_cal = current.get("meta", {}).get("calibration")
+        if old_cal and new_cal:
+            factor = new_cal / old_cal
+    rows = []
+    for name, timings in current["results"].items():
+        base = baseline.get("results", {}).get(name, {})
+        for stage, seconds in timings.items():
+            if stage in base:
+                old = base[stage] * factor
+                rows.append(
+                    (name, stage, old, seconds, seconds > old * (1 + threshold))
+                )
+    return rows
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--corpora", nargs="+", choices=sorted(CORPORA), default=None)
+    ap.add_argument("--stages", nargs="+", choices=STAGES, default=None)
+    ap.add_argument("--scale", type=float, default=0.25)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument(
+        "--min-time", type=float, default=0.05, help="minimum seconds per sample"
+    )
+    ap.add_argument("--out", type=Path, default=None, help="write JSON here")
+    ap.add_argument("--compare", type=Path, default=None, help="baseline JSON")
+    ap.add_argument("--threshold", type=float, default=0.25)
+    ap.add_argument(
+        "--normalize",
+        action="store_true",
+        help="scale the baseline by the calibration ratio of the two runs",
+    )
+    args = ap.parse_args()
+
+    report = run_suite(
+        args.corpora or list(CORPORA),
+        args.stages or list(STAGES),
+        args.scale,
+        args.seed,
+        args.repeat,
+        args.min_time,
+    )
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.out is not None:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    elif args.compare is None:
+        print(text)
+
+    if args.compare is None:
+        return 0
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+    if baseline.get("meta", {}).get("scale") != args.scale:
+        print(
+            "warning: baseline was recorded with a different --scale", file=sys.stderr
+        )
+    failed = False
+    for name, stage, old, new, regressed in compare(
+        report, baseline, args.threshold, args.normalize
+    ):
+        failed |= regressed
+        mark = "REGRESSED" if regressed else "ok"
+        print(
+            f"{name:>18} {stage:>12}: {old * 1000:9.2f} ms -> {new * 1000:9.2f} ms "
+            f"({new / old - 1:+7.1%}) {mark}"
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""Change notification for the Markdown files under a directory.
+
+Two `DirectoryWatcher` implementations:
+
+- `InotifyWatcher` uses Linux inotify (through `ctypes`, no extra dependency).
+  It watches every directory of the tree, so an idle tree costs nothing and
+  a change is reported with no scan. New directories are watched (and their
+  files reported) as they appear; on a queue overflow the tree is re-scanned
+  and every file is reported.
+- `PollingWatcher` re-scans the tree every ``interval`` seconds and compares
+  ``(mtime_ns, size, inode)`` stamps. It works on any platform and file
+  system, at the cost of one ``stat`` per file per scan.
+
+`open_watcher` returns an `InotifyWatcher` where inotify is usable and falls
+back to a `PollingWatcher` otherwise (not Linux, no ``inotify_init1`` in the
+C library, or the per-user watch limit reached).
+"""
+
+from __future__ import annotations
+
+import ctypes
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterator
+
+from mddocs.interfaces.protocols import DirectoryWatcher
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_ONLYDIR = 0x01000000
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_ONLYDIR
+)
+# struct inotify_event: int wd; uint32_t mask, cookie, len; char name[len]
+_EVENT = struct.Struct("iIII")
+_READ_SIZE = 1 << 16
+
+
+def _libc() -> ctypes.CDLL:
+    libc = ctypes.CDLL(None, use_errno=True)
+    if not hasattr(libc, "inotify_init1"):
+        raise OSError(errno.ENOSYS, "inotify is not available")
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    return libc
+
+
+class InotifyWatcher(DirectoryWatcher):
+    """inotify で ``root`` 以下（サブディレクトリを含む）の変更を受け取る `DirectoryWatcher`。
+
+    書き込みの完了（``IN_CLOSE_WRITE``）、rename による置き換え・移動、削除を
+    拡張子 ``suffix`` のファイルについて報告する。ディレクトリの追加・移動・削除では
+    その中のファイルをまとめて報告する。
+
+    Raises:
+        OSError: inotify が使えない、またはウォッチの上限に達した場合。
+    """
+
+    def __init__(self, root: str | Path, suffix: str = ".md"):
+        self.root = Path(root)
+        self.suffix = suffix
+        if not self.root.is_dir():
+            raise NotADirectoryError(errno.ENOTDIR, "not a directory", str(root))
+        self._libc = _libc()
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            e = ctypes.get_errno()
+            raise OSError(e, os.strerror(e))
+        self._fd = fd
+        self._dirs: dict[int, Path] = {}
+        self._wds: dict[Path, int] = {}
+        self._files: set[Path] = set()
+        try:
+            self._add_tree(self.root)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self) -> InotifyWatcher:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def files(self) -> list[Path]:
+        return sorted(self._files)
+
+    def _add_tree(self, directory: Path) -> set[Path]:
+        """``directory`` 以下のディレクトリをすべて監視に加え、中のファイルを返す。"""
+        found: set[Path] = set()
+        stack = [directory]
+        while stack:
+            d = stack.pop()
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(d), _WATCH_MASK)
+            if wd < 0:
+                e = ctypes.get_errno()
+                if e in (errno.ENOENT, errno.ENOTDIR) and d != self.root:
+                    continue  # removed again before we got to it
+                raise OSError(e, os.strerror(e), str(d))
+            self._dirs[wd] = d
+            self._wds[d] = wd
+            try:
+                with os.scandir(d) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(Path(entry.path))
+                        elif entry.name.endswith(self.suffix) and entry.is_file():
+                            found.add(Path(entry.path))
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        self._files |= found
+        return found
+
+    def _drop_tree(self, directory: Path) -> set[Path]:
+        """``directory`` 以下の監視を外し、そこにあったファイルを返す。"""
+        for d in [d for d in self._wds if d == directory or directory in d.parents]:
+            wd = self._wds.pop(d)
+            del self._dirs[wd]
+            # Fails with EINVAL when the directory is already gone; that is fine.
+            self._libc.inotify_rm_watch(self._fd, wd)
+        gone = {p for p in self._files if directory in p.parents}
+        self._files -= gone
+        return gone
+
+    def _resync(self) -> set[Path]:
+        """イベントを取りこぼした（キューあふれ）ときに監視を作り直す。"""
+        old = self._files
+        self._drop_tree(self.root)
+        self._files = set()
+        return old | self._add_tree(self.root)
+
+    def _read_events(self) -> set[Path]:
+        changed: set[Path] = set()
+        chunks = []
+        while True:
+            try:
+                chunk = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+        buf = b"".join(chunks)
+        pos = 0
+        while pos < len(buf):
+            wd, mask, _cookie, length = _EVENT.unpack_from(buf, pos)
+            name = buf[pos + _EVENT.size : pos + _EVENT.size + length].rstrip(b"\0")
+            pos += _EVENT.size + length
+            if mask & _IN_Q_OVERFLOW:
+                changed |= self._resync()
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & _IN_IGNORED:
+                # The watched directory itself was removed.
+                del self._dirs[wd]
+                self._wds.pop(directory, None)
+                continue
+            if not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    changed |= self._add_tree(path)
+                elif mask & (_IN_MOVED_FROM | _IN_DELETE):
+                    changed |= self._drop_tree(path)
+                continue
+            if not path.name.endswith(self.suffix):
+                continue
+            if mask & (_IN_MOVED_FROM | _IN_DELETE):
+                self._files.discard(path)
+                changed.add(path)
+            elif mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO):
+                self._files.add(path)
+                changed.add(path)
+        return changed
+
+    def poll(self, timeout: float | None = None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self._fd], [], [], wait)
+            if ready:
+                changed = self._read_events()
+                if changed:
+                    return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+
+
+class PollingWatcher(DirectoryWatcher):
+    """``root`` 以下を ``interval`` 秒ごとに走査し、スタンプの変化で変更を検出する `DirectoryWatcher`。
+
+    スタンプは ``(mtime_ns, size, inode)``。ファイルシステムの時刻の粒度内に
+    同じサイズで 2 度書き換えられた場合は 1 度の変更として見える。
+    """
+
+    def __init__(self, root: str | Path, suffix: str = ".md", interval: float = 1.0):
+        self.root = Path(root)
+        self.suffix = suffix
+        self.interval = interval
+        if not self.root.is_dir():
+            raise NotADirectoryError(errno.ENOTDIR, "not a directory", str(root))
+        self._stamps = dict(self._scan())
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> PollingWatcher:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def files(self) -> list[Path]:
+        return sorted(self.root / rel for rel in self._stamps)
+
+    def _scan(self) -> Iterator[tuple[str, tuple[int, int, int]]]:
+        """``root`` 以下の対象ファイルの相対パスとスタンプを返す。"""
+        stack = [(self.root, "")]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except (FileNotFoundError, NotADirectoryError):
+                continue  # removed during the scan
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((Path(entry.path), prefix + entry.name + "/"))
+                    elif entry.name.endswith(self.suffix) and entry.is_file():
+                        st = entry.stat()
+                        yield (
+                            prefix + entry.name,
+                            (st.st_mtime_ns, st.st_size, st.st_ino),
+                        )
+                except FileNotFoundError:
+                    continue
+
+    def _rescan(self) -> set[Path]:
+        old = self._stamps
+        new = dict(self._scan())
+        self._stamps = new
+        changed = {rel for rel, stamp in new.items() if old.get(rel) != stamp}
+        changed.update(old.keys() - new.keys())
+        return {self.root / rel for rel in changed}
+
+    def poll(self, timeout: float | None = None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self._rescan()
+            if changed:
+                return changed
+            wait = self.interval
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    return set()
+            time.sleep(wait)
+
+
+def open_watcher(
+    root: str | Path, suffix: str = ".md", interval: float = 1.0
+) -> InotifyWatcher | PollingWatcher:
+    """``root`` の `InotifyWatcher` を返す。inotify が使えなければ `PollingWatcher` を返す。"""
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root, suffix)
+        except NotADirectoryError:
+            raise
+        except OSError:
+            pass
+    return PollingWatcher(root, suffix, interval)
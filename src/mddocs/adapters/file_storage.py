@@ -5,17 +5,289 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import mmap
+import os
+import secrets
+from concurrent.futures import Executor
+from contextlib import contextmanager
 from pathlib import Path
-from mddocs.interfaces.protocols import Storage
+from typing import BinaryIO, Iterator, TextIO
 
+from mddocs.interfaces.protocols import (
+    AsyncStorage,
+    AtomicStorage,
+    ExactStorage,
+    HeadStorage,
+    MappedStorage,
+    StatStorage,
+    Storage,
+    StreamingStorage,
+)
 
-class FileStorage(Storage):
+# Buffer size of the streams returned by `FileStorage.open_write`.
+_WRITE_BUFFER = 1 << 16
+
+
+class _ReplaceWriter:
+    """`FileStorage.open_replace` の書き込み先。
+
+    ``skip_unchanged`` のときは書き込まれた内容を既存ファイルと先頭から突き合わせ、
+    一致している間は何も書かない。最初に食い違った時点で一時ファイルを作り、一致済みの
+    先頭部分を既存ファイルからコピーしてから書き込みを続ける。最後まで一致すれば
+    一時ファイルは作られず、ディスクへの書き込みは一切発生しない。
+    """
+
+    def __init__(self, path: Path, skip_unchanged: bool, newline: str | None = None):
+        self.path = path
+        self.written = False
+        self._translate = newline is None and os.linesep != "\n"
+        self._old: BinaryIO | None = None
+        self._matched = 0
+        self._tmp_path: Path | None = None
+        self._tmp: BinaryIO | None = None
+        if skip_unchanged:
+            try:
+                self._old = path.open("rb")
+            except FileNotFoundError:
+                pass
+
+    def write(self, s: str, /) -> int:
+        if self._translate:
+            # Same newline translation as the text-mode `FileStorage.write`.
+            data = s.replace("\n", os.linesep).encode("utf-8")
+        else:
+            data = s.encode("utf-8")
+        if self._tmp is None:
+            if self._old is not None and self._old.read(len(data)) == data:
+                self._matched += len(data)
+                return len(s)
+            self._start_temp()
+        assert self._tmp is not None
+        self._tmp.write(data)
+        return len(s)
+
+    def _start_temp(self) -> None:
+        tmp_path, fd = _create_temp(self.path)
+        self._tmp_path = tmp_path
+        self._tmp = os.fdopen(fd, "wb", buffering=_WRITE_BUFFER)
+        if self._old is not None and self._matched:
+            self._old.seek(0)
+            remaining = self._matched
+            while remaining:
+                block = self._old.read(min(remaining, _WRITE_BUFFER))
+                self._tmp.write(block)
+                remaining -= len(block)
+
+    def commit(self) -> None:
+        """内容を確定する。既存ファイルと同一なら何もしない。"""
+        if self._tmp is None:
+            if self._old is not None and self._old.read(1) == b"":
+                self._close_old()
+                return
+            self._start_temp()
+        assert self._tmp is not None and self._tmp_path is not None
+        self._tmp.flush()
+        os.fsync(self._tmp.fileno())
+        self._tmp.close()
+        _copy_mode(self.path, self._tmp_path)
+        self._close_old()
+        os.replace(self._tmp_path, self.path)
+        self._tmp_path = None
+        self.written = True
+        _fsync_dir(self.path.parent)
+
+    def discard(self) -> None:
+        """書きかけの一時ファイルを削除する（既存ファイルは変更しない）。"""
+        self._close_old()
+        if self._tmp is not None:
+            self._tmp.close()
+        if self._tmp_path is not None:
+            os.unlink(self._tmp_path)
+            self._tmp_path = None
+
+    def _close_old(self) -> None:
+        if self._old is not None:
+            self._old.close()
+            self._old = None
+
+
+def _create_temp(path: Path) -> tuple[Path, int]:
+    """``path`` と同じディレクトリに一時ファイルを排他的に作り、パスと fd を返す。"""
+    parent = path.parent
+    while True:
+        tmp_path = parent / f".{path.name}.{secrets.token_hex(4)}.tmp"
+        try:
+            # 0o666 so that new files get the usual umask-derived mode.
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            return tmp_path, fd
+        except FileExistsError:
+            continue
+
+
+def _copy_mode(path: Path, tmp_path: Path) -> None:
+    """既存ファイルがあれば、そのパーミッションを一時ファイルに移す。"""
+    try:
+        mode = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        return
+    os.chmod(tmp_path, mode)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """rename をディスクに反映させるためディレクトリを fsync する（POSIX のみ）。"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class FileStorage(
+    StatStorage, HeadStorage, StreamingStorage, AtomicStorage, ExactStorage
+):
     """ファイルに対する簡易的な読み書きアダプタ。"""
 
     def read(self, path: Path) -> str:
         with path.open("r", encoding="utf-8") as f:
             return f.read()
 
+    def read_exact(self, path: Path) -> str:
+        """改行コード（``\r\n`` など）を変換せずに読む。"""
+        with path.open("r", encoding="utf-8", newline="") as f:
+            return f.read()
+
     def write(self, path: Path, content: str) -> None:
         with path.open("w", encoding="utf-8") as f:
             f.write(content)
+
+    def read_head(self, path: Path, size: int) -> tuple[str, bool]:
+        """先頭から最大 ``size`` バイトを読み、``(text, at_eof)`` を返す。"""
+        with path.open("rb") as f:
+            data = f.read(size + 1)
+        if len(data) <= size:
+            return str(data, "utf-8"), True
+        # Drop a multi-byte character cut at the boundary (kept by the decoder).
+        return codecs.getincrementaldecoder("utf-8")().decode(data[:size]), False
+
+    @contextmanager
+    def open_write(self, path: Path) -> Iterator[TextIO]:
+        """``path`` へ書き込むバッファ付きのテキストストリームを返す。
+
+        書き込みは同じディレクトリの一時ファイルに行い、ブロックを正常に抜けたとき
+        だけ rename で置き換える。ブロック内で例外が起きた場合、既存ファイルは
+        そのまま残る（切り詰められない）。fsync はしないため、直接書き込む場合との
+        差は一時ファイルの作成と rename だけ（電源断に対する耐久性が必要なら
+        `open_replace` を使う）。
+        """
+        if path.is_symlink():
+            path = Path(os.path.realpath(path))  # replace the target, not the link
+        tmp_path, fd = _create_temp(path)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+                yield f
+            _copy_mode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @contextmanager
+    def open_replace(
+        self, path: Path, skip_unchanged: bool = True, newline: str | None = None
+    ) -> Iterator[_ReplaceWriter]:
+        """``path`` を一時ファイル → fsync → rename で置き換える書き込み先を返す。
+
+        ``skip_unchanged`` なら内容が既存ファイルと同一のとき何も書き込まない。
+        ブロック内で例外が起きた場合、既存ファイルはそのまま残る。``newline`` は
+        `open` と同じ意味で、``None`` なら ``\n`` を ``os.linesep`` に変換し、
+        ``""`` なら変換しない。
+        """
+        writer = _ReplaceWriter(path, skip_unchanged, newline)
+        try:
+            yield writer
+            writer.commit()
+        finally:
+            writer.discard()
+
+    def replace(self, path: Path, content: str, skip_unchanged: bool = True) -> bool:
+        """``content`` を原子的に書き込み、置き換えたかどうかを返す。"""
+        with self.open_replace(path, skip_unchanged) as writer:
+            writer.write(content)
+        return writer.written
+
+    def replace_exact(
+        self, path: Path, content: str, skip_unchanged: bool = True
+    ) -> bool:
+        """`replace` と同じだが、改行コードを変換しない。"""
+        with self.open_replace(path, skip_unchanged, newline="") as writer:
+            writer.write(content)
+        return writer.written
+
+    def stat(self, path: Path) -> tuple[int, int]:
+        """変更検知用に ``(mtime_ns, size)`` を返す。"""
+        st = path.stat()
+        return st.st_mtime_ns, st.st_size
+
+
+class MmapFileStorage(FileStorage, MappedStorage):
+    """ファイルをメモリマップして読み出す `FileStorage` の派生。
+
+    `open_mapped` で得たバッファを `MarkdownParserImpl.parse_bytes` に渡すと、
+    ファイル全体を `str` にコピーせずにパースできる。`ConvertFileUsecase` は
+    パーサが `parse_bytes` を持てば自動でこの経路を使う。`read` は互換のため
+    従来どおり `str` を返す（マップから直接デコードする）。
+    """
+
+    @contextmanager
+    def open_mapped(self, path: Path) -> Iterator[mmap.mmap | bytes]:
+        """読み取り専用でメモリマップしたファイル内容を返すコンテキストマネージャ。
+
+        空ファイルはマップできないため `b""` を返す。
+        """
+        with path.open("rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Zero-length files cannot be mapped.
+                yield b""
+                return
+            with mapped:
+                yield mapped
+
+    def read(self, path: Path) -> str:
+        """`FileStorage.read` と同じく改行（``\r\n`` / ``\r``）を ``\n`` にして返す。"""
+        with self.open_mapped(path) as data:
+            text = str(data, "utf-8")
+        if "\r" in text:
+            # Universal newlines, as text-mode `open` does.
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def read_exact(self, path: Path) -> str:
+        with self.open_mapped(path) as data:
+            return str(data, "utf-8")
+
+
+class AsyncFileStorage(AsyncStorage):
+    """同期 `Storage`（既定は `FileStorage`）の読み書きを executor で実行する非同期アダプタ。
+
+    ``executor`` を省略するとイベントループの既定 executor（スレッドプール）を使う。
+    """
+
+    def __init__(
+        self, storage: Storage | None = None, executor: Executor | None = None
+    ):
+        self._storage = storage or FileStorage()
+        self._executor = executor
+
+    async def read(self, path: Path) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._storage.read, path)
+
+    async def write(self, path: Path, content: str) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._storage.write, path, content)
@@ -0,0 +1,245 @@
+"""Persistent index from front-matter keys and values to Markdown files.
+
+`FrontMatterIndex` keeps, in a `sqlite3` database, the front matter of every
+Markdown file under a root directory together with the file's
+``(mtime_ns, size)`` stamp. `update` re-reads only files whose stamp changed
+(and drops deleted ones), so refreshing an index of a large corpus costs one
+``stat`` per file. Lookups by key and value (equality or prefix) go through a
+``(key, value)`` B-tree index and never touch the Markdown files.
+
+Front matter is read through a caller-supplied loader, typically
+`ConvertFileUsecase.load_front_matter`, which reads only the head of each file.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator
+
+from mddocs.interfaces.protocols import DocumentParseError
+
+# Bump when the table layout changes; older databases are rebuilt.
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE meta (
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL
+);
+CREATE INDEX meta_key_value ON meta (key, value);
+CREATE INDEX meta_file ON meta (file_id);
+"""
+
+# Stored instead of the real stamp for files whose loader failed. It never
+# matches a real ``(mtime_ns, size)``, so the next `update` retries them.
+_RETRY_STAMP = (-1, -1)
+
+
+@dataclass
+class IndexUpdate:
+    """`FrontMatterIndex.update` の結果。
+
+    Attributes:
+        added: 新たに索引に加えたファイル数。
+        updated: スタンプが変わったため読み直したファイル数。
+        removed: 削除されたため索引から除いたファイル数。
+        unchanged: 読み直さなかったファイル数。
+        errors: 読み込みに失敗したファイルと例外（フロントマターなしとして登録し、
+            次の `update` で読み直す）。対象は `OSError`・`UnicodeDecodeError`・
+            `DocumentParseError` で、それ以外の例外は `update` から伝播する。
+    """
+
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    errors: dict[Path, BaseException] = field(default_factory=dict)
+
+
+class FrontMatterIndex:
+    """``root`` 以下の Markdown ファイルのフロントマターを索引する `sqlite3` データベース。
+
+    パスは ``root`` からの相対パス（``/`` 区切り）で保存し、検索結果は ``root`` を
+    付けた `Path` で返す（パス順）。開くだけでは走査しないので、起動時は必要に応じて
+    `update` を呼ぶ。
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        root: str | Path,
+        loader: Callable[[Path], dict],
+        suffix: str = ".md",
+    ):
+        """
+        Args:
+            db_path: データベースファイル（なければ作成する）。
+            root: 索引するディレクトリ（サブディレクトリも含む）。
+            loader: パスからフロントマターを返す関数
+                （例: `ConvertFileUsecase.load_front_matter`）。
+            suffix: 索引するファイルの拡張子。
+        """
+        self.root = Path(root)
+        self.loader = loader
+        self.suffix = suffix
+        self._db = sqlite3.connect(str(db_path))
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version != _SCHEMA_VERSION:
+            with self._db:
+                self._db.execute("DROP TABLE IF EXISTS meta")
+                self._db.execute("DROP TABLE IF EXISTS files")
+                self._db.executescript(_SCHEMA)
+                self._db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> FrontMatterIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def _scan(self) -> Iterator[tuple[str, os.stat_result]]:
+        """``root`` 以下の対象ファイルの相対パスと stat を返す。"""
+        stack = [(self.root, "")]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except (FileNotFoundError, NotADirectoryError):
+                continue  # removed during the scan
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((Path(entry.path), prefix + entry.name + "/"))
+                    elif entry.name.endswith(self.suffix) and entry.is_file():
+                        yield prefix + entry.name, entry.stat()
+                except FileNotFoundError:
+                    continue
+
+    def update(self) -> IndexUpdate:
+        """ディレクトリを走査し、追加・変更されたファイルだけを読み直して索引を更新する。
+
+        ファイルの変更は ``(mtime_ns, size)`` の違いで判定する。更新は 1 つの
+        トランザクションで行う。走査中に削除されたファイルは削除として扱い、
+        読み込みに失敗したファイルはスタンプを記録しない（次回も読み直す）。
+        """
+        result = IndexUpdate()
+        known = {
+            path: (file_id, mtime, size)
+            for file_id, path, mtime, size in self._db.execute(
+                "SELECT id, path, mtime_ns, size FROM files"
+            )
+        }
+        with self._db:
+            for rel, st in self._scan():
+                stamp = (st.st_mtime_ns, st.st_size)
+                row = known.pop(rel, None)
+                if row is not None and row[1:] == stamp:
+                    result.unchanged += 1
+                    continue
+                path = self.root / rel
+                try:
+                    front_matter = self.loader(path)
+                except (OSError, UnicodeDecodeError, DocumentParseError) as e:
+                    front_matter = {}
+                    result.errors[path] = e
+                    stamp = _RETRY_STAMP
+                if row is None:
+                    file_id = self._db.execute(
+                        "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                        (rel, *stamp),
+                    ).lastrowid
+                    result.added += 1
+                else:
+                    file_id = row[0]
+                    self._db.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                        (*stamp, file_id),
+                    )
+                    self._db.execute("DELETE FROM meta WHERE file_id = ?", (file_id,))
+                    result.updated += 1
+                self._db.executemany(
+                    "INSERT INTO meta (file_id, key, value) VALUES (?, ?, ?)",
+                    [(file_id, str(k), str(v)) for k, v in front_matter.items()],
+                )
+            if known:
+                self._db.executemany(
+                    "DELETE FROM files WHERE id = ?",
+                    [(row[0],) for row in known.values()],
+                )
+                result.removed = len(known)
+        return result
+
+    def _paths(self, sql: str, params: tuple) -> list[Path]:
+        return [self.root / rel for (rel,) in self._db.execute(sql, params)]
+
+    def find(self, key: str, value: str) -> list[Path]:
+        """フロントマターの ``key`` が ``value`` と等しいファイル。"""
+        return self._paths(
+            "SELECT f.path FROM meta m JOIN files f ON f.id = m.file_id "
+            "WHERE m.key = ? AND m.value = ? ORDER BY f.path",
+            (key, value),
+        )
+
+    def find_prefix(self, key: str, prefix: str) -> list[Path]:
+        """フロントマターの ``key`` の値が ``prefix`` で始まるファイル。
+
+        ``(key, value)`` 索引の範囲検索で求める（大文字・小文字は区別する）。
+        """
+        # Smallest string greater than every string starting with ``prefix``.
+        upper = prefix.rstrip(chr(sys.maxunicode))
+        if not upper:
+            return self._paths(
+                "SELECT f.path FROM meta m JOIN files f ON f.id = m.file_id "
+                "WHERE m.key = ? AND m.value >= ? ORDER BY f.path",
+                (key, prefix),
+            )
+        code = ord(upper[-1]) + 1
+        if 0xD800 <= code <= 0xDFFF:
+            code = 0xE000  # surrogates cannot be stored as UTF-8
+        upper = upper[:-1] + chr(code)
+        return self._paths(
+            "SELECT f.path FROM meta m JOIN files f ON f.id = m.file_id "
+            "WHERE m.key = ? AND m.value >= ? AND m.value < ? ORDER BY f.path",
+            (key, prefix, upper),
+        )
+
+    def get(self, path: str | Path) -> dict[str, str] | None:
+        """索引済みのファイルのフロントマター（索引にないファイルは ``None``）。"""
+        rel = Path(path)
+        if rel.is_absolute():
+            rel = rel.relative_to(self.root)
+        row = self._db.execute(
+            "SELECT id FROM files WHERE path = ?", (rel.as_posix(),)
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(
+            self._db.execute("SELECT key, value FROM meta WHERE file_id = ?", row)
+        )
+
+    def keys(self) -> list[str]:
+        """索引に現れるフロントマターのキー（昇順）。"""
+        return [
+            k for (k,) in self._db.execute("SELECT DISTINCT key FROM meta ORDER BY key")
+        ]
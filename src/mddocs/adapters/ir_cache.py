@@ -0,0 +1,256 @@
+"""Persistent on-disk cache of parsed `Document` IR.
+
+`DiskCachedParser` wraps a `DocumentParser` and keeps each parse result in a
+sidecar directory, keyed by the SHA-256 of the source text salted with the
+parser's ``cache_version`` stamp and the encoding version. Short-lived
+processes can therefore skip Markdown parsing for every file that has not
+changed since any earlier run.
+
+Entries use a compact binary encoding: a magic header and a BLAKE2b digest of
+the payload, followed by a `marshal` payload of plain tuples/lists/strings.
+The digest is verified before decoding, so a damaged entry whose payload would
+still unmarshal (e.g. a flipped byte inside a string) is a miss rather than a
+wrong document. `marshal` is implemented in C and is
+the cheapest way to rebuild those containers in CPython; its format depends on
+the interpreter version, which is therefore part of the key. Large entries are
+loaded through `mmap`.
+"""
+
+from __future__ import annotations
+
+import gc
+import hashlib
+from array import array
+import marshal
+import mmap
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_ir import (
+    BulletList,
+    ColumnarTable,
+    DocNode,
+    Document,
+    Heading,
+    Image,
+    NumberedList,
+    Paragraph,
+    Table,
+)
+from mddocs.interfaces.protocols import DocumentParser
+
+# Bump when the layout produced by `encode_document` changes.
+_FORMAT_VERSION = 3
+_MAGIC = b"MDIR" + bytes([_FORMAT_VERSION])
+_DIGEST_SIZE = 16
+_HEADER_SIZE = len(_MAGIC) + _DIGEST_SIZE
+# Entries at least this large are mmapped instead of read.
+_MMAP_THRESHOLD = 1 << 20
+
+_HEADING, _PARAGRAPH, _BULLET, _NUMBERED, _TABLE, _IMAGE, _COLUMNAR = range(7)
+
+
+class IRCacheError(Exception):
+    """キャッシュエントリが壊れている／形式が異なる場合に投げられる例外。"""
+
+
+def _encode_node(node: DocNode) -> tuple:
+    if isinstance(node, Heading):
+        return (_HEADING, node.level, node.text)
+    if isinstance(node, Paragraph):
+        return (_PARAGRAPH, node.text)
+    if isinstance(node, BulletList):
+        return (_BULLET, list(node.items))
+    if isinstance(node, NumberedList):
+        return (_NUMBERED, list(node.items))
+    if isinstance(node, ColumnarTable):
+        # Column buffers and offset arrays are stored as is; no rows are built.
+        columns, nrows, widths = node.buffers()
+        return (
+            _COLUMNAR,
+            list(node.headers),
+            [(buf, offs.typecode, offs.tobytes()) for buf, offs in columns],
+            nrows,
+            None if widths is None else widths.tobytes(),
+        )
+    if isinstance(node, Table):
+        return (_TABLE, list(node.headers), [list(r) for r in node.rows])
+    if isinstance(node, Image):
+        return (_IMAGE, node.alt, node.path)
+    raise TypeError(node)
+
+
+def encode_document(doc: Document) -> bytes:
+    """Encode a `Document` into the binary cache format."""
+    payload = (
+        list(doc.front_matter.items()),
+        [_encode_node(n) for n in doc.nodes],
+    )
+    return _frame(marshal.dumps(payload))
+
+
+def _digest(payload: bytes | memoryview) -> bytes:
+    return hashlib.blake2b(payload, digest_size=_DIGEST_SIZE).digest()
+
+
+def _frame(payload: bytes) -> bytes:
+    return _MAGIC + _digest(payload) + payload
+
+
+def decode_document(data: bytes | mmap.mmap) -> Document:
+    """Decode bytes produced by `encode_document`.
+
+    Raises:
+        IRCacheError: when the data is not a valid entry, or its payload does
+            not match the digest in the header.
+    """
+    if data[: len(_MAGIC)] != _MAGIC or len(data) < _HEADER_SIZE:
+        raise IRCacheError("not an IR cache entry (bad magic or format version)")
+    # Decoding only allocates acyclic containers of strings, yet the allocation
+    # burst would trigger several cyclic-GC passes over every live object.
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _decode_payload(data)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _decode_payload(data: bytes | mmap.mmap) -> Document:
+    # Slices are released explicitly: a traceback keeping them alive would
+    # stop the caller from closing an mmapped entry.
+    with memoryview(data) as view, view[_HEADER_SIZE:] as payload:
+        if _digest(payload) != view[len(_MAGIC) : _HEADER_SIZE]:
+            raise IRCacheError("corrupt IR cache entry: digest mismatch")
+        try:
+            fm_items, encoded = marshal.loads(payload)
+        except (EOFError, ValueError, TypeError) as e:
+            raise IRCacheError(f"corrupt IR cache entry: {e}") from e
+    nodes: list[DocNode] = []
+    append = nodes.append
+    try:
+        front_matter = dict(fm_items)
+        for rec in encoded:
+            tag = rec[0]
+            if tag == _TABLE:
+                append(Table(rec[1], rec[2]))
+            elif tag == _PARAGRAPH:
+                append(Paragraph(rec[1]))
+            elif tag == _HEADING:
+                append(Heading(rec[1], rec[2]))
+            elif tag == _BULLET:
+                append(BulletList(rec[1]))
+            elif tag == _NUMBERED:
+                append(NumberedList(rec[1]))
+            elif tag == _IMAGE:
+                append(Image(rec[1], rec[2]))
+            elif tag == _COLUMNAR:
+                append(_decode_columnar(rec))
+            else:
+                raise IRCacheError(f"unknown node tag {tag!r}")
+    except (IndexError, TypeError, ValueError) as e:
+        raise IRCacheError(f"corrupt IR cache entry: {e}") from e
+    return Document(front_matter, nodes)
+
+
+def _decode_columnar(rec: tuple) -> ColumnarTable:
+    columns = []
+    for buf, typecode, raw in rec[2]:
+        offsets = array(typecode)
+        offsets.frombytes(raw)
+        columns.append((buf, offsets))
+    widths = None
+    if rec[4] is not None:
+        widths = array("I")
+        widths.frombytes(rec[4])
+    return ColumnarTable.from_buffers(rec[1], tuple(columns), rec[3], widths)
+
+
+class DiskCachedParser(DocumentParser):
+    """`DocumentParser` that persists parse results in ``cache_dir``.
+
+    Usage::
+
+        parser = DiskCachedParser(Path(".mddocs-cache"))
+        uc = ConvertFileUsecase(parser, MarkdownRendererAdapter(), FileStorage())
+
+    Unreadable or corrupt entries are treated as misses and rewritten. Writes
+    go through a temporary file and `os.replace`, so concurrent processes
+    sharing a cache directory never observe partial entries.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        parser: DocumentParser | None = None,
+        version: str | None = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self._parser = parser or MarkdownParserImpl()
+        if version is None:
+            version = getattr(self._parser, "cache_version", None) or (
+                f"{type(self._parser).__module__}.{type(self._parser).__qualname__}"
+            )
+        self._salt = (
+            f"{_FORMAT_VERSION}:{marshal.version}:{sys.version_info[:2]}:{version}\0"
+        ).encode("utf-8")
+        self.hits = 0
+        self.misses = 0
+
+    def entry_path(self, text: str) -> Path:
+        """Return the cache file that holds (or would hold) the entry for ``text``."""
+        h = hashlib.sha256(self._salt)
+        h.update(text.encode("utf-8"))
+        digest = h.hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.mdir"
+
+    def parse(self, text: str) -> Document:
+        entry = self.entry_path(text)
+        doc = self._load(entry)
+        if doc is not None:
+            self.hits += 1
+            return doc
+        self.misses += 1
+        doc = self._parser.parse(text)
+        self._store(entry, encode_document(doc))
+        return doc
+
+    def clear(self) -> None:
+        """Remove every entry from the cache directory."""
+        if not self.cache_dir.is_dir():
+            return
+        for sub in self.cache_dir.iterdir():
+            if sub.is_dir() and len(sub.name) == 2:
+                for f in sub.glob("*.mdir"):
+                    f.unlink(missing_ok=True)
+
+    def _load(self, entry: Path) -> Document | None:
+        try:
+            with entry.open("rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < _MMAP_THRESHOLD:
+                    return decode_document(f.read())
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return decode_document(data)
+        except (OSError, IRCacheError):
+            return None
+
+    def _store(self, entry: Path, data: bytes) -> None:
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, entry)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            # The cache is an optimization: a read-only or full disk must not
+            # turn a successful parse into a failure.
+            pass
@@ -7,8 +7,21 @@
 
 from __future__ import annotations
 
-from mddocs.interfaces.protocols import DocumentParser, DocumentRenderer
-from mddocs.adapters.markdown_renderer import document_to_markdown
+import mmap
+
+from mddocs.domain.doc_ir import Document
+from mddocs.interfaces.protocols import (
+    DocumentParser,
+    MetricsCollector,
+    StreamingRenderer,
+    TextWriter,
+)
+from mddocs.adapters.markdown_renderer import (
+    FormattingCache,
+    RenderMode,
+    document_to_markdown,
+    render_to,
+)
 from mddocs.adapters.markdown_parser import MarkdownParserImpl
 
 
@@ -25,11 +38,84 @@ class MarkdownParserAdapter:
     def parse(self, text: str):
         return self._parser.parse(text)
 
+    def parse_front_matter(
+        self, head: str, complete: bool = True
+    ) -> dict[str, str] | None:
+        """内側のパーサの `parse_front_matter` に委譲する。
+
+        内側が対応していなければ、``head`` が文書全体のときだけ `parse` で求める。
+        """
+        parse = getattr(self._parser, "parse_front_matter", None)
+        if parse is not None:
+            return parse(head, complete)
+        return self._parser.parse(head).front_matter if complete else None
+
+    def parse_with_source(self, text: str):
+        """内側のパーサの `parse_with_source` に委譲する。
+
+        内側が対応していなければ `parse` の結果（``source`` は ``None``）を返す。
+        """
+        parse = getattr(self._parser, "parse_with_source", None)
+        if parse is not None:
+            return parse(text)
+        return self._parser.parse(text)
+
+    def parse_bytes(self, data: bytes | mmap.mmap):
+        """内側のパーサの `parse_bytes` に委譲する。
+
+        内側が対応していなければ ``data`` 全体をデコードして `parse` する。
+        """
+        parse = getattr(self._parser, "parse_bytes", None)
+        if parse is not None:
+            return parse(data)
+        return self._parser.parse(str(data, "utf-8"))
 
-class MarkdownRendererAdapter(DocumentRenderer):
-    """`document_to_markdown` をラップし、出力時に `mdformat` で整形するアダプタ。"""
+    def reparse(self, doc: Document, offset: int, removed: int, inserted: str):
+        """内側のパーサの `reparse` に委譲する。
+
+        内側が対応していなければ編集後のテキスト全体を `parse_with_source` する。
+        """
+        reparse = getattr(self._parser, "reparse", None)
+        if reparse is not None:
+            return reparse(doc, offset, removed, inserted)
+        if doc.source is None:
+            raise ValueError("reparse: the document has no source map")
+        text = doc.source.text
+        if not 0 <= offset <= offset + removed <= len(text):
+            raise ValueError(
+                f"reparse: edit [{offset}, {offset + removed}) out of range"
+            )
+        return self.parse_with_source(
+            text[:offset] + inserted + text[offset + removed :]
+        )
+
+
+class MarkdownRendererAdapter(StreamingRenderer):
+    """`document_to_markdown` をラップし、出力時に `mdformat` で整形するアダプタ。
+
+    ``mode="canonical"`` を渡すと、mdformat と同一の出力を直接生成し、対応できない
+    ブロックを含む文書でのみ mdformat にフォールバックする（``"verify"`` は一致検証付き）。
+    ``cache`` に `FormattingCache` を渡すと mdformat の整形をブロック単位でメモ化する。
+    ``metrics`` に `MetricsCollector` を渡すと、`render` / `render_to` の
+    ``serialize`` / ``mdformat``（または ``canonical``）段階を、`render_to` では
+    さらに出力先への書き込み（``write``）を記録する。
+    """
+
+    def __init__(
+        self,
+        mode: RenderMode = "mdformat",
+        cache: FormattingCache | None = None,
+        metrics: MetricsCollector | None = None,
+    ):
+        self.mode: RenderMode = mode
+        self.cache = cache
+        self.metrics = metrics
 
     def render(self, doc):
         # `document_to_markdown` from the renderer already returns formatted
         # Markdown (adapter-level). Avoid double-formatting here.
-        return document_to_markdown(doc)
+        return document_to_markdown(doc, self.mode, self.cache, self.metrics)
+
+    def render_to(self, doc, fp: TextWriter) -> None:
+        """`render` と同じ内容を ``fp`` へブロック単位で書き出す。"""
+        render_to(doc, fp, self.mode, self.cache, self.metrics)
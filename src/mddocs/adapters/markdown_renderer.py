@@ -2,22 +2,54 @@
 
 The domain owns the pure node->Markdown conversion. The adapter is responsible
 for formatting (e.g. `mdformat`) or other environment-specific concerns.
+
+Besides the default ``"mdformat"`` mode, `document_to_markdown` offers a
+``"canonical"`` mode that emits mdformat's output directly for documents made
+of "plain" blocks (text that mdformat would neither escape nor re-interpret)
+and only runs the `mdformat` pass as a fallback for anything else, plus a
+``"verify"`` mode that additionally checks the canonical output against
+mdformat. A `FormattingCache` makes the mdformat pass incremental: only blocks
+not seen before are formatted. `render_to` writes the same output to a file
+object block by block instead of building it as one string.
 """
 
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Iterator, Literal
+
 from mddocs.domain.ir_serializers import (
     document_to_markdown as domain_document_to_markdown,
+    iter_markdown,
+    render_front_matter,
+    render_node,
+)
+from mddocs.interfaces.protocols import MetricsCollector, TextWriter
+from mddocs.domain.doc_ir import (
+    BulletList,
+    Document,
+    Heading,
+    Image,
+    NumberedList,
+    Paragraph,
+    Table,
 )
-from mddocs.domain.doc_ir import Document
 
 # `mdformat` may not be installed in the test environment; expose a
 # module-level name that tests can monkeypatch. We will import lazily
 # inside the function if not provided.
 mdformat = None
 
+RenderMode = Literal["mdformat", "canonical", "verify"]
 
-def document_to_markdown(doc: Document) -> str:
-    raw = domain_document_to_markdown(doc)
-    # Adapter-level formatting (keep adapter responsibilities here)
+
+class CanonicalRenderMismatch(Exception):
+    """``mode="verify"`` で canonical 出力と mdformat の出力が一致しない場合の例外。"""
+
+
+def _get_mdformat():
     md = globals().get("mdformat")
     if md is None:
         try:
@@ -26,8 +58,477 @@ def document_to_markdown(doc: Document) -> str:
             md = _mdformat
         except Exception:
             md = None
-
     if md is not None and hasattr(md, "text"):
-        return md.text(raw)
+        return md
+    return None
+
+
+def document_to_markdown(
+    doc: Document,
+    mode: RenderMode = "mdformat",
+    cache: "FormattingCache | None" = None,
+    metrics: MetricsCollector | None = None,
+) -> str:
+    """Render ``doc`` to formatted Markdown.
+
+    With a ``cache``, the mdformat pass (in ``"mdformat"`` mode, or as the
+    fallback of the other modes) runs block by block and reuses previously
+    formatted blocks; see `FormattingCache`.
+
+    With ``metrics``, the stages are recorded separately: ``"serialize"``
+    (IR to raw Markdown) and ``"mdformat"`` (the formatting pass; with a
+    cache, the whole block-wise pass including serialization), or
+    ``"canonical"`` for output produced without mdformat.
+    """
+    if mode == "mdformat":
+        return _format_document(doc, cache, metrics)
+
+    t0 = time.perf_counter() if metrics is not None else 0.0
+    fast = canonical_markdown(doc)
+    if fast is None:
+        return _format_document(doc, cache, metrics)
+    if metrics is not None:
+        metrics.record(
+            "canonical",
+            time.perf_counter() - t0,
+            n_bytes=len(fast.encode("utf-8")),
+            n_nodes=len(doc.nodes),
+        )
+    if mode == "verify":
+        md = _get_mdformat()
+        if md is not None:
+            expected = md.text(domain_document_to_markdown(doc))
+            if fast != expected:
+                raise CanonicalRenderMismatch(
+                    "canonical renderer output differs from mdformat"
+                )
+    return fast
+
+
+def _format_document(
+    doc: Document,
+    cache: "FormattingCache | None",
+    metrics: MetricsCollector | None = None,
+) -> str:
+    # Adapter-level formatting (keep adapter responsibilities here)
+    md = _get_mdformat()
+    if metrics is not None:
+        return _format_document_timed(doc, cache, md, metrics)
+    if md is None:
+        return domain_document_to_markdown(doc)
+    if cache is not None:
+        chunks = _independent_chunks(doc)
+        if chunks is not None:
+            formatted = [cache.format(chunk, md.text) for chunk in chunks]
+            return "\n".join(f for f in formatted if f)
+    return md.text(domain_document_to_markdown(doc))
+
+
+def _format_document_timed(
+    doc: Document, cache: "FormattingCache | None", md, metrics: MetricsCollector
+) -> str:
+    """`_format_document` with each stage reported to ``metrics``."""
+    n_nodes = len(doc.nodes)
+    if md is not None and cache is not None:
+        t0 = time.perf_counter()
+        chunks = _independent_chunks(doc)
+        if chunks is not None:
+            formatted = [cache.format(chunk, md.text) for chunk in chunks]
+            text = "\n".join(f for f in formatted if f)
+            metrics.record(
+                "mdformat",
+                time.perf_counter() - t0,
+                n_bytes=len(text.encode("utf-8")),
+                n_nodes=n_nodes,
+            )
+            return text
+    t0 = time.perf_counter()
+    raw = domain_document_to_markdown(doc)
+    t1 = time.perf_counter()
+    metrics.record(
+        "serialize", t1 - t0, n_bytes=len(raw.encode("utf-8")), n_nodes=n_nodes
+    )
+    if md is None:
+        return raw
+    text = md.text(raw)
+    metrics.record(
+        "mdformat",
+        time.perf_counter() - t1,
+        n_bytes=len(text.encode("utf-8")),
+        n_nodes=n_nodes,
+    )
+    return text
+
+
+def render_to(
+    doc: Document,
+    fp: TextWriter,
+    mode: RenderMode = "mdformat",
+    cache: "FormattingCache | None" = None,
+    metrics: MetricsCollector | None = None,
+) -> None:
+    """Write ``document_to_markdown(doc, mode, cache)`` to ``fp`` block by block.
+
+    Only one block (the raw or formatted text of a node, or of a few nodes
+    that must be formatted together) is held in memory at a time. Documents
+    whose blocks depend on each other (see `_independent_chunks`) and
+    ``"verify"`` mode still render the whole document before writing.
+
+    With ``metrics``, the time spent producing blocks and the time spent in
+    ``fp.write`` are recorded as separate stages: ``"serialize"`` and
+    ``"mdformat"`` (or ``"canonical"``), then ``"write"``, each summed over
+    all blocks.
+    """
+    if metrics is not None:
+        _render_to_timed(doc, fp, mode, cache, metrics)
+        return
+    if mode == "verify":
+        fp.write(document_to_markdown(doc, mode, cache))
+        return
+    if mode == "canonical" and _is_canonical(doc):
+        sep = ""
+        for block in _iter_canonical_blocks(doc):
+            fp.write(sep)
+            fp.write(block)
+            sep = "\n\n"
+        if sep:
+            fp.write("\n")
+        return
+
+    md = _get_mdformat()
+    if md is None:
+        for piece in iter_markdown(doc):
+            fp.write(piece)
+        return
+    if not _chunks_independent(doc):
+        fp.write(md.text(domain_document_to_markdown(doc)))
+        return
+    text = md.text
+    first = True
+    for chunk in _iter_chunks(doc):
+        out = text(chunk) if cache is None else cache.format(chunk, text)
+        if out:
+            if not first:
+                fp.write("\n")
+            fp.write(out)
+            first = False
+
+
+class _TimedWriter:
+    """Forwards to ``fp``, summing the time and UTF-8 bytes of the writes."""
+
+    __slots__ = ("fp", "seconds", "n_bytes")
+
+    def __init__(self, fp: TextWriter):
+        self.fp = fp
+        self.seconds = 0.0
+        self.n_bytes = 0
+
+    def write(self, s: str, /) -> int:
+        t0 = time.perf_counter()
+        n = self.fp.write(s)
+        self.seconds += time.perf_counter() - t0
+        self.n_bytes += len(s.encode("utf-8"))
+        return n
+
+
+def _render_to_timed(
+    doc: Document,
+    fp: TextWriter,
+    mode: RenderMode,
+    cache: "FormattingCache | None",
+    metrics: MetricsCollector,
+) -> None:
+    """`render_to` with each stage reported to ``metrics``."""
+    n_nodes = len(doc.nodes)
+    out = _TimedWriter(fp)
+    if mode == "verify":
+        out.write(document_to_markdown(doc, mode, cache, metrics))
+    elif mode == "canonical" and _is_canonical(doc):
+        elapsed = 0.0
+        sep = ""
+        blocks = _iter_canonical_blocks(doc)
+        while True:
+            t0 = time.perf_counter()
+            block = next(blocks, None)
+            elapsed += time.perf_counter() - t0
+            if block is None:
+                break
+            out.write(sep)
+            out.write(block)
+            sep = "\n\n"
+        if sep:
+            out.write("\n")
+        metrics.record("canonical", elapsed, n_bytes=out.n_bytes, n_nodes=n_nodes)
+    else:
+        md = _get_mdformat()
+        if md is None:
+            elapsed = 0.0
+            pieces = iter_markdown(doc)
+            while True:
+                t0 = time.perf_counter()
+                piece = next(pieces, None)
+                elapsed += time.perf_counter() - t0
+                if piece is None:
+                    break
+                out.write(piece)
+            metrics.record("serialize", elapsed, n_bytes=out.n_bytes, n_nodes=n_nodes)
+        elif not _chunks_independent(doc):
+            out.write(_format_document_timed(doc, None, md, metrics))
+        else:
+            serialize = mdformat_s = 0.0
+            n_raw = 0
+            text = md.text
+            first = True
+            chunks = _iter_chunks(doc)
+            while True:
+                t0 = time.perf_counter()
+                chunk = next(chunks, None)
+                t1 = time.perf_counter()
+                serialize += t1 - t0
+                if chunk is None:
+                    break
+                n_raw += len(chunk.encode("utf-8"))
+                formatted = text(chunk) if cache is None else cache.format(chunk, text)
+                mdformat_s += time.perf_counter() - t1
+                if formatted:
+                    if not first:
+                        out.write("\n")
+                    out.write(formatted)
+                    first = False
+            metrics.record("serialize", serialize, n_bytes=n_raw, n_nodes=n_nodes)
+            metrics.record("mdformat", mdformat_s, n_bytes=out.n_bytes, n_nodes=n_nodes)
+    metrics.record("write", out.seconds, n_bytes=out.n_bytes)
+
+
+# Raw text that can make Markdown blocks depend on each other: link reference
+# definitions, fenced code and HTML blocks (which may span blank lines).
+_CROSS_BLOCK_RE = re.compile(r"\]:|```|~~~|<")
+_LIST_ITEM_RE = re.compile(r" {0,3}(?:[-+*]|[0-9]{1,9}[.)])(?:[ \t]|$)")
+
+
+def _chunks_independent(doc: Document) -> bool:
+    """False if some node could interact with blocks further away."""
+    if doc.front_matter:
+        front = render_front_matter(doc.front_matter)
+        if front.find("-->") != len(front) - 4:
+            # The HTML comment would close early and swallow following blocks.
+            return False
+    return not any(_CROSS_BLOCK_RE.search(render_node(n)) for n in doc.nodes)
+
+
+def _iter_chunks(doc: Document) -> Iterator[str]:
+    """Yield the raw rendering of ``doc`` as chunks mdformat formats independently.
+
+    Each chunk is the raw text of one node (or the front matter). A node is
+    kept in the chunk before it when its text starts with whitespace (it may
+    continue the previous block) or when it starts with a list item and the
+    previous chunk contains one (Markdown may merge such lists, and mdformat
+    alternates the markers of adjacent separate lists). Only valid when
+    `_chunks_independent` holds.
+    """
+    pending = render_front_matter(doc.front_matter) if doc.front_matter else None
+    prev_has_list = False
+    for node in doc.nodes:
+        raw = render_node(node)
+        if not raw:
+            # e.g. an empty list: only the blank separator line remains.
+            if pending is not None:
+                pending += "\n"
+            continue
+        lines = raw.rstrip("\n").split("\n")
+        has_list = any(_LIST_ITEM_RE.match(line) for line in lines)
+        if pending is not None and (
+            raw[:1].isspace()
+            or (prev_has_list and _LIST_ITEM_RE.match(lines[0]) is not None)
+        ):
+            pending += "\n" + raw
+            prev_has_list = prev_has_list or has_list
+        else:
+            if pending is not None:
+                yield pending
+            pending = raw
+            prev_has_list = has_list
+    if pending is not None:
+        yield pending
+
+
+def _independent_chunks(doc: Document) -> list[str] | None:
+    """`_iter_chunks` as a list, or ``None`` when the document must be
+    formatted as a whole."""
+    if not _chunks_independent(doc):
+        return None
+    return list(_iter_chunks(doc))
+
+
+class FormattingCache:
+    """mdformat の結果をブロック単位でメモ化する LRU キャッシュ。
+
+    キーは各ブロックの生 Markdown（`render_node` の出力）のハッシュ。大きな文書の
+    一部だけを編集して保存し直す場合、変更されたブロックだけが mdformat に渡る。
+    ``max_entries`` 件・整形済みテキスト合計 ``max_bytes`` 文字を上限に古いものから
+    追い出す。スレッドセーフ。
+    """
+
+    def __init__(self, max_entries: int = 65536, max_bytes: int = 64 << 20):
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError(
+                "FormattingCache: max_entries and max_bytes must be positive"
+            )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def format(self, raw: str, formatter: Callable[[str], str]) -> str:
+        """``formatter(raw)`` を返す。同じ ``raw`` を整形済みなら再利用する。"""
+        key = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        formatted = formatter(raw)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = formatted
+                self._bytes += len(formatted)
+                while len(self._entries) > self.max_entries or (
+                    self._bytes > self.max_bytes and len(self._entries) > 1
+                ):
+                    _, old = self._entries.popitem(last=False)
+                    self._bytes -= len(old)
+                    self.evictions += 1
+        return formatted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+# Characters mdformat escapes or that start inline syntax (emphasis, code,
+# links, HTML, entities, headings closing sequences).
+_UNSAFE_INLINE_RE = re.compile(r"[\\`*_\[\]<>&#~]")
+# Ordered-list marker at the start of a paragraph.
+_ORDERED_START_RE = re.compile(r"[0-9]{1,9}[.)](?: |$)")
+_SAFE_URL_RE = re.compile(r"[A-Za-z0-9._/:%?=+-]+")
+# mdformat collapses runs of spaces inside inline text.
+_SPACES_RE = re.compile(r" {2,}")
+
+
+def _plain_inline(text: str) -> bool:
+    """True if mdformat renders ``text`` (as inline content) unchanged."""
+    return (
+        bool(text)
+        and text.isprintable()
+        and text[0] != " "
+        and text[-1] != " "
+        and _UNSAFE_INLINE_RE.search(text) is None
+    )
+
+
+def _plain_paragraph(text: str) -> bool:
+    """True if ``text`` at the start of a line stays one unchanged paragraph."""
+    if not _plain_inline(text):
+        return False
+    c = text[0]
+    if c.isascii() and not c.isalnum():
+        return False
+    return not (c.isdigit() and _ORDERED_START_RE.match(text))
+
+
+def _plain_cell(text: str) -> bool:
+    return text == "" or _plain_inline(text)
+
+
+def canonical_markdown(doc: Document) -> str | None:
+    """Render ``doc`` exactly as ``mdformat.text(raw)`` would, without mdformat.
+
+    Returns ``None`` when some block is not "plain" (it contains characters
+    mdformat would escape or re-interpret, or adjacent lists of the same kind
+    that Markdown would merge); callers then fall back to the mdformat pass.
+    """
+    if not _is_canonical(doc):
+        return None
+    blocks = list(_iter_canonical_blocks(doc))
+    if not blocks:
+        return ""
+    return "\n\n".join(blocks) + "\n"
+
+
+def _is_canonical(doc: Document) -> bool:
+    """True if every block of ``doc`` is plain (see `canonical_markdown`)."""
+    if doc.front_matter and not all(
+        k and v and _plain_inline(f"{k}: {v}") and "-->" not in f"{k}: {v}"
+        for k, v in doc.front_matter.items()
+    ):
+        return False
+
+    prev_type: type | None = None
+    for node in doc.nodes:
+        node_type = type(node)
+        if isinstance(node, Paragraph):
+            if not _plain_paragraph(node.text):
+                return False
+        elif isinstance(node, Table):
+            cells = [node.headers, *node.rows]
+            if not all(_plain_cell(c) for row in cells for c in row):
+                return False
+        elif isinstance(node, Heading):
+            if not (1 <= node.level <= 6 and _plain_inline(node.text)):
+                return False
+        elif isinstance(node, (BulletList, NumberedList)):
+            # Adjacent lists of the same kind merge into one loose list.
+            if prev_type is node_type or not node.items:
+                return False
+            if not all(_plain_paragraph(item) for item in node.items):
+                return False
+        elif isinstance(node, Image):
+            if not (
+                _plain_cell(node.alt) and _SAFE_URL_RE.fullmatch(node.path) is not None
+            ):
+                return False
+        else:
+            return False
+        prev_type = node_type
+    return True
+
+
+def _iter_canonical_blocks(doc: Document) -> Iterator[str]:
+    """Yield the canonical text of each block of a document that passed
+    `_is_canonical`."""
+    if doc.front_matter:
+        lines = [f"{k}: {v}" for k, v in doc.front_matter.items()]
+        yield "\n".join(["<!--", *lines, "-->"])
 
-    return raw
+    for node in doc.nodes:
+        if isinstance(node, Paragraph):
+            yield _SPACES_RE.sub(" ", node.text)
+        elif isinstance(node, Table):
+            header = "| " + " | ".join(node.headers) + " |"
+            sep = "| " + " | ".join(["----"] * len(node.headers)) + " |"
+            rows = ["| " + " | ".join(r) + " |" for r in node.rows]
+            yield _SPACES_RE.sub(" ", "\n".join([header, sep, *rows]))
+        elif isinstance(node, Heading):
+            yield "#" * node.level + " " + _SPACES_RE.sub(" ", node.text)
+        elif isinstance(node, (BulletList, NumberedList)):
+            marker = "- " if isinstance(node, BulletList) else "1. "
+            items = "\n".join(marker + item for item in node.items)
+            yield _SPACES_RE.sub(" ", items)
+        elif isinstance(node, Image):
+            yield f"![{node.alt}]({node.path})"
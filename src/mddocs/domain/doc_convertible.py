@@ -10,6 +10,7 @@
 from abc import ABC, abstractmethod
 from typing import TypeVar, Type, Optional, Callable, cast
 
+from mddocs.domain.doc_cursor import NodeCursor
 from mddocs.domain.doc_ir import DocNode
 
 # 基底クラスをバインドしておくことで Type[T] が from_nodes を持つことを静的に示す
@@ -63,13 +64,12 @@ class DocConvertible(ABC):
         どちらも実装されていない場合は `NotImplementedError` を送出します。
         """
         # 後方互換: 具象が from_cursor を実装していればそれを用いる
-        if hasattr(cls, "from_cursor"):
-            from mddocs.domain.doc_cursor import NodeCursor
-
-            cur = NodeCursor(nodes, front_matter or {})
-            # 型情報が静的にはないため getattr してキャストしてから呼ぶ
-            method = cast(Callable[[NodeCursor], T], getattr(cls, "from_cursor"))
-            return method(cur)
+        # （呼び出しごとに解決するので、後から差し替えた from_cursor も使われる）
+        method = cast(
+            Optional[Callable[[NodeCursor], T]], getattr(cls, "from_cursor", None)
+        )
+        if method is not None:
+            return method(NodeCursor(nodes, front_matter or {}))
 
         # 既存の具象が from_nodes をオーバーライドしている場合はそちらが使われる
         raise NotImplementedError(
@@ -7,42 +7,165 @@ DocConvertible の具象実装を簡潔にするための小さな API を提供
 
 from __future__ import annotations
 
-from typing import Callable, List, Optional, TypeVar, Type, cast
+from bisect import bisect_left, bisect_right
+from typing import Callable, List, Optional, Sequence, TypeVar, Type, cast
 
-from mddocs.domain.doc_ir import DocNode, Paragraph, Table
+from mddocs.domain.doc_ir import DocNode, Heading, Paragraph, Table
+from mddocs.domain.doc_sections import NodeView
 
 
 T = TypeVar("T", bound=DocNode)
 
 
+class _SharedNodes:
+    """カーソルとその fork が共有するノード列と、見出し位置の索引。
+
+    索引は最初の見出し検索（`NodeCursor.seek_heading` / `NodeCursor.section`）で
+    1 度だけ作られ、以降はすべての fork で使い回される。
+    """
+
+    __slots__ = ("nodes", "_by_level", "_by_text", "_by_key", "_all")
+
+    def __init__(self, nodes: Sequence[DocNode]):
+        self.nodes = nodes
+        self._all: list[int] | None = None
+
+    def _build(self) -> None:
+        by_level: dict[int, list[int]] = {}
+        by_text: dict[str, list[int]] = {}
+        by_key: dict[tuple[int, str], list[int]] = {}
+        positions: list[int] = []
+        for i, n in enumerate(self.nodes):
+            if isinstance(n, Heading):
+                positions.append(i)
+                by_level.setdefault(n.level, []).append(i)
+                by_text.setdefault(n.text, []).append(i)
+                by_key.setdefault((n.level, n.text), []).append(i)
+        self._by_level = by_level
+        self._by_text = by_text
+        self._by_key = by_key
+        self._all = positions
+
+    def headings(self, level: int | None, text: str | None) -> list[int]:
+        """条件に合う見出しの位置（昇順）。"""
+        if self._all is None:
+            self._build()
+        if level is None and text is None:
+            return cast(list[int], self._all)
+        if level is None:
+            return self._by_text.get(cast(str, text), [])
+        if text is None:
+            return self._by_level.get(level, [])
+        return self._by_key.get((level, text), [])
+
+    def section_end(self, pos: int, level: int, end: int) -> int:
+        """``pos`` より後にある、レベル ``level`` 以下の最初の見出しの位置（なければ ``end``）。"""
+        if self._all is None:
+            self._build()
+        best = end
+        for lv, positions in self._by_level.items():
+            if lv <= level:
+                k = bisect_right(positions, pos)
+                if k < len(positions) and positions[k] < best:
+                    best = positions[k]
+        return best
+
+
 class NodeCursor:
     """ノード列を順に読み進める軽量カーソル。
 
     ノードは破壊的に消費される（`index` が進む）。必要なら `fork()` でコピーを取得できます。
+
+    カーソルは渡されたノード列をコピーせず、共有した列の上の ``[start, end)`` の
+    窓と現在位置だけを持つビューです。`fork` / `take` / `section` / `seek_heading`
+    はノード列をコピーしません（利用中のノード列は変更しないでください）。
+
+    コピーせずに範囲を参照したい場合は読み取り専用の `view` を使ってください。
+    ``nodes`` は従来どおりカーソル自身の `list` で、初めて参照した時点で範囲を
+    複製します。以降の巡回はその list を対象とするので、``cur.nodes.append(...)`` や
+    スライス代入はカーソルに反映されます（見出し索引は ``nodes`` を参照するたびに
+    破棄され、次の見出し検索で作り直されます）。
     """
 
     def __init__(
-        self, nodes: List[DocNode], front_matter: Optional[dict] = None
+        self, nodes: Sequence[DocNode], front_matter: Optional[dict] = None
     ) -> None:
         self.front_matter: dict = front_matter or {}
-        self.nodes: List[DocNode] = list(nodes)
+        self._bind(nodes)
         self.index: int = 0
 
+    def _bind(self, nodes: Sequence[DocNode]) -> None:
+        self._own: list[DocNode] | None = None
+        start, end = 0, len(nodes)
+        if isinstance(nodes, NodeView):
+            start, end = nodes.start, nodes.end
+            nodes = nodes._nodes
+        self._shared = _SharedNodes(nodes)
+        self._start = start
+        self._end = end
+
+    @classmethod
+    def _window(
+        cls, shared: _SharedNodes, start: int, end: int, front_matter: dict
+    ) -> "NodeCursor":
+        cur = cls.__new__(cls)
+        cur.front_matter = front_matter
+        cur._shared = shared
+        cur._start = start
+        cur._end = end
+        cur._own = None
+        cur.index = 0
+        return cur
+
+    def _stop(self) -> int:
+        # An owned list may grow or shrink through ``nodes``.
+        return self._end if self._own is None else len(self._own)
+
+    @property
+    def view(self) -> NodeView:
+        """カーソルの範囲全体（消費済みを含む）の読み取り専用ビュー（コピーしない）。"""
+        return NodeView(self._shared.nodes, self._start, self._stop())
+
+    @property
+    def nodes(self) -> List[DocNode]:
+        """カーソルの範囲全体（消費済みを含む）を保持するカーソル自身の list。
+
+        初回参照時に範囲を複製し、以降のカーソル操作はこの list を対象にします。
+        """
+        if self._own is None:
+            own = list(self.view)
+            self._shared = _SharedNodes(own)
+            self._start = 0
+            self._own = own
+        else:
+            self._shared = _SharedNodes(self._own)
+        return self._own
+
+    @nodes.setter
+    def nodes(self, nodes: Sequence[DocNode]) -> None:
+        """カーソルの対象を ``nodes`` に差し替える（``index`` はそのまま、fork には影響しない）。
+
+        list を渡すとコピーせずにそのまま ``nodes`` として保持します。
+        """
+        self._bind(nodes)
+        if isinstance(nodes, list):
+            self._own = nodes
+
     @property
     def done(self) -> bool:
-        return self.index >= len(self.nodes)
+        return self._start + self.index >= self._stop()
 
     def peek(self) -> Optional[DocNode]:
         """現在位置のノードを返す（進めない）。存在しなければ `None` を返す。"""
         if self.done:
             return None
-        return self.nodes[self.index]
+        return self._shared.nodes[self._start + self.index]
 
     def next(self) -> DocNode:
         """現在のノードを返してカーソルを進める。末尾で `StopIteration` を送出する。"""
         if self.done:
             raise StopIteration()
-        node = self.nodes[self.index]
+        node = self._shared.nodes[self._start + self.index]
         self.index += 1
         return node
 
@@ -60,12 +183,14 @@ class NodeCursor:
 
     def take_while(self, predicate: Callable[[DocNode], bool]) -> List[DocNode]:
         """predicate が True の間ノードを消費してリストで返す。"""
+        nodes = self._shared.nodes
+        pos = self._start + self.index
+        end = self._stop()
         out: List[DocNode] = []
-        while not self.done:
-            p = self.peek()
-            if p is None or not predicate(p):
-                break
-            out.append(self.next())
+        while pos < end and predicate(nodes[pos]):
+            out.append(nodes[pos])
+            pos += 1
+        self.index = pos - self._start
         return out
 
     def collect_paragraph_text(self) -> str:
@@ -80,8 +205,52 @@ class NodeCursor:
         return table.as_dict(ignore_extra_columns=ignore_extra_columns)
 
     def fork(self) -> "NodeCursor":
-        """現在位置から fork した新しいカーソルを返す（浅いコピー）。"""
-        return NodeCursor(self.nodes[self.index :], dict(self.front_matter))
+        """現在位置から fork した新しいカーソルを返す（ノード列は共有し、コピーしない）。"""
+        return NodeCursor._window(
+            self._shared,
+            self._start + self.index,
+            self._stop(),
+            dict(self.front_matter),
+        )
+
+    def take(self, count: int) -> "NodeCursor":
+        """次の ``count`` 個（残りが少なければ残り全部）を範囲とするカーソルを返し、その分進める。"""
+        pos = self._start + self.index
+        end = min(pos + max(count, 0), self._stop())
+        self.index = end - self._start
+        return NodeCursor._window(self._shared, pos, end, self.front_matter)
+
+    def seek_heading(
+        self, text: Optional[str] = None, level: Optional[int] = None
+    ) -> Optional[Heading]:
+        """現在位置以降で条件に合う最初の見出しまで進み、その見出しを返す（消費しない）。
+
+        ``text`` / ``level`` を省略するとその条件は問わない。見つからなければ位置は変えず
+        `None` を返す。見出し位置の索引（初回に 1 度だけ構築）を二分探索する。
+        """
+        positions = self._shared.headings(level, text)
+        pos = self._start + self.index
+        k = bisect_left(positions, pos)
+        if k == len(positions) or positions[k] >= self._stop():
+            return None
+        self.index = positions[k] - self._start
+        return cast(Heading, self._shared.nodes[positions[k]])
+
+    def section(self) -> "NodeCursor":
+        """現在の見出しから次の同レベル以上の見出しの直前までを範囲とするカーソルを返す。
+
+        返すカーソルは見出し自身を先頭に含む。このカーソルはセクションの直後まで進む。
+        現在のノードが `Heading` でなければ `ValueError` を送出する。
+        """
+        node = self.peek()
+        if not isinstance(node, Heading):
+            raise ValueError(
+                f"NodeCursor.section: expected Heading, got {type(node).__name__ if node is not None else 'EOF'}"
+            )
+        pos = self._start + self.index
+        end = self._shared.section_end(pos, node.level, self._stop())
+        self.index = end - self._start
+        return NodeCursor._window(self._shared, pos, end, self.front_matter)
 
     def __repr__(self) -> str:  # pragma: no cover - trivial
-        return f"<NodeCursor index={self.index} len={len(self.nodes)}>"
+        return f"<NodeCursor index={self.index} len={self._stop() - self._start}>"
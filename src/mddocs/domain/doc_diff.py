@@ -0,0 +1,414 @@
+"""src.domain.doc_diff
+
+2 つの文書（IR）の差分をノード単位で求めるモジュール。
+
+各ノードを内容から作るハッシュ可能なキー（`node_key`）に変換して整数 ID に
+写像し、ID 列に Myers の O(ND) 差分アルゴリズム（線形空間の中間スネーク分割）を
+適用します。共通の先頭・末尾はノードの等価比較だけで切り出すので、10 万ノードの
+文書でも変更が少なければ差分の計算はほぼ線形時間で終わります。
+
+変更された `Table` は行単位（行の追加・削除）とセル単位（同じ位置の行の値の変更）
+まで掘り下げます。結果は等しい部分を含まない簡潔な編集スクリプト（`DocDiff`）です::
+
+    diff = diff_documents(old_doc, new_doc)
+    for edit in diff.edits:
+        print(edit.tag, edit.old_start, edit.old_end, edit.new_start, edit.new_end)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass, field
+
+from mddocs.domain.doc_ir import (
+    BulletList,
+    DocNode,
+    Document,
+    Heading,
+    Image,
+    NumberedList,
+    Paragraph,
+    Table,
+)
+
+# ``(tag, old_start, old_end, new_start, new_end)`` in the format of
+# `difflib.SequenceMatcher.get_opcodes`.
+Opcode = tuple[str, int, int, int, int]
+
+
+def node_key(node: DocNode) -> Hashable:
+    """ノードの内容を表すハッシュ可能な値（等しいノードは等しい値になる）。"""
+    if isinstance(node, Table):
+        return ("table", tuple(node.headers), tuple(map(tuple, node.rows)))
+    if isinstance(node, Heading):
+        return ("heading", node.level, node.text)
+    if isinstance(node, Paragraph):
+        return ("paragraph", node.text)
+    if isinstance(node, BulletList):
+        return ("bullets", tuple(node.items))
+    if isinstance(node, NumberedList):
+        return ("numbered", tuple(node.items))
+    if isinstance(node, Image):
+        return ("image", node.alt, node.path)
+    raise TypeError(node)
+
+
+def _node_hash(node: DocNode) -> int:
+    """ノードの安価なハッシュ（等しいノードは等しい値）。
+
+    表はヘッダ・行数・先頭行だけから作るので、全セルは読まない。
+    """
+    t = type(node)
+    if t is Paragraph:
+        return hash(node.text)  # type: ignore[union-attr]
+    if t is Heading:
+        return hash((node.level, node.text))  # type: ignore[union-attr]
+    if isinstance(node, Table):
+        rows = node.rows
+        return hash(
+            (len(rows), tuple(node.headers), tuple(rows[0]) if len(rows) else ())
+        )
+    return hash(node_key(node))
+
+
+def _intern_nodes(*seqs: Sequence[DocNode]) -> list[list[int]]:
+    """各ノードを整数 ID に写像する（等しいノードは同じ ID）。
+
+    `_node_hash` が同じノードとはノードの等価比較で照合する（ハッシュが衝突しても
+    結果は正確）。衝突がなければノードごとに新しいコンテナを作らない（大きな文書で
+    循環参照 GC の走査を誘発しないため）。
+    """
+    first: dict[int, int] = {}
+    extra: dict[int, list[int]] = {}
+    reps: list[DocNode] = []
+    out: list[list[int]] = []
+    for seq in seqs:
+        ids: list[int] = []
+        for node in seq:
+            h = _node_hash(node)
+            rid = first.get(h)
+            if rid is None:
+                first[h] = len(reps)
+            elif reps[rid] is node or reps[rid] == node:
+                ids.append(rid)
+                continue
+            else:
+                for rid in extra.get(h, ()):
+                    if reps[rid] == node:
+                        break
+                else:
+                    rid = None
+                    extra.setdefault(h, []).append(len(reps))
+            if rid is None:
+                rid = len(reps)
+                reps.append(node)
+            ids.append(rid)
+        out.append(ids)
+    return out
+
+
+def _bisect(
+    a: list[int], b: list[int], a0: int, a1: int, b0: int, b1: int
+) -> tuple[int, int] | None:
+    """``a[a0:a1]`` と ``b[b0:b1]`` の最短編集経路上の中間点（絶対位置）を返す。
+
+    前方と後方から同時に探索し、経路が重なった点を返す。両区間とも空でなく、
+    先頭・末尾の要素が異なること。共通要素がまったくなければ ``None``。
+    """
+    n = a1 - a0
+    m = b1 - b0
+    max_d = (n + m + 1) // 2
+    offset = max_d
+    v_length = 2 * max_d + 2
+    v1 = [-1] * v_length
+    v2 = [-1] * v_length
+    v1[offset + 1] = 0
+    v2[offset + 1] = 0
+    delta = n - m
+    front = delta % 2 != 0
+    k1start = k1end = k2start = k2end = 0
+    for d in range(max_d):
+        for k1 in range(-d + k1start, d + 1 - k1end, 2):
+            k1_offset = offset + k1
+            if k1 == -d or (k1 != d and v1[k1_offset - 1] < v1[k1_offset + 1]):
+                x1 = v1[k1_offset + 1]
+            else:
+                x1 = v1[k1_offset - 1] + 1
+            y1 = x1 - k1
+            while x1 < n and y1 < m and a[a0 + x1] == b[b0 + y1]:
+                x1 += 1
+                y1 += 1
+            v1[k1_offset] = x1
+            if x1 > n:
+                k1end += 2  # ran off the right
+            elif y1 > m:
+                k1start += 2  # ran off the bottom
+            elif front:
+                k2_offset = offset + delta - k1
+                if 0 <= k2_offset < v_length and v2[k2_offset] != -1:
+                    if x1 >= n - v2[k2_offset]:
+                        return a0 + x1, b0 + y1
+        for k2 in range(-d + k2start, d + 1 - k2end, 2):
+            k2_offset = offset + k2
+            if k2 == -d or (k2 != d and v2[k2_offset - 1] < v2[k2_offset + 1]):
+                x2 = v2[k2_offset + 1]
+            else:
+                x2 = v2[k2_offset - 1] + 1
+            y2 = x2 - k2
+            while x2 < n and y2 < m and a[a1 - x2 - 1] == b[b1 - y2 - 1]:
+                x2 += 1
+                y2 += 1
+            v2[k2_offset] = x2
+            if x2 > n:
+                k2end += 2
+            elif y2 > m:
+                k2start += 2
+            elif not front:
+                k1_offset = offset + delta - k2
+                if 0 <= k1_offset < v_length and v1[k1_offset] != -1:
+                    x1 = v1[k1_offset]
+                    if x1 >= n - x2:
+                        return a0 + x1, b0 + x1 - (k1_offset - offset)
+    return None
+
+
+def _myers(a: list[int], b: list[int]) -> list[Opcode]:
+    """整数列 ``a`` を ``b`` に変える最短の編集を opcodes で返す。"""
+    ops: list[Opcode] = []
+
+    def emit(tag: str, i1: int, i2: int, j1: int, j2: int) -> None:
+        if ops:
+            ptag, p1, _, q1, _ = ops[-1]
+            if (ptag == "equal") == (tag == "equal"):
+                merged = tag if ptag == tag else "replace"
+                ops[-1] = (merged, p1, i2, q1, j2)
+                return
+        ops.append((tag, i1, i2, j1, j2))
+
+    # DFS over sub-ranges; ("equal", ...) items are common suffixes emitted
+    # after the range in front of them.
+    stack: list[tuple[bool, int, int, int, int]] = [(False, 0, len(a), 0, len(b))]
+    while stack:
+        is_suffix, a0, a1, b0, b1 = stack.pop()
+        if is_suffix:
+            emit("equal", a0, a1, b0, b1)
+            continue
+        p = 0
+        while a0 + p < a1 and b0 + p < b1 and a[a0 + p] == b[b0 + p]:
+            p += 1
+        if p:
+            emit("equal", a0, a0 + p, b0, b0 + p)
+            a0 += p
+            b0 += p
+        s = 0
+        while a0 < a1 - s and b0 < b1 - s and a[a1 - 1 - s] == b[b1 - 1 - s]:
+            s += 1
+        if s:
+            stack.append((True, a1 - s, a1, b1 - s, b1))
+            a1 -= s
+            b1 -= s
+        if a0 == a1 and b0 == b1:
+            continue
+        if a0 == a1:
+            emit("insert", a0, a0, b0, b1)
+            continue
+        if b0 == b1:
+            emit("delete", a0, a1, b0, b0)
+            continue
+        split = _bisect(a, b, a0, a1, b0, b1)
+        if split is None:
+            emit("delete", a0, a1, b0, b0)
+            emit("insert", a1, a1, b0, b1)
+            continue
+        x, y = split
+        stack.append((False, x, a1, y, b1))
+        stack.append((False, a0, x, b0, y))
+    return ops
+
+
+def diff_sequences(a: Sequence[Hashable], b: Sequence[Hashable]) -> list[Opcode]:
+    """``a`` を ``b`` に変える最短の編集を `SequenceMatcher.get_opcodes` の形式で返す。
+
+    要素は辞書で整数 ID に写像してから比較する（要素の比較はハッシュと等価比較）。
+    隣接する削除と挿入は ``"replace"`` にまとめる。
+    """
+    ids: dict[Hashable, int] = {}
+    ia = [ids.setdefault(k, len(ids)) for k in a]
+    ib = [ids.setdefault(k, len(ids)) for k in b]
+    return _myers(ia, ib)
+
+
+def node_opcodes(old: Sequence[DocNode], new: Sequence[DocNode]) -> list[Opcode]:
+    """``old`` を ``new`` に変える編集を opcodes（``"equal"`` を含む）で返す。
+
+    共通の先頭と末尾はノードの等価比較だけで切り出し、残った中間部分のノードだけを
+    ハッシュして `diff_sequences` にかける（表のハッシュは全セルを読まない）。
+    """
+    n, m = len(old), len(new)
+    lo = 0
+    while lo < n and lo < m and old[lo] == new[lo]:
+        lo += 1
+    hi = 0
+    while hi < n - lo and hi < m - lo and old[n - 1 - hi] == new[m - 1 - hi]:
+        hi += 1
+    ops: list[Opcode] = []
+    if lo:
+        ops.append(("equal", 0, lo, 0, lo))
+    if lo < n - hi or lo < m - hi:
+        a, b = _intern_nodes(old[lo : n - hi], new[lo : m - hi])
+        for tag, i1, i2, j1, j2 in _myers(a, b):
+            ops.append((tag, i1 + lo, i2 + lo, j1 + lo, j2 + lo))
+    if hi:
+        ops.append(("equal", n - hi, n, m - hi, m))
+    return ops
+
+
+@dataclass(slots=True)
+class CellChange:
+    """同じ位置にある行のセルの変更。
+
+    Attributes:
+        old_row: 旧表での行番号。
+        new_row: 新表での行番号。
+        column: 列番号。
+        old: 旧い値（旧い行にその列がなければ ``None``）。
+        new: 新しい値（新しい行にその列がなければ ``None``）。
+    """
+
+    old_row: int
+    new_row: int
+    column: int
+    old: str | None
+    new: str | None
+
+
+@dataclass(slots=True)
+class TableDiff:
+    """表の差分。
+
+    Attributes:
+        headers: ヘッダが変わった場合の ``(旧ヘッダ, 新ヘッダ)``。
+        rows: 行の挿入・削除の opcodes（``"insert"`` / ``"delete"``）。
+        cells: 置き換わった行の、値が変わったセル。置き換わった行の並びは
+            先頭から同じ数ずつ組にしてセル単位で比較し、余った行は `rows` に
+            挿入・削除として入れる。
+    """
+
+    headers: tuple[list[str], list[str]] | None = None
+    rows: list[Opcode] = field(default_factory=list)
+    cells: list[CellChange] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class NodeEdit:
+    """ノード列の 1 か所の編集（旧 ``[old_start, old_end)`` を新 ``[new_start, new_end)`` に）。
+
+    Attributes:
+        tag: ``"insert"`` / ``"delete"`` / ``"replace"``、または 1 つの表が
+            1 つの表に変わった ``"table"``（`table` に詳細）。
+        table: ``tag == "table"`` のときの `TableDiff`。
+    """
+
+    tag: str
+    old_start: int
+    old_end: int
+    new_start: int
+    new_end: int
+    table: TableDiff | None = None
+
+
+@dataclass(slots=True)
+class DocDiff:
+    """文書の差分（編集スクリプト）。
+
+    Attributes:
+        front_matter: 変わったフロントマターのキー → ``(旧い値, 新しい値)``
+            （追加・削除されたキーの欠けた側は ``None``）。
+        edits: ノード列の編集（旧い文書の位置順。等しい部分は含まない）。
+    """
+
+    front_matter: dict[str, tuple[str | None, str | None]] = field(default_factory=dict)
+    edits: list[NodeEdit] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.front_matter or self.edits)
+
+
+def diff_tables(old: Table, new: Table) -> TableDiff:
+    """2 つの表の差分を行単位・セル単位で求める。"""
+    result = TableDiff()
+    if list(old.headers) != list(new.headers):
+        result.headers = (list(old.headers), list(new.headers))
+    old_rows = [tuple(r) for r in old.rows]
+    new_rows = [tuple(r) for r in new.rows]
+    for op in diff_sequences(old_rows, new_rows):
+        tag, i1, i2, j1, j2 = op
+        if tag == "equal":
+            continue
+        if tag != "replace":
+            result.rows.append(op)
+            continue
+        k = min(i2 - i1, j2 - j1)
+        if i2 - i1 > k:
+            result.rows.append(("delete", i1 + k, i2, j2, j2))
+        elif j2 - j1 > k:
+            result.rows.append(("insert", i2, i2, j1 + k, j2))
+        for i, j in zip(range(i1, i1 + k), range(j1, j1 + k)):
+            a, b = old_rows[i], new_rows[j]
+            for c in range(max(len(a), len(b))):
+                va = a[c] if c < len(a) else None
+                vb = b[c] if c < len(b) else None
+                if va != vb:
+                    result.cells.append(CellChange(i, j, c, va, vb))
+    return result
+
+
+def diff_nodes(old: Sequence[DocNode], new: Sequence[DocNode]) -> list[NodeEdit]:
+    """ノード列の差分を編集の列で返す。
+
+    同じ数のノードどうしの置換のうち、表が表に変わった組は ``"table"`` の編集として
+    行・セル単位の差分を付ける。
+    """
+    edits: list[NodeEdit] = []
+    for tag, i1, i2, j1, j2 in node_opcodes(old, new):
+        if tag == "equal":
+            continue
+        if tag != "replace" or i2 - i1 != j2 - j1:
+            edits.append(NodeEdit(tag, i1, i2, j1, j2))
+            continue
+        run = -1  # start offset of the pending run of non-table replacements
+        for k in range(i2 - i1):
+            a, b = old[i1 + k], new[j1 + k]
+            if isinstance(a, Table) and isinstance(b, Table):
+                if run >= 0:
+                    edits.append(
+                        NodeEdit("replace", i1 + run, i1 + k, j1 + run, j1 + k)
+                    )
+                    run = -1
+                edits.append(
+                    NodeEdit(
+                        "table",
+                        i1 + k,
+                        i1 + k + 1,
+                        j1 + k,
+                        j1 + k + 1,
+                        diff_tables(a, b),
+                    )
+                )
+            elif run < 0:
+                run = k
+        if run >= 0:
+            edits.append(NodeEdit("replace", i1 + run, i2, j1 + run, j2))
+    return edits
+
+
+def diff_documents(old: Document, new: Document) -> DocDiff:
+    """2 つの文書のフロントマターとノード列の差分を返す。"""
+    front_matter: dict[str, tuple[str | None, str | None]] = {}
+    for key, value in old.front_matter.items():
+        if new.front_matter.get(key) != value or key not in new.front_matter:
+            front_matter[key] = (value, new.front_matter.get(key))
+    for key, value in new.front_matter.items():
+        if key not in old.front_matter:
+            front_matter[key] = (None, value)
+    return DocDiff(front_matter, diff_nodes(old.nodes, new.nodes))
@@ -4,13 +4,18 @@
 
 このモジュールはパース/レンダリングの中間表現として使用されるノード型を提供します。
 各ノードはシリアライズとデシリアライズがしやすい単純なデータ構造です。
+大量のノードを保持してもメモリを圧迫しないよう、`__slots__` 付きの dataclass
+（インスタンスごとの `__dict__` を持たない）として定義しています。
 """
 
-from dataclasses import dataclass
-from typing import Union
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Union, overload
 
 
-@dataclass
+@dataclass(slots=True)
 class Heading:
     """
     見出しノードを表します。
@@ -24,28 +29,28 @@ class Heading:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     """段落ノードを表します。"""
 
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BulletList:
     """箇条書きリスト（unordered list）を表します。"""
 
     items: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class NumberedList:
     """番号付きリスト（ordered list）を表します。"""
 
     items: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """表を表します。
 
@@ -86,7 +91,339 @@ class Table:
         return result
 
 
-@dataclass
+# Offsets start as 32-bit and widen to 64-bit once a column buffer outgrows it.
+_OFFSETS_TYPECODE = "I"
+_WIDE_OFFSETS_TYPECODE = "Q"
+# Pending cells per column are joined into one string every this many rows.
+_COLUMNAR_FLUSH_ROWS = 4096
+
+
+class ColumnarTable(Table):
+    """セルを列ごとに保持する `Table`（巨大な表向け）。
+
+    各列は全行のセルを連結した 1 つの文字列と、各セルの開始位置を並べた
+    オフセット配列（`array`）で表す。行ごとのリストやセルごとの `str` は
+    保持せず、アクセスされたときに切り出す。
+
+    - ``headers`` は通常のリスト。
+    - ``rows`` は読み取り専用の互換ビュー（`RowsView`）で、要素の行リストは
+      アクセスのたびに生成される**コピー**である。行リストを書き換えても表には
+      反映されない。内容を変えるには ``table.rows = [...]`` で置き換える。
+    - `column` は列単位のビュー（`ColumnView`）を返し、行オブジェクトを作らずに
+      列の値の走査・検索ができる。
+
+    `Table` のサブクラスなので、`isinstance(node, Table)` を前提とするコード
+    （レンダラ等）はそのまま動く。同じ内容の `Table` とは等価と判定される。
+    """
+
+    __slots__ = ("_columns", "_nrows", "_widths")
+
+    _columns: tuple[tuple[str, array], ...]
+    _nrows: int
+    _widths: array | None
+
+    @property  # type: ignore[override]
+    def rows(self) -> "RowsView":
+        return RowsView(self)
+
+    @rows.setter
+    def rows(self, rows: Iterable[Sequence[str]]) -> None:
+        builder = ColumnarTableBuilder([])
+        for row in rows:
+            builder.append(row)
+        self._columns, self._nrows, self._widths = builder._finish()
+
+    @classmethod
+    def from_table(cls, table: Table) -> "ColumnarTable":
+        """通常の `Table` から列指向の表を作る。"""
+        return cls(list(table.headers), table.rows)
+
+    @classmethod
+    def from_buffers(
+        cls,
+        headers: list[str],
+        columns: tuple[tuple[str, array], ...],
+        nrows: int,
+        widths: array | None = None,
+    ) -> "ColumnarTable":
+        """`buffers` の戻り値から表を復元する（検証は行わない）。"""
+        table = cls.__new__(cls)
+        table.headers = headers
+        table._columns = columns
+        table._nrows = nrows
+        table._widths = widths
+        return table
+
+    def buffers(
+        self,
+    ) -> tuple[tuple[tuple[str, array], ...], int, array | None]:
+        """内部表現 ``(columns, nrows, widths)`` を返す（シリアライズ用）。
+
+        ``columns`` は列ごとの ``(連結バッファ, オフセット配列)``、``widths`` は
+        行ごとのセル数（全行の列数が揃っていれば ``None``）。返した配列は
+        変更しないこと。
+        """
+        return self._columns, self._nrows, self._widths
+
+    def __reduce__(self):
+        return (
+            ColumnarTable.from_buffers,
+            (self.headers, self._columns, self._nrows, self._widths),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Table):
+            return NotImplemented
+        return self.headers == other.headers and self.rows == other.rows
+
+    def to_table(self) -> Table:
+        """行リストを実体化した通常の `Table` を返す。"""
+        return Table(list(self.headers), list(self.rows))
+
+    def copy(self) -> "ColumnarTable":
+        """``headers`` を共有しない複製を返す（列バッファは不変なので共有する）。"""
+        return ColumnarTable.from_buffers(
+            list(self.headers), self._columns, self._nrows, self._widths
+        )
+
+    def column(self, key: int | str) -> "ColumnView":
+        """列のビューを返す。``key`` は列番号かヘッダ名。
+
+        セルを持たない行（列数が足りない行）の値は ``""`` として扱う。
+
+        Raises:
+            KeyError: ``key`` がヘッダ名として見つからない場合。
+            IndexError: 列番号が範囲外の場合。
+        """
+        if isinstance(key, str):
+            try:
+                index = self.headers.index(key)
+            except ValueError:
+                raise KeyError(f"ColumnarTable.column: no header {key!r}") from None
+        else:
+            index = key
+        ncols = max(len(self.headers), len(self._columns))
+        if index < 0:
+            index += ncols
+        if not 0 <= index < ncols:
+            raise IndexError(f"ColumnarTable.column: index {key} out of range")
+        if index < len(self._columns):
+            buf, offsets = self._columns[index]
+        else:
+            buf, offsets = "", array(_OFFSETS_TYPECODE, [0]) * (self._nrows + 1)
+        return ColumnView(buf, offsets, self._nrows)
+
+    def _row(self, r: int) -> list[str]:
+        columns = self._columns
+        if self._widths is not None:
+            columns = columns[: self._widths[r]]
+        return [buf[offsets[r] : offsets[r + 1]] for buf, offsets in columns]
+
+    def as_dict(self, ignore_extra_columns: bool = False) -> dict[str, str]:
+        """`Table.as_dict` と同じ。列数が揃っていれば行リストを作らずに変換する。"""
+        ncols = len(self._columns)
+        if (
+            self._widths is not None
+            or ncols < 2
+            or (ncols > 2 and not ignore_extra_columns)
+        ):
+            # Ragged or invalid shapes: reuse the row-based checks and messages.
+            return Table.as_dict(self, ignore_extra_columns)
+        result: dict[str, str] = {}
+        for i, (key, val) in enumerate(zip(self.column(0), self.column(1))):
+            if key in result:
+                raise ValueError(
+                    f"Table.as_dict: duplicate key found: {key!r} at row {i}"
+                )
+            result[key] = val
+        return result
+
+
+class RowsView(Sequence[list[str]]):
+    """`ColumnarTable.rows` の読み取り専用ビュー。各行はアクセス時に生成する。"""
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table: ColumnarTable):
+        self._table = table
+
+    def __len__(self) -> int:
+        return self._table._nrows
+
+    @overload
+    def __getitem__(self, index: int) -> list[str]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[list[str]]: ...
+
+    def __getitem__(self, index: int | slice) -> list[str] | list[list[str]]:
+        n = self._table._nrows
+        if isinstance(index, slice):
+            return [self._table._row(r) for r in range(*index.indices(n))]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("ColumnarTable row index out of range")
+        return self._table._row(index)
+
+    def __iter__(self) -> Iterator[list[str]]:
+        row = self._table._row
+        for r in range(self._table._nrows):
+            yield row(r)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == list(b) for a, b in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class ColumnView(Sequence[str]):
+    """`ColumnarTable` の 1 列分のビュー。
+
+    走査・`index`・`count`・``in`` は列バッファとオフセット配列を直接使い、
+    行オブジェクトを作らない（`index` / `count` / ``in`` は該当セル以外の
+    `str` も作らない）。
+    """
+
+    __slots__ = ("_buf", "_offsets", "_n")
+
+    def __init__(self, buf: str, offsets: array, n: int):
+        self._buf = buf
+        self._offsets = offsets
+        self._n = n
+
+    def __len__(self) -> int:
+        return self._n
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self[r] for r in range(*index.indices(self._n))]
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("ColumnarTable column index out of range")
+        return self._buf[self._offsets[index] : self._offsets[index + 1]]
+
+    def __iter__(self) -> Iterator[str]:
+        buf = self._buf
+        offsets = iter(self._offsets)
+        start = next(offsets)
+        for end in offsets:
+            yield buf[start:end]
+            start = end
+
+    def _matches(self, value: str) -> Iterator[int]:
+        """``value`` と等しいセルの行番号を昇順に返す。"""
+        offsets = self._offsets
+        if not value:
+            for r in range(self._n):
+                if offsets[r] == offsets[r + 1]:
+                    yield r
+            return
+        buf = self._buf
+        size = len(value)
+        pos = buf.find(value)
+        while pos >= 0:
+            # The last row starting at ``pos`` (earlier ones are empty cells).
+            r = bisect_right(offsets, pos) - 1
+            if offsets[r] == pos and r < self._n and offsets[r + 1] == pos + size:
+                yield r
+                pos = buf.find(value, pos + size)
+            else:
+                pos = buf.find(value, pos + 1)
+
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        if isinstance(value, str):
+            for r in self._matches(value):
+                if r >= start and (stop is None or r < stop):
+                    return r
+        raise ValueError(f"{value!r} is not in column")
+
+    def count(self, value: Any) -> int:
+        if not isinstance(value, str):
+            return 0
+        return sum(1 for _ in self._matches(value))
+
+    def __contains__(self, value: object) -> bool:
+        return isinstance(value, str) and next(self._matches(value), None) is not None
+
+    def __repr__(self) -> str:
+        return f"ColumnView({list(self)!r})"
+
+
+class ColumnarTableBuilder:
+    """行を 1 行ずつ追加して `ColumnarTable` を組み立てる。
+
+    追加された行のリストは保持せず、セルは列ごとに一定行数ずつ連結していく
+    ため、巨大な表でも行オブジェクトの分だけメモリが膨らむことはない。
+    """
+
+    def __init__(self, headers: list[str]):
+        self.headers = headers
+        self._pending: list[list[str]] = []
+        self._chunks: list[list[str]] = []
+        self._offsets: list[array] = []
+        self._widths = array("I")
+        self._ragged = False
+        self._nrows = 0
+
+    def append(self, row: Sequence[str]) -> None:
+        """1 行分のセルを追加する。"""
+        width = len(row)
+        if width != len(self._pending):
+            self._ragged = self._ragged or self._nrows > 0
+            while len(self._pending) < width:
+                self._pending.append([])
+                self._chunks.append([])
+                self._offsets.append(array(_OFFSETS_TYPECODE, [0]) * (self._nrows + 1))
+            self._ragged = self._ragged or width < len(self._pending)
+        for c, offsets in enumerate(self._offsets):
+            if c < width:
+                value = row[c]
+                self._pending[c].append(value)
+                end = offsets[-1] + len(value)
+            else:
+                end = offsets[-1]
+            try:
+                offsets.append(end)
+            except OverflowError:
+                offsets = self._offsets[c] = array(_WIDE_OFFSETS_TYPECODE, offsets)
+                offsets.append(end)
+        self._widths.append(width)
+        self._nrows += 1
+        if self._nrows % _COLUMNAR_FLUSH_ROWS == 0:
+            for chunks, pending in zip(self._chunks, self._pending):
+                chunks.append("".join(pending))
+                pending.clear()
+
+    def _finish(self) -> tuple[tuple[tuple[str, array], ...], int, array | None]:
+        columns = tuple(
+            ("".join(chunks) + "".join(pending), offsets)
+            for chunks, pending, offsets in zip(
+                self._chunks, self._pending, self._offsets
+            )
+        )
+        widths = self._widths if self._ragged else None
+        return columns, self._nrows, widths
+
+    def build(self) -> ColumnarTable:
+        """追加済みの行から `ColumnarTable` を作る。"""
+        columns, nrows, widths = self._finish()
+        return ColumnarTable.from_buffers(self.headers, columns, nrows, widths)
+
+
+@dataclass(slots=True)
 class Image:
     """画像ノードを表します。"""
 
@@ -104,7 +441,41 @@ DocNode = Union[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
+class SourceSpan:
+    """ノードが由来するソース上の範囲。
+
+    Attributes:
+        start_line: 最初の行（0 始まり）。
+        end_line: 最後の行の次の行（排他的）。
+        start: 最初の行の先頭の文字位置（ソース文字列のインデックス）。
+        end: 最後の行の改行の直後の文字位置（排他的）。
+    """
+
+    start_line: int
+    end_line: int
+    start: int
+    end: int
+
+
+@dataclass(slots=True)
+class SourceMap:
+    """パース元のテキストと、各ノードのソース上の範囲。
+
+    Attributes:
+        text: パースしたテキスト全体。
+        spans: ``Document.nodes`` と同じ順・同じ数の `SourceSpan`。
+        body_start: 本文（フロントマターの直後）の文字位置。
+        body_start_line: 本文の最初の行（0 始まり）。
+    """
+
+    text: str
+    spans: list[SourceSpan]
+    body_start: int
+    body_start_line: int = 0
+
+
+@dataclass(slots=True)
 class Document:
     """
     ドキュメント全体を表す構造体。
@@ -112,7 +483,38 @@ class Document:
     Attributes:
         front_matter: コメントで表現したフロントマター（キー: 値の辞書）。
         nodes: ドキュメント本文を表す `DocNode` のリスト。
+        source: パース元のテキストと各ノードの範囲（ソース位置を記録する
+            パースでのみ設定される）。等価比較には含めない。
     """
 
     front_matter: dict[str, str]
     nodes: list[DocNode]
+    source: SourceMap | None = field(default=None, compare=False, repr=False)
+
+    def copy(self) -> "Document":
+        """ノード列・フロントマターを共有しない複製を返す。
+
+        キャッシュした `Document` を呼び出し側（`from_nodes` 等）の変更から
+        守るために使う。`copy.deepcopy` より高速な型ごとの複製を行う。
+        ``source`` は変更されないため共有する。
+        """
+        return Document(
+            dict(self.front_matter), [copy_node(n) for n in self.nodes], self.source
+        )
+
+
+def copy_node(node: DocNode) -> DocNode:
+    """ノードを、可変な属性（リスト）を共有しない形で複製して返す。"""
+    if isinstance(node, ColumnarTable):
+        return node.copy()
+    if isinstance(node, Table):
+        return Table(list(node.headers), [list(row) for row in node.rows])
+    if isinstance(node, (BulletList, NumberedList)):
+        return type(node)(list(node.items))
+    if isinstance(node, Heading):
+        return Heading(node.level, node.text)
+    if isinstance(node, Paragraph):
+        return Paragraph(node.text)
+    if isinstance(node, Image):
+        return Image(node.alt, node.path)
+    raise TypeError(node)
@@ -0,0 +1,357 @@
+"""src.domain.doc_schema
+
+宣言的なスキーマで `DocConvertible` を定義するためのモジュール。
+
+`to_nodes` / `from_cursor` を手書きする代わりに、クラス属性としてフィールドを
+宣言します::
+
+    class ApiSpec(DocSchema):
+        title = Title()
+        summary = Text("概要")
+        params = KeyValueTable("パラメータ", headers=("名前", "説明"))
+        tags = Items("タグ")
+        author = FrontMatter("author")
+
+フィールド宣言はクラス定義時に 1 度だけ `SchemaPlan`（読み込み・書き出しの手順）に
+コンパイルされ、クラスにキャッシュされます。読み込みはノード列を 1 回走査して
+必要な見出しの位置だけを集め（すべて見つかった時点で打ち切る）、各フィールドは
+見出しの直下（次の見出しの直前まで）の範囲から値を取り出します。
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Sequence
+from typing import Any, ClassVar, TypeVar
+
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_cursor import NodeCursor
+from mddocs.domain.doc_ir import (
+    BulletList,
+    DocNode,
+    Heading,
+    NumberedList,
+    Paragraph,
+    Table,
+)
+from mddocs.domain.doc_sections import NodeView
+
+
+S = TypeVar("S", bound="DocSchema")
+
+
+class SchemaField:
+    """スキーマのフィールド記述の基底クラス。
+
+    Attributes:
+        default: 対応する内容が文書にないときの値（そのまま共有される）。
+        required: ``True`` なら内容がないとき `ValueError` を送出する。
+        name: 宣言された属性名。コンパイル時にフィールドの複製に設定され、宣言した
+            インスタンス自体は変更されない（複数の属性・スキーマで共有できる）。
+    """
+
+    def __init__(self, *, default: Any = None, required: bool = False):
+        self.default = default
+        self.required = required
+        self.name = ""
+
+    def load(self, nodes: Sequence[DocNode], start: int, end: int) -> Any:
+        """見出し直下の ``nodes[start:end]`` から値を取り出す。"""
+        raise NotImplementedError
+
+    def dump(self, value: Any) -> list[DocNode]:
+        """値をノード列に変換する（値が ``None`` のときは呼ばれない）。"""
+        raise NotImplementedError
+
+
+class _SectionField(SchemaField):
+    """見出し（レベルとテキストの組）の直下の内容を値とするフィールド。"""
+
+    def __init__(
+        self,
+        heading: str,
+        level: int = 2,
+        *,
+        default: Any = None,
+        required: bool = False,
+    ):
+        super().__init__(default=default, required=required)
+        self.heading = heading
+        self.level = level
+
+    def _heading(self) -> Heading:
+        return Heading(level=self.level, text=self.heading)
+
+
+class Title(SchemaField):
+    """最初のレベル ``level`` の見出しのテキスト。"""
+
+    def __init__(self, level: int = 1, *, default: Any = None, required: bool = False):
+        super().__init__(default=default, required=required)
+        self.level = level
+
+    def dump(self, value: Any) -> list[DocNode]:
+        return [Heading(level=self.level, text=value)]
+
+
+class Text(_SectionField):
+    """見出し直下の段落を空行（``"\\n\\n"``）で連結した文字列。"""
+
+    def load(self, nodes: Sequence[DocNode], start: int, end: int) -> Any:
+        paras = []
+        for i in range(start, end):
+            node = nodes[i]
+            if isinstance(node, Paragraph):
+                paras.append(node.text)
+        return "\n\n".join(paras) if paras else self.default
+
+    def dump(self, value: Any) -> list[DocNode]:
+        out: list[DocNode] = [self._heading()]
+        out.extend(Paragraph(text=p) for p in value.split("\n\n") if p)
+        return out
+
+
+class KeyValueTable(_SectionField):
+    """見出し直下の最初の表を `Table.as_dict` で変換した辞書。"""
+
+    def __init__(
+        self,
+        heading: str,
+        level: int = 2,
+        *,
+        headers: tuple[str, str] = ("key", "value"),
+        ignore_extra_columns: bool = False,
+        default: Any = None,
+        required: bool = False,
+    ):
+        super().__init__(heading, level, default=default, required=required)
+        self.headers = headers
+        self.ignore_extra_columns = ignore_extra_columns
+
+    def load(self, nodes: Sequence[DocNode], start: int, end: int) -> Any:
+        for i in range(start, end):
+            node = nodes[i]
+            if isinstance(node, Table):
+                return node.as_dict(ignore_extra_columns=self.ignore_extra_columns)
+        return self.default
+
+    def dump(self, value: Any) -> list[DocNode]:
+        rows = [[str(k), str(v)] for k, v in value.items()]
+        return [self._heading(), Table(headers=list(self.headers), rows=rows)]
+
+
+class Items(_SectionField):
+    """見出し直下の最初のリストの項目（``ordered=True`` なら番号付きリスト）。"""
+
+    def __init__(
+        self,
+        heading: str,
+        level: int = 2,
+        *,
+        ordered: bool = False,
+        default: Any = None,
+        required: bool = False,
+    ):
+        super().__init__(heading, level, default=default, required=required)
+        self.ordered = ordered
+
+    def load(self, nodes: Sequence[DocNode], start: int, end: int) -> Any:
+        kind = NumberedList if self.ordered else BulletList
+        for i in range(start, end):
+            node = nodes[i]
+            if isinstance(node, kind):
+                return list(node.items)
+        return self.default
+
+    def dump(self, value: Any) -> list[DocNode]:
+        kind = NumberedList if self.ordered else BulletList
+        return [self._heading(), kind(items=list(value))]
+
+
+class FrontMatter(SchemaField):
+    """フロントマターのキー ``key`` の値。"""
+
+    def __init__(self, key: str, *, default: Any = None, required: bool = False):
+        super().__init__(default=default, required=required)
+        self.key = key
+
+    def dump(self, value: Any) -> list[DocNode]:
+        return []
+
+
+class SchemaPlan:
+    """コンパイル済みのスキーマ（フィールドの読み込み・書き出し手順）。
+
+    `DocSchema` のサブクラス定義時に作られ ``__schema_plan__`` に保持される。
+    """
+
+    def __init__(self, fields: Sequence[SchemaField]):
+        self.fields = tuple(fields)
+        sections: dict[tuple[int, str], list[tuple[str, Any]]] = {}
+        titles: dict[int, list[str]] = {}
+        self._front: tuple[tuple[str, str], ...] = tuple(
+            (f.name, f.key) for f in self.fields if isinstance(f, FrontMatter)
+        )
+        for f in self.fields:
+            if isinstance(f, _SectionField):
+                sections.setdefault((f.level, f.heading), []).append((f.name, f.load))
+            elif isinstance(f, Title):
+                titles.setdefault(f.level, []).append(f.name)
+        self._sections = {k: tuple(v) for k, v in sections.items()}
+        self._titles = {k: tuple(v) for k, v in titles.items()}
+        self._defaults = {f.name: f.default for f in self.fields}
+        self._required = tuple(f.name for f in self.fields if f.required)
+        self._n_located = len(self._sections) + len(self._titles)
+
+    @classmethod
+    def compile(cls, schema: type) -> SchemaPlan:
+        """``schema`` とその基底クラスで宣言された `SchemaField` を集めて手順を作る。
+
+        基底クラスのフィールドが先、同名のフィールドは派生クラスの宣言で置き換わる。
+        各フィールドは複製してから名前を付ける（``a = b = Text("X")`` のように
+        同じインスタンスを共有していても、互いの名前を上書きしない）。
+        """
+        found: dict[str, SchemaField] = {}
+        for klass in reversed(schema.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, SchemaField):
+                    bound = copy.copy(value)
+                    bound.name = name
+                    found[name] = bound
+        return cls(list(found.values()))
+
+    def load(
+        self, nodes: Sequence[DocNode], front_matter: dict | None = None
+    ) -> dict[str, Any]:
+        """ノード列とフロントマターからフィールド名→値の辞書を作る。
+
+        ノード列は 1 回だけ走査し、各フィールドの見出しの直後から次の見出しの直前
+        までを読む。同じ見出しが複数あるときは最初のものを使う。スキーマが参照する
+        見出しがすべて見つかった後は残りを読まない。
+        """
+        values = dict(self._defaults)
+        if front_matter:
+            for name, fm_key in self._front:
+                if fm_key in front_matter:
+                    values[name] = front_matter[fm_key]
+        sections, titles = self._sections, self._titles
+        remaining = self._n_located
+        seen: set[object] = set()
+        pending: tuple[tuple[str, Any], ...] = ()
+        start = i = 0
+        for i, node in enumerate(nodes):
+            if not isinstance(node, Heading):
+                continue
+            for name, load in pending:
+                values[name] = load(nodes, start, i)
+            pending = ()
+            if not remaining:
+                break
+            key = (node.level, node.text)
+            if key in sections and key not in seen:
+                seen.add(key)
+                remaining -= 1
+                pending = sections[key]
+                start = i + 1
+            if node.level in titles and node.level not in seen:
+                seen.add(node.level)
+                remaining -= 1
+                for name in titles[node.level]:
+                    values[name] = node.text
+        else:
+            for name, load in pending:
+                values[name] = load(nodes, start, len(nodes))
+        for name in self._required:
+            if values[name] is None:
+                raise ValueError(f"SchemaPlan.load: required field {name!r} is missing")
+        return values
+
+    def dump(self, values: Any) -> list[DocNode]:
+        """``values`` の属性からノード列を作る（値が ``None`` のフィールドは出力しない）。"""
+        out: list[DocNode] = []
+        for f in self.fields:
+            value = getattr(values, f.name)
+            if value is not None:
+                out.extend(f.dump(value))
+        return out
+
+    def front_matter(self, values: Any) -> dict:
+        """``values`` の属性から `FrontMatter` フィールドのフロントマターを作る。"""
+        out: dict = {}
+        for name, key in self._front:
+            value = getattr(values, name)
+            if value is not None:
+                out[key] = value
+        return out
+
+
+class DocSchema(DocConvertible):
+    """フィールド宣言から `to_nodes` / `from_nodes` を導出する `DocConvertible`。
+
+    インスタンスはフィールド名のキーワード引数で作る（省略したフィールドは
+    ``default``）。読み込みはコンパイル済みの ``__schema_plan__`` を使い、
+    ``from_cursor`` の有無の判定や汎用のカーソル処理を経由しない。
+    """
+
+    __schema_plan__: ClassVar[SchemaPlan] = SchemaPlan(())
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.__schema_plan__ = SchemaPlan.compile(cls)
+
+    def __init__(self, **values: Any):
+        for f in self.__schema_plan__.fields:
+            setattr(self, f.name, values.pop(f.name, f.default))
+        if values:
+            raise TypeError(
+                f"{type(self).__name__}: unexpected fields: {', '.join(sorted(values))}"
+            )
+
+    @classmethod
+    def _from_values(cls: type[S], values: dict[str, Any]) -> S:
+        if cls.__init__ is not DocSchema.__init__:
+            return cls(**values)
+        # 既定の __init__ なら属性を直接設定する（キーワード引数の展開と検証を省く）。
+        # __dict__ を直接更新すると __slots__ の属性に届かないため object.__setattr__ を使う。
+        obj = cls.__new__(cls)
+        set_attr = object.__setattr__
+        for name, value in values.items():
+            set_attr(obj, name, value)
+        return obj
+
+    @classmethod
+    def from_nodes(
+        cls: type[S], nodes: list[DocNode], front_matter: dict | None = None
+    ) -> S:
+        return cls._from_values(cls.__schema_plan__.load(nodes, front_matter))
+
+    @classmethod
+    def from_cursor(cls: type[S], cur: NodeCursor) -> S:
+        """カーソルの残りの範囲から読み込み、カーソルを末尾まで進める。
+
+        ``Model.from_cursor(cur.section())`` のように、セクション単位の読み込みにも使える。
+        """
+        view = cur.view
+        nodes = NodeView(view, cur.index)
+        cur.index = len(view)
+        return cls._from_values(cls.__schema_plan__.load(nodes, cur.front_matter))
+
+    def to_nodes(self) -> list[DocNode]:
+        return self.__schema_plan__.dump(self)
+
+    def to_front_matter(self) -> dict:
+        return self.__schema_plan__.front_matter(self)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, f.name) == getattr(other, f.name)
+            for f in self.__schema_plan__.fields
+        )
+
+    def __repr__(self) -> str:
+        args = ", ".join(
+            f"{f.name}={getattr(self, f.name)!r}" for f in self.__schema_plan__.fields
+        )
+        return f"{type(self).__name__}({args})"
@@ -0,0 +1,220 @@
+"""src.domain.doc_sections
+
+見出しレベルからノード列の階層（セクション／アウトライン）を組み立てるモジュール。
+
+`SectionTree` はノード列を 1 度だけ走査し、各見出しについて「その見出しから次の
+同レベル以上の見出しの直前まで」を 1 つの `Section` とする木を作ります。各セクションは
+ノード列上の半開区間 ``[start, end)`` を持ち、内容は `NodeView`（元のリストを
+コピーしないビュー）として取り出せます。
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from typing import overload
+
+from mddocs.domain.doc_ir import DocNode, Heading
+
+
+class NodeView(Sequence[DocNode]):
+    """ノード列の ``[start, end)`` 部分を指すビュー（要素はコピーしない）。
+
+    元のリストを変更するとビューの内容も変わる（構造を変えた場合、区間は
+    ずれたままになる）。独立したリストが必要なら `to_list` を使う。
+    """
+
+    __slots__ = ("_nodes", "start", "end")
+
+    _nodes: Sequence[DocNode]
+    start: int
+    end: int
+
+    def __init__(
+        self, nodes: Sequence[DocNode], start: int = 0, end: int | None = None
+    ):
+        size = len(nodes)
+        end = size if end is None else end
+        if not 0 <= start <= end <= size:
+            raise IndexError(f"NodeView: span [{start}, {end}) out of range")
+        if isinstance(nodes, NodeView):
+            # Views of views point at the underlying list directly.
+            start, end = nodes.start + start, nodes.start + end
+            nodes = nodes._nodes
+        self._nodes = nodes
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    @overload
+    def __getitem__(self, index: int) -> DocNode: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> NodeView: ...
+
+    def __getitem__(self, index: int | slice) -> DocNode | NodeView:
+        n = self.end - self.start
+        if isinstance(index, slice):
+            start, stop, step = index.indices(n)
+            if step != 1:
+                raise ValueError("NodeView: only contiguous slices are supported")
+            return NodeView(
+                self._nodes, self.start + start, self.start + max(start, stop)
+            )
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("NodeView index out of range")
+        return self._nodes[self.start + index]
+
+    def __iter__(self) -> Iterator[DocNode]:
+        nodes = self._nodes
+        for i in range(self.start, self.end):
+            yield nodes[i]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def to_list(self) -> list[DocNode]:
+        """ビューの内容を新しいリストとして返す。"""
+        return list(self._nodes[self.start : self.end])
+
+    def __repr__(self) -> str:
+        return f"NodeView([{self.start}, {self.end}))"
+
+
+class Section:
+    """1 つの見出しが支配する範囲。
+
+    Attributes:
+        heading: セクションの見出し（ルートでは ``None``）。
+        level: 見出しレベル（ルートは 0）。
+        start: 見出しノードの位置（ルートは 0）。
+        end: セクションの終端（次の同レベル以上の見出し、または末尾）。排他的。
+        children: 直下のサブセクション（出現順）。
+        parent: 親セクション（ルートでは ``None``）。
+        path: ルートからの見出しテキストの並び。
+    """
+
+    __slots__ = (
+        "heading",
+        "level",
+        "start",
+        "end",
+        "children",
+        "parent",
+        "path",
+        "_nodes",
+    )
+
+    def __init__(
+        self,
+        nodes: Sequence[DocNode],
+        heading: Heading | None,
+        start: int,
+        parent: Section | None,
+    ):
+        self._nodes = nodes
+        self.heading = heading
+        self.level = 0 if heading is None else heading.level
+        self.start = start
+        self.end = len(nodes)
+        self.children: list[Section] = []
+        self.parent = parent
+        if parent is None or heading is None:
+            self.path: tuple[str, ...] = ()
+        else:
+            self.path = parent.path + (heading.text,)
+
+    @property
+    def title(self) -> str | None:
+        return None if self.heading is None else self.heading.text
+
+    @property
+    def nodes(self) -> NodeView:
+        """見出しとサブセクションを含むセクション全体のビュー。"""
+        return NodeView(self._nodes, self.start, self.end)
+
+    @property
+    def body(self) -> NodeView:
+        """見出しの直後から最初のサブセクションの直前までのビュー。"""
+        start = self.start if self.heading is None else self.start + 1
+        end = self.children[0].start if self.children else self.end
+        return NodeView(self._nodes, start, end)
+
+    def child(self, title: str) -> Section | None:
+        """見出しテキストが ``title`` の最初の直下セクションを返す。"""
+        for c in self.children:
+            if c.title == title:
+                return c
+        return None
+
+    def walk(self) -> Iterator[Section]:
+        """このセクションと子孫を文書順（前順）に返す。"""
+        stack = [self]
+        while stack:
+            section = stack.pop()
+            yield section
+            stack.extend(reversed(section.children))
+
+    def __repr__(self) -> str:
+        return f"<Section {self.path!r} [{self.start}, {self.end})>"
+
+
+class SectionTree:
+    """ノード列のセクション木。構築は 1 パス（見出しのスタックで区間を閉じる）。
+
+    見出しパスによる検索（`find` / `find_all`）は辞書引きで定数時間、ノード位置から
+    セクションを求める `section_at` は二分探索で対数時間（＋木の深さ）。
+
+    ノード列を構造的に変更した場合は作り直すこと。
+    """
+
+    def __init__(self, nodes: Sequence[DocNode]):
+        self.nodes = nodes
+        self.root = Section(nodes, None, 0, None)
+        self._by_path: dict[tuple[str, ...], list[Section]] = {}
+        self._ordered: list[Section] = []
+        self._starts: list[int] = []
+        stack = [self.root]
+        for i, node in enumerate(nodes):
+            if not isinstance(node, Heading):
+                continue
+            while stack[-1].level >= node.level and stack[-1] is not self.root:
+                stack.pop().end = i
+            parent = stack[-1]
+            section = Section(nodes, node, i, parent)
+            parent.children.append(section)
+            stack.append(section)
+            self._by_path.setdefault(section.path, []).append(section)
+            self._ordered.append(section)
+            self._starts.append(i)
+
+    @property
+    def sections(self) -> list[Section]:
+        """ルートを除く全セクション（文書順）。"""
+        return list(self._ordered)
+
+    def find(self, path: Sequence[str]) -> Section | None:
+        """見出しパス（例: ``("API", "Errors")``）に一致する最初のセクションを返す。"""
+        found = self._by_path.get(tuple(path))
+        return found[0] if found else None
+
+    def find_all(self, path: Sequence[str]) -> list[Section]:
+        """見出しパスに一致するすべてのセクションを文書順に返す。"""
+        return list(self._by_path.get(tuple(path), ()))
+
+    def section_at(self, index: int) -> Section:
+        """位置 ``index`` のノードを含む最も内側のセクションを返す。"""
+        if not 0 <= index < len(self.nodes):
+            raise IndexError(f"SectionTree.section_at: index {index} out of range")
+        k = bisect_right(self._starts, index) - 1
+        section = self._ordered[k] if k >= 0 else self.root
+        while index >= section.end:
+            assert section.parent is not None
+            section = section.parent
+        return section
@@ -0,0 +1,82 @@
+"""src.domain.doc_source
+
+ソース位置付きでパースした文書を、変更されたノードだけ描画し直して書き戻すモジュール。
+
+`splice_source` は元の文書（``Document.source`` を持つもの）と新しい文書のノード列を
+`doc_diff.node_opcodes` で突き合わせ、一致したノードは元のテキストをそのまま使い、
+変更・追加されたノードだけを描画して元のテキストに差し込みます。手で整形された
+大きな文書の書式が保たれ、描画のコストは変更の大きさに比例します（ノードの比較は
+文書全体に対して行う）。
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from mddocs.domain.doc_diff import node_opcodes
+from mddocs.domain.doc_ir import Document
+
+
+def _line_ending(text: str) -> str:
+    nl = text.find("\n")
+    return "\r\n" if nl > 0 and text[nl - 1] == "\r" else "\n"
+
+
+def splice_source(
+    old: Document, new: Document, render: Callable[[Document], str]
+) -> str:
+    """``old`` のソースを元に、``new`` の内容を表すテキストを作る。
+
+    - ``old`` と等しいノードの並びは元のテキスト（間の空行を含む）をそのまま使う。
+    - 変更・追加されたノードの並びは ``render(Document({}, nodes))`` で描画する。
+    - フロントマターが変わっていなければ元のテキストを使い、変わっていれば
+      ``render(Document(front_matter, []))`` で描画する。
+    - 描画した部分の前後は元の空行（なければ空行 1 つ）で区切り、改行コードは
+      元のテキストに合わせる。
+
+    結果をパースすると ``new`` と同じフロントマター・ノード列になる。
+
+    Raises:
+        ValueError: ``old.source`` が ``None``（ソース位置なしでパースされた）の場合。
+    """
+    source = old.source
+    if source is None:
+        raise ValueError("splice_source: the original document has no source map")
+    text, spans = source.text, source.spans
+    eol = _line_ending(text)
+
+    def rendered(doc: Document) -> str:
+        out = render(doc).rstrip("\r\n") + "\n"
+        return out.replace("\n", eol) if eol != "\n" else out
+
+    body: list[str] = []
+    tail = ""
+    for tag, i1, i2, j1, j2 in node_opcodes(old.nodes, new.nodes):
+        if tag == "equal":
+            chunk = text[spans[i1].start : spans[i2 - 1].end]
+        elif j1 < j2:
+            chunk = rendered(Document({}, list(new.nodes[j1:j2])))
+        else:
+            continue  # deleted: the gap after the next chunk's predecessor is reused
+        if body:
+            if not body[-1].endswith(("\n", "\r")):
+                body.append(eol)  # last line of the original had no line ending
+            gap = (
+                text[spans[i1 - 1].end : spans[i1].start] if 0 < i1 < len(spans) else ""
+            )
+            body.append(gap or eol)
+        body.append(chunk)
+        tail = text[spans[-1].end :] if tag == "equal" and i2 == len(spans) else ""
+    first = spans[0].start if spans else len(text)
+
+    if new.front_matter == old.front_matter:
+        head = text[: source.body_start]
+        lead = text[source.body_start : first]
+    elif new.front_matter:
+        head = rendered(Document(new.front_matter, []))
+        lead = eol if body else ""
+    else:
+        head = lead = ""
+    if body and (head or lead) and not (head + lead).endswith(("\n", "\r")):
+        lead += eol  # the front matter ended the original without a line ending
+    return head + lead + "".join(body) + tail
@@ -12,43 +12,113 @@ from mddocs.domain.doc_ir import (
     Table,
     DocNode,
 )
-from typing import cast
+from mddocs.domain.doc_sections import Section, SectionTree
+from typing import TypeVar, cast
+
+_N = TypeVar("_N")
 
 
 class DocumentInspector:
     """`Document.nodes` を操作するためのユーティリティクラス。
 
     目的は、パース済みノード列から見出しや表、箇条書きなどを簡単に検索・取得することです。
+
+    最初の検索時にノード列を 1 度だけ走査して索引（ノード型ごと・見出しレベルごと・
+    ``(レベル, テキスト)`` ごと）を作り、以降の検索は索引を引くだけで済ませます。
+    検索のたびに索引を作ったときのノード列の複製と `nodes` を比較し（同一の要素は
+    同一性だけで比べるので走査より十分速い）、`nodes` の差し替え・要素の追加・削除・
+    置き換えがあれば索引を作り直すため、結果は常に現在のノード列を走査した結果と
+    一致します。ただしノードの属性をその場で書き換えた場合（``heading.text = ...``
+    など）は検出できないので、ノードを置き換えるか `reindex` を呼んでください。
     """
 
     def __init__(self, nodes: list[DocNode]):
         """ノード列で初期化します。"""
         self.nodes = nodes
+        self._snapshot: list[DocNode] | None = None
+        self._sections: SectionTree | None = None
+
+    def reindex(self) -> None:
+        """索引を破棄し、次の検索時に作り直させます。"""
+        self._snapshot = None
+        self._sections = None
+
+    def _index(self) -> None:
+        nodes = self.nodes
+        # List equality checks identity first, so an unchanged list costs one
+        # pointer comparison per node.
+        if self._snapshot is not None and self._snapshot == nodes:
+            return
+        by_type: dict[type, list[int]] = {}
+        by_level: dict[int, list[int]] = {}
+        by_heading: dict[tuple[int, str], list[int]] = {}
+        for i, n in enumerate(nodes):
+            cls = type(n)
+            positions = by_type.get(cls)
+            if positions is None:
+                by_type[cls] = [i]
+            else:
+                positions.append(i)
+            if isinstance(n, Heading):
+                by_level.setdefault(n.level, []).append(i)
+                by_heading.setdefault((n.level, n.text), []).append(i)
+        self._by_type = by_type
+        self._by_level = by_level
+        self._by_heading = by_heading
+        self._of_type_cache: dict[type, list[int]] = {}
+        self._sections = None
+        self._snapshot = list(nodes)
+
+    def _positions(self, cls: type) -> list[int]:
+        """``isinstance(node, cls)`` となるノードの位置（昇順）。"""
+        self._index()
+        positions = self._of_type_cache.get(cls)
+        if positions is None:
+            parts = [p for t, p in self._by_type.items() if issubclass(t, cls)]
+            if len(parts) == 1:
+                positions = parts[0]
+            else:
+                positions = sorted(i for part in parts for i in part)
+            self._of_type_cache[cls] = positions
+        return positions
+
+    def of_type(self, cls: type[_N]) -> list[_N]:
+        """``cls`` のインスタンス（サブクラスを含む）であるノードを出現順に返します。"""
+        nodes = self.nodes
+        return [cast(_N, nodes[i]) for i in self._positions(cls)]
 
     def find_heading(self, level: int) -> list[Heading]:
         """指定レベルの見出しをすべて返します。"""
-        return [n for n in self.nodes if isinstance(n, Heading) and n.level == level]
+        self._index()
+        nodes = self.nodes
+        return [cast(Heading, nodes[i]) for i in self._by_level.get(level, ())]
 
     def first_heading(self, level: int) -> Heading | None:
         """指定レベルの最初の見出しを返します。存在しなければ None を返します。"""
-        for n in self.nodes:
-            if isinstance(n, Heading) and n.level == level:
-                return n
-        return None
+        self._index()
+        positions = self._by_level.get(level)
+        return cast(Heading, self.nodes[positions[0]]) if positions else None
 
     def tables(self) -> list[Table]:
         """ドキュメント内のすべての `Table` ノードを `Table` 型のリストで返します。"""
-        return [cast(Table, n) for n in self.nodes if isinstance(n, Table)]
+        return self.of_type(Table)
 
     def bullet_list_after(self, heading_text: str, level: int) -> list[str]:
         """指定の見出しテキストの直後にある箇条書きを返します。なければ空リスト。"""
-        for i, n in enumerate(self.nodes):
-            if (
-                isinstance(n, Heading)
-                and n.level == level
-                and n.text == heading_text
-                and i + 1 < len(self.nodes)
-                and isinstance(self.nodes[i + 1], BulletList)
-            ):
-                return cast(BulletList, self.nodes[i + 1]).items
+        self._index()
+        nodes = self.nodes
+        for i in self._by_heading.get((level, heading_text), ()):
+            if i + 1 < len(nodes) and isinstance(nodes[i + 1], BulletList):
+                return cast(BulletList, nodes[i + 1]).items
         return []
+
+    def sections(self) -> SectionTree:
+        """見出しの階層から作ったセクション木を返します（索引と同様に再利用されます）。"""
+        self._index()
+        if self._sections is None:
+            self._sections = SectionTree(self.nodes)
+        return self._sections
+
+    def section(self, *path: str) -> Section | None:
+        """見出しパス（例: ``section("API", "Errors")``）に一致する最初のセクションを返します。"""
+        return self.sections().find(path)
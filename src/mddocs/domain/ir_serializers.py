@@ -5,6 +5,8 @@ to string representations. These functions are side-effect free and
 do not depend on external formatting libraries.
 """
 
+from typing import Iterator
+
 from mddocs.domain.doc_ir import (
     Heading,
     Paragraph,
@@ -42,16 +44,47 @@ def render_node(node: DocNode) -> str:
     raise TypeError(node)
 
 
+def iter_node_text(node: DocNode) -> Iterator[str]:
+    """`render_node` と同じテキストを断片ごとに返す（表は 1 行ずつ）。"""
+    if isinstance(node, Table):
+        yield "| " + " | ".join(node.headers) + " |\n"
+        yield "| " + " | ".join(["----"] * len(node.headers)) + " |\n"
+        for r in node.rows:
+            yield "| " + " | ".join(r) + " |\n"
+        return
+    yield render_node(node)
+
+
+def render_front_matter(front_matter: dict[str, str]) -> str:
+    out = ["<!--\n"]
+    for k, v in front_matter.items():
+        out.append(f"{k}: {v}\n")
+    out.append("-->\n")
+    return "".join(out)
+
+
 def document_to_markdown(doc: Document) -> str:
     out = []
     if doc.front_matter:
-        out.append("<!--\n")
-        for k, v in doc.front_matter.items():
-            out.append(f"{k}: {v}\n")
-        out.append("-->\n\n")
+        out.append(render_front_matter(doc.front_matter))
+        out.append("\n")
 
     for node in doc.nodes:
         out.append(render_node(node))
         out.append("\n")
 
     return "".join(out)
+
+
+def iter_markdown(doc: Document) -> Iterator[str]:
+    """`document_to_markdown` の出力を断片ごとに返す（連結すると同じ文字列になる）。
+
+    全体を 1 つの文字列に組み立てないため、巨大な表でも逐次書き出せる。
+    """
+    if doc.front_matter:
+        yield render_front_matter(doc.front_matter)
+        yield "\n"
+
+    for node in doc.nodes:
+        yield from iter_node_text(node)
+        yield "\n"
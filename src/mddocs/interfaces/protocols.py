@@ -8,27 +8,233 @@
 
 from __future__ import annotations
 
-from typing import Protocol
+import mmap
+from contextlib import AbstractContextManager
+from typing import Protocol, TextIO
 from pathlib import Path
 
 from mddocs.domain.doc_ir import Document
 
 
+class DocumentParseError(Exception):
+    """パーサが入力を解釈できない場合に送出する例外の基底クラス。
+
+    ユースケースはこの型だけを「入力が壊れている」として扱い、それ以外の例外は
+    プログラムの誤りとしてそのまま伝播させます。
+    """
+
+
 class DocumentParser(Protocol):
-    """文字列（Markdown）から `Document` を生成する責務を表すプロトコル。"""
+    """文字列（Markdown）から `Document` を生成する責務を表すプロトコル。
+
+    解釈できない入力に対しては `DocumentParseError`（のサブクラス）を送出する。
+    """
 
     def parse(self, text: str) -> Document: ...
 
 
+class FrontMatterParser(DocumentParser, Protocol):
+    """文書の先頭部分だけからフロントマターを取り出せるパーサ。"""
+
+    def parse_front_matter(
+        self, head: str, complete: bool = True
+    ) -> dict[str, str] | None:
+        """``head``（文書の先頭）からフロントマターを返す。
+
+        ``complete=False``（``head`` の後に続きがある）で、フロントマターの終わりが
+        ``head`` に含まれていない場合は ``None`` を返す（より長い先頭で再試行する）。
+        """
+        ...
+
+
+class SourceMappingParser(DocumentParser, Protocol):
+    """各ノードのソース上の範囲を記録できるパーサ。"""
+
+    def parse_with_source(self, text: str) -> Document:
+        """`parse` と同じ `Document` に、パース元のテキストと各ノードの範囲
+        （`SourceMap`）を ``source`` として付けて返す。"""
+        ...
+
+
+class IncrementalParser(SourceMappingParser, Protocol):
+    """テキストの編集に対して、影響するブロックだけを再パースできるパーサ。"""
+
+    def reparse(
+        self, doc: Document, offset: int, removed: int, inserted: str
+    ) -> Document:
+        """``doc.source.text`` の ``offset`` から ``removed`` 文字を ``inserted`` に
+        置き換えたテキストの `parse_with_source` と同じ `Document` を返す。"""
+        ...
+
+
+class BytesParser(DocumentParser, Protocol):
+    """UTF-8 のバイト列（メモリマップしたファイルなど）から直接パースできるパーサ。"""
+
+    def parse_bytes(self, data: bytes | mmap.mmap) -> Document:
+        """``data`` を UTF-8 の Markdown としてパースする（全体を 1 つの `str` にしない）。
+
+        結果は ``parse(str(data, "utf-8"))`` と同じでなければならない。
+        """
+        ...
+
+
 class DocumentRenderer(Protocol):
     """`Document` を文字列（Markdown）に変換する責務を表すプロトコル。"""
 
     def render(self, doc: Document) -> str: ...
 
 
+class TextWriter(Protocol):
+    """`StreamingRenderer.render_to` の出力先（``write(str)`` を持つもの）。"""
+
+    def write(self, s: str, /) -> int: ...
+
+
+class StreamingRenderer(DocumentRenderer, Protocol):
+    """文字列を組み立てずに、出力先へブロック単位で書き出せるレンダラ。
+
+    `render_to` が書き出す内容は `render` の戻り値と同一でなければならない。
+    """
+
+    def render_to(self, doc: Document, fp: TextWriter) -> None: ...
+
+
 class Storage(Protocol):
     """外部ストレージ（ファイル等）の読み書きを抽象化するプロトコル。"""
 
     def read(self, path: Path) -> str: ...
 
     def write(self, path: Path, content: str) -> None: ...
+
+
+class StatStorage(Storage, Protocol):
+    """内容を読まずに変更検知用のスタンプを返せるストレージ。
+
+    `stat` は内容が変わればほぼ確実に変わる値（例: ``(mtime_ns, size)``）を返す。
+    `ParseCache` はこれを使って未変更ファイルの読み込みを省略する。
+    """
+
+    def stat(self, path: Path) -> tuple[int, int]: ...
+
+
+class HeadStorage(Storage, Protocol):
+    """ファイルの先頭部分だけを読めるストレージ。"""
+
+    def read_head(self, path: Path, size: int) -> tuple[str, bool]:
+        """先頭から最大 ``size`` バイトを読み、``(text, at_eof)`` を返す。
+
+        末尾で切れたマルチバイト文字は ``text`` に含めない。``at_eof`` はファイルの
+        終わりまで読んだかどうか（``True`` なら ``text`` はファイル全体）。
+        """
+        ...
+
+
+class StreamingStorage(Storage, Protocol):
+    """書き込み用のテキストストリームを開けるストレージ。
+
+    `open_write` はバッファ付きのテキストファイルオブジェクトを返すコンテキスト
+    マネージャで、ブロックを抜けると内容が確定する。`StreamingRenderer` と組み
+    合わせると、保存時に文書全体を 1 つの文字列として保持せずに済む。
+    """
+
+    def open_write(self, path: Path) -> AbstractContextManager[TextIO]: ...
+
+
+class MappedStorage(Storage, Protocol):
+    """ファイルの内容を `str` にせず、バイト列（メモリマップ）として渡せるストレージ。
+
+    `BytesParser` と組み合わせると、読み込み時にファイル全体の `str` のコピーを
+    作らずに済む。
+    """
+
+    def open_mapped(self, path: Path) -> AbstractContextManager[bytes | mmap.mmap]: ...
+
+
+class ReplaceWriter(TextWriter, Protocol):
+    """`AtomicStorage.open_replace` が返す書き込み先。
+
+    ``with`` ブロックを抜けた後、``written`` は実際にファイルを置き換えたかどうかを示す
+    （内容が既存ファイルと同一で省略した場合は ``False``）。
+    """
+
+    written: bool
+
+
+class AtomicStorage(Storage, Protocol):
+    """既存ファイルと同じ内容の書き込みを省略し、必要な書き込みは原子的に行うストレージ。
+
+    書き込みは一時ファイル → fsync → rename で行うため、途中で失敗しても既存ファイルは
+    壊れない。内容が同一なら ``skip_unchanged`` で書き込み自体（mtime の更新も）を省略する。
+    """
+
+    def replace(self, path: Path, content: str, skip_unchanged: bool = True) -> bool:
+        """``content`` を書き込み、置き換えたら ``True``、省略したら ``False`` を返す。"""
+        ...
+
+    def open_replace(
+        self, path: Path, skip_unchanged: bool = True
+    ) -> AbstractContextManager[ReplaceWriter]: ...
+
+
+class ExactStorage(Storage, Protocol):
+    """改行コードを変換せずに読み書きできるストレージ。
+
+    `read` / `write` はテキストモード（universal newlines）で ``\r\n`` を ``\n`` に
+    読み替えるため、元のテキストをそのまま残す保存（``preserve_source``）では
+    こちらを使う。
+    """
+
+    def read_exact(self, path: Path) -> str:
+        """ファイルの内容を改行コードを含めてそのまま返す。"""
+        ...
+
+    def replace_exact(
+        self, path: Path, content: str, skip_unchanged: bool = True
+    ) -> bool:
+        """``content`` を改行コードを変換せずに原子的に書き込み、置き換えたかを返す。"""
+        ...
+
+
+class DirectoryWatcher(Protocol):
+    """ディレクトリ以下の Markdown ファイルの追加・変更・削除を通知するもの。"""
+
+    def files(self) -> list[Path]:
+        """監視対象のファイルの一覧（最後に確認した時点、パス順）。"""
+        ...
+
+    def poll(self, timeout: float | None = None) -> set[Path]:
+        """変更（追加・変更・削除）されたファイルを返す。
+
+        変更がなければ最大 ``timeout`` 秒（``None`` なら無期限）待ち、それでも
+        なければ空集合を返す。同じ変更は 1 度だけ返す。
+        """
+        ...
+
+    def close(self) -> None: ...
+
+
+class MetricsCollector(Protocol):
+    """処理段階ごとの所要時間と処理量を受け取るコレクタ。
+
+    `ConvertFileUsecase` やアダプタが段階（``"read"``, ``"parse"``, ``"mdformat"``
+    など）を終えるたびに呼ぶ。呼び出しは処理の途中で同期的に行われるため、
+    実装は軽量であること（集計や送信はまとめて後で行う）。
+    """
+
+    def record(
+        self, stage: str, seconds: float, n_bytes: int = 0, n_nodes: int = 0
+    ) -> None:
+        """``stage`` に ``seconds`` 秒かかったことを記録する。
+
+        ``n_bytes`` は入出力した UTF-8 のバイト数、``n_nodes`` は扱ったノード数
+        （その段階に当てはまらなければ 0）。
+        """
+        ...
+
+
+class AsyncStorage(Protocol):
+    """`Storage` の非同期版。イベントループをブロックせずに読み書きする。"""
+
+    async def read(self, path: Path) -> str: ...
+
+    async def write(self, path: Path, content: str) -> None: ...
@@ -0,0 +1,98 @@
+"""Usecase 層: `ConvertFileUsecase` の asyncio 版
+
+I/O は `AsyncStorage` に、パース・`from_nodes`・`to_nodes`・レンダリング（`mdformat`
+を含む）といった CPU 処理は executor に逃がし、イベントループを止めずに多数の
+ドキュメント要求を同時に処理できるようにする。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Optional, Type
+
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.interfaces.protocols import AsyncStorage, DocumentParser, DocumentRenderer
+from mddocs.usecase.convert_usecase import model_to_document
+
+
+class AsyncConvertFileUsecase:
+    """ファイル ↔ ドメインオブジェクトの変換を非同期に扱うユースケース
+
+    依存性はコンストラクタで注入される: parser, renderer, storage（`AsyncStorage`）
+
+    Args:
+        executor: CPU 処理を実行する executor。省略時はイベントループの既定
+            executor（スレッドプール）。GIL を避けて並列化したい場合は
+            `ProcessPoolExecutor` を渡す（parser / renderer / モデルが pickle 可能
+            である必要がある）。
+        max_concurrency: 同時に処理する load / save の上限（イベントループごと）。
+            上限を数えるセマフォは実行中のイベントループごとに作るので、1 つの
+            インスタンスを複数の ``asyncio.run()`` で使い回せる。
+    """
+
+    def __init__(
+        self,
+        parser: DocumentParser,
+        renderer: DocumentRenderer,
+        storage: AsyncStorage,
+        executor: Optional[Executor] = None,
+        max_concurrency: int = 16,
+    ):
+        if max_concurrency <= 0:
+            raise ValueError(
+                "AsyncConvertFileUsecase: max_concurrency must be positive"
+            )
+        self.parser = parser
+        self.renderer = renderer
+        self.storage = storage
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self._limits: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def _limit(self) -> asyncio.Semaphore:
+        """実行中のイベントループに属するセマフォ（初回に作る）。"""
+        loop = asyncio.get_running_loop()
+        limit = self._limits.get(loop)
+        if limit is None:
+            limit = self._limits[loop] = asyncio.Semaphore(self.max_concurrency)
+        return limit
+
+    async def load_model_from_path(
+        self, path: Path, model_cls: Type[DocConvertible]
+    ) -> DocConvertible:
+        """パスから Markdown を読み込み、`model_cls` のインスタンスを返す。
+
+        Raises:
+            Exception: パースエラーや変換エラーはそのまま伝搬する。
+        """
+        async with self._limit():
+            text = await self.storage.read(path)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, _parse_to_model, self.parser, text, model_cls
+            )
+
+    async def save_model_to_path(self, model: DocConvertible, path: Path) -> None:
+        """モデルを Markdown 文字列に変換して指定パスへ保存する。"""
+        async with self._limit():
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(
+                self.executor, _render_model, self.renderer, model
+            )
+            await self.storage.write(path, text)
+
+
+def _parse_to_model(
+    parser: DocumentParser, text: str, model_cls: Type[DocConvertible]
+) -> DocConvertible:
+    doc = parser.parse(text)
+    return model_cls.from_nodes(doc.nodes, doc.front_matter)
+
+
+def _render_model(renderer: DocumentRenderer, model: DocConvertible) -> str:
+    return renderer.render(model_to_document(model))
@@ -6,25 +6,147 @@
 
 from __future__ import annotations
 
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Type
+from typing import Iterable, Optional, Type
 
-from mddocs.interfaces.protocols import DocumentParser, DocumentRenderer, Storage
+from mddocs.interfaces.protocols import (
+    DocumentParseError,
+    DocumentParser,
+    DocumentRenderer,
+    MetricsCollector,
+    Storage,
+)
 from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_ir import Document
+from mddocs.domain.doc_source import splice_source
+from mddocs.usecase.parse_cache import ParseCache
+
+# First read size of `ConvertFileUsecase.load_front_matter`; grows 4x per retry.
+_FRONT_MATTER_HEAD = 4096
+
+
+@dataclass
+class LoadResult:
+    """`ConvertFileUsecase.load_models_from_paths` の 1 ファイル分の結果。
+
+    Attributes:
+        path: 読み込んだパス。
+        model: 生成したモデル。失敗時は `None`。
+        error: 読み込み・パース・変換で発生した例外。成功時は `None`。
+    """
+
+    path: Path
+    model: Optional[DocConvertible] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class SaveStats:
+    """`ConvertFileUsecase.save_model_to_path` の累計結果。
+
+    Attributes:
+        written: ファイルを書き込んだ回数。
+        skipped: 内容が既存ファイルと同一のため書き込みを省略した回数。
+    """
+
+    written: int = 0
+    skipped: int = 0
+
+
+def _read_document(parser: DocumentParser, storage: Storage, path: Path) -> Document:
+    """``path`` を読み込んでパースする。
+
+    storage が `MappedStorage`、parser が `BytesParser` なら、ファイルを `str` に
+    読み込まずにメモリマップしたバイト列をそのままパースする。
+    """
+    open_mapped = getattr(storage, "open_mapped", None)
+    parse_bytes = getattr(parser, "parse_bytes", None)
+    if open_mapped is not None and parse_bytes is not None:
+        with open_mapped(path) as data:
+            return parse_bytes(data)
+    return parser.parse(storage.read(path))
+
+
+def _load_chunk(
+    parser: DocumentParser,
+    storage: Storage,
+    model_cls: Type[DocConvertible],
+    paths: list[Path],
+) -> list[tuple[Optional[DocConvertible], Optional[BaseException]]]:
+    """ワーカープロセスで複数ファイルを順に読み込む（エラーはファイル単位で返す）。"""
+    out: list[tuple[Optional[DocConvertible], Optional[BaseException]]] = []
+    for path in paths:
+        try:
+            doc = _read_document(parser, storage, path)
+            out.append((model_cls.from_nodes(doc.nodes, doc.front_matter), None))
+        except Exception as e:
+            out.append((None, e))
+    return out
+
+
+def _chunk_paths(
+    paths: list[Path], storage: Storage, chunk_bytes: int, max_files: int
+) -> list[list[Path]]:
+    """小さいファイルをまとめて IPC コストを償却するため、連続するパスを束ねる。
+
+    サイズは `StatStorage.stat` が使えればそれを用い、なければ件数だけで区切る。
+    """
+    stat = getattr(storage, "stat", None)
+    chunks: list[list[Path]] = []
+    current: list[Path] = []
+    current_bytes = 0
+    for path in paths:
+        size = 0
+        if stat is not None:
+            try:
+                size = stat(path)[1]
+            except OSError:
+                size = 0  # the error surfaces when the worker reads the file
+        if current and (
+            current_bytes + size > chunk_bytes or len(current) >= max_files
+        ):
+            chunks.append(current)
+            current, current_bytes = [], 0
+        current.append(path)
+        current_bytes += size
+    if current:
+        chunks.append(current)
+    return chunks
 
 
 class ConvertFileUsecase:
     """ファイル → ドメインオブジェクト、ドメインオブジェクト → ファイル を扱うユースケース
 
     依存性はコンストラクタで注入される: parser, renderer, storage
+    任意で `ParseCache` を渡すと、読み込み時のパース結果をキャッシュする。
+    任意で `MetricsCollector` を渡すと、段階ごとの所要時間・バイト数・ノード数を
+    記録する（読み込み: ``read`` / ``parse`` / ``load``（キャッシュ経由）/
+    ``from_nodes``、保存: ``to_nodes`` / ``render`` / ``write`` / ``replace``、
+    ストリーム保存では描画と書き込みをまとめた ``render_write``）。
     """
 
     def __init__(
-        self, parser: DocumentParser, renderer: DocumentRenderer, storage: Storage
+        self,
+        parser: DocumentParser,
+        renderer: DocumentRenderer,
+        storage: Storage,
+        cache: ParseCache | None = None,
+        metrics: MetricsCollector | None = None,
     ):
         self.parser = parser
         self.renderer = renderer
         self.storage = storage
+        self.cache = cache
+        self.metrics = metrics
+        self._save_stats = SaveStats()
 
     def load_model_from_path(
         self, path: Path, model_cls: Type[DocConvertible]
@@ -34,35 +156,317 @@ class ConvertFileUsecase:
         Raises:
             Exception: パースエラーや変換エラーはそのまま伝搬する（呼び出し側でハンドリング）。
         """
-        text = self.storage.read(path)
-        doc = self.parser.parse(text)
+        doc = self.load_document(path)
         # Pass front_matter through to the model factory so implementations
         # that rely on front_matter (or from_cursor) can access it.
-        return model_cls.from_nodes(doc.nodes, doc.front_matter)
-
-    def save_model_to_path(self, model: DocConvertible, path: Path) -> None:
-        """モデルを Markdown 文字列に変換して指定パスへ保存する。"""
-        nodes = model.to_nodes()
-        # ラッパー Document を生成してレンダラへ渡す。フロントマターはモデル側で必要に応じ提供される想定
-        from mddocs.domain.doc_ir import Document
-
-        # Allow models to optionally provide front_matter. Preferred hooks:
-        # - model.to_front_matter() -> dict
-        # - model.front_matter attribute
-        fm = {}
-        if hasattr(model, "to_front_matter") and callable(
-            getattr(model, "to_front_matter")
-        ):
-            try:
-                fm = model.to_front_matter()
-            except Exception:
-                fm = {}
-        elif hasattr(model, "front_matter"):
+        if self.metrics is None:
+            return model_cls.from_nodes(doc.nodes, doc.front_matter)
+        t0 = time.perf_counter()
+        model = model_cls.from_nodes(doc.nodes, doc.front_matter)
+        self.metrics.record(
+            "from_nodes", time.perf_counter() - t0, n_nodes=len(doc.nodes)
+        )
+        return model
+
+    def load_document(self, path: Path) -> Document:
+        """パスから Markdown を読み込み `Document` を返す（キャッシュがあれば経由する）。
+
+        storage が `MappedStorage`、parser が `BytesParser` を満たす場合（キャッシュ
+        なし）は、ファイル全体の `str` を作らずにメモリマップから直接パースする。
+        """
+        m = self.metrics
+        if m is None:
+            if self.cache is not None:
+                return self.cache.load(path, self.storage, self.parser)
+            return _read_document(self.parser, self.storage, path)
+        t0 = time.perf_counter()
+        if self.cache is not None:
+            doc = self.cache.load(path, self.storage, self.parser)
+            m.record("load", time.perf_counter() - t0, n_nodes=len(doc.nodes))
+            return doc
+        open_mapped = getattr(self.storage, "open_mapped", None)
+        parse_bytes = getattr(self.parser, "parse_bytes", None)
+        if open_mapped is not None and parse_bytes is not None:
+            # Reading and parsing are interleaved: one "parse" stage.
+            with open_mapped(path) as data:
+                doc = parse_bytes(data)
+                n_bytes = len(data)
+            m.record(
+                "parse",
+                time.perf_counter() - t0,
+                n_bytes=n_bytes,
+                n_nodes=len(doc.nodes),
+            )
+            return doc
+        text = self.storage.read(path)
+        t1 = time.perf_counter()
+        m.record("read", t1 - t0, n_bytes=len(text.encode("utf-8")))
+        doc = self.parser.parse(text)
+        m.record("parse", time.perf_counter() - t1, n_nodes=len(doc.nodes))
+        return doc
+
+    def load_front_matter(self, path: Path) -> dict:
+        """パスの Markdown のフロントマターだけを返す（本文は読まない）。
+
+        storage が `HeadStorage`、parser が `FrontMatterParser` を満たす場合は先頭の
+        数 KB だけを読み、``-->`` が含まれていなければ読む量を 4 倍にして読み直す。
+        それ以外の組み合わせでは `load_document` で文書全体を読み込む。
+        """
+        read_head = getattr(self.storage, "read_head", None)
+        parse = getattr(self.parser, "parse_front_matter", None)
+        if read_head is None or parse is None:
+            return self.load_document(path).front_matter
+        size = _FRONT_MATTER_HEAD
+        while True:
+            head, at_eof = read_head(path, size)
+            front_matter = parse(head, at_eof)
+            if front_matter is not None:
+                return front_matter
+            size *= 4
+
+    def load_models_from_paths(
+        self,
+        paths: Iterable[Path],
+        model_cls: Type[DocConvertible],
+        workers: Optional[int] = None,
+        chunk_bytes: int = 1 << 20,
+        max_files_per_chunk: int = 256,
+        executor: Executor | None = None,
+    ) -> list[LoadResult]:
+        """複数パスを読み込み、入力と同じ順序で `LoadResult` のリストを返す。
+
+        読み込み・パース・`from_nodes` はプロセスプールで並列に実行する（パースは
+        純 Python の CPU 処理のためスレッドでは速くならない）。小さいファイルは
+        ``chunk_bytes`` / ``max_files_per_chunk`` を上限に束ねて 1 タスクとして送る。
+
+        - 失敗はファイル単位で `LoadResult.error` に記録し、バッチ全体は止めない。
+        - ``workers`` が 1 以下なら現在のプロセスで順に処理する（既定は CPU 数）。
+        - ``executor`` を渡すとプールを作らずにそれへチャンクを送る（``workers`` は
+          無視する）。繰り返し呼ぶ場合にプロセスの起動を 1 度で済ませられる。
+          閉じるのは呼び出し側。
+        - parser / storage / model_cls と生成モデルはプロセス間で pickle 可能で
+          ある必要がある。`ParseCache` はワーカーでは使われない。
+        """
+        paths = list(paths)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        chunks = _chunk_paths(paths, self.storage, chunk_bytes, max_files_per_chunk)
+
+        if executor is not None:
+            return self._load_chunks(executor, chunks, model_cls)
+        results: list[LoadResult] = []
+        if workers <= 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                for path, (model, error) in zip(
+                    chunk, _load_chunk(self.parser, self.storage, model_cls, chunk)
+                ):
+                    results.append(LoadResult(path, model, error))
+            return results
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            return self._load_chunks(pool, chunks, model_cls)
+
+    def _load_chunks(
+        self,
+        executor: Executor,
+        chunks: list[list[Path]],
+        model_cls: Type[DocConvertible],
+    ) -> list[LoadResult]:
+        futures = [
+            executor.submit(_load_chunk, self.parser, self.storage, model_cls, chunk)
+            for chunk in chunks
+        ]
+        results: list[LoadResult] = []
+        for chunk, future in zip(chunks, futures):
             try:
-                fm = getattr(model, "front_matter") or {}
-            except Exception:
-                fm = {}
+                loaded = future.result()
+            except Exception as e:
+                # e.g. an unpicklable model or exception: fail the chunk only.
+                loaded = [(None, e)] * len(chunk)
+            for path, (model, error) in zip(chunk, loaded):
+                results.append(LoadResult(path, model, error))
+        return results
+
+    def save_model_to_path(
+        self,
+        model: DocConvertible,
+        path: Path,
+        skip_unchanged: bool = False,
+        preserve_source: bool = False,
+    ) -> bool:
+        """モデルを Markdown 文字列に変換して指定パスへ保存する。
+
+        renderer が `StreamingRenderer`、storage が `StreamingStorage` を満たす場合は
+        文字列全体を組み立てず、`open_write` のストリームへ直接書き出す。
+        `FileStorage.open_write` は一時ファイルに書いて成功時に rename するため、
+        描画に失敗しても既存ファイルは変わらない（fsync はしないので、直接書き込む
+        場合に比べて増えるのは一時ファイルの作成と rename だけ）。それ以外の
+        storage では全体を描画してから `write` する。
+
+        ``skip_unchanged=True`` のときは出力が既存ファイルと同一なら書き込まない。
+        storage が `AtomicStorage` なら比較はストリーム上で行い、必要な書き込みは
+        一時ファイル → fsync → rename で原子的に行う。
 
-        doc = Document(front_matter=fm, nodes=nodes)
+        ``preserve_source=True`` のときは既存ファイルをソース位置付きでパースし
+        （parser が `SourceMappingParser` の場合）、内容が変わっていないノードは元の
+        テキストをそのまま残し、変更・追加されたノードとフロントマターだけを描画して
+        差し込む（`splice_source`）。storage が `ExactStorage` なら改行コード（CRLF など）も
+        元のまま読み書きする。既存ファイルがない・パースできない、またはパーサが
+        対応していない場合は通常どおり全体を描画する。
+
+        Returns:
+            書き込んだら ``True``、省略したら ``False``。件数は `save_stats` で参照できる。
+        """
+        m = self.metrics
+        t0 = time.perf_counter() if m is not None else 0.0
+        doc = model_to_document(model)
+        if m is not None:
+            m.record("to_nodes", time.perf_counter() - t0, n_nodes=len(doc.nodes))
+        written = True
+        spliced = self._splice(doc, path) if preserve_source else None
+        if spliced is not None:
+            written = self._write_spliced(path, spliced, skip_unchanged)
+        elif skip_unchanged:
+            written = self._replace_document(doc, path)
+        else:
+            render_to = getattr(self.renderer, "render_to", None)
+            open_write = getattr(self.storage, "open_write", None)
+            if render_to is not None and open_write is not None:
+                t0 = time.perf_counter() if m is not None else 0.0
+                with open_write(path) as fp:
+                    render_to(doc, fp)
+                if m is not None:
+                    m.record("render_write", time.perf_counter() - t0)
+            else:
+                self._write(path, self._render(doc))
+        if written:
+            self._save_stats.written += 1
+        else:
+            self._save_stats.skipped += 1
+        return written
+
+    def _render(self, doc: Document) -> str:
+        if self.metrics is None:
+            return self.renderer.render(doc)
+        t0 = time.perf_counter()
         text = self.renderer.render(doc)
+        self.metrics.record(
+            "render", time.perf_counter() - t0, n_bytes=len(text.encode("utf-8"))
+        )
+        return text
+
+    def _splice(self, doc: Document, path: Path) -> str | None:
+        """既存ファイルのテキストに ``doc`` の変更部分だけを差し込んだテキスト。
+
+        既存ファイルがない、またはパースできない場合は ``None``（全体を描画する）。
+        storage が `ExactStorage` なら改行コードを変換せずに読む。
+        """
+        parse = getattr(self.parser, "parse_with_source", None)
+        if parse is None:
+            return None
+        read = getattr(self.storage, "read_exact", None) or self.storage.read
+        try:
+            original = read(path)
+        except FileNotFoundError:
+            return None
+        m = self.metrics
+        t0 = time.perf_counter() if m is not None else 0.0
+        try:
+            old = parse(original)
+        except DocumentParseError:
+            return None  # the new model replaces whatever is there
+        if old.source is None:
+            return None
+        text = splice_source(old, doc, self._render)
+        if m is not None:
+            m.record(
+                "splice",
+                time.perf_counter() - t0,
+                n_bytes=len(text.encode("utf-8")),
+                n_nodes=len(doc.nodes),
+            )
+        return text
+
+    def _write_spliced(self, path: Path, text: str, skip_unchanged: bool) -> bool:
+        """`_splice` の結果を書き込む。`ExactStorage` なら改行コードを変換しない。"""
+        replace_exact = getattr(self.storage, "replace_exact", None)
+        if replace_exact is None:
+            if skip_unchanged:
+                return self._replace_text(path, text)
+            self._write(path, text)
+            return True
+        m = self.metrics
+        t0 = time.perf_counter() if m is not None else 0.0
+        written = replace_exact(path, text, skip_unchanged)
+        if m is not None:
+            m.record("replace", time.perf_counter() - t0)
+        return written
+
+    def _write(self, path: Path, text: str) -> None:
+        if self.metrics is None:
+            self.storage.write(path, text)
+            return
+        t0 = time.perf_counter()
         self.storage.write(path, text)
+        self.metrics.record(
+            "write", time.perf_counter() - t0, n_bytes=len(text.encode("utf-8"))
+        )
+
+    def _replace_document(self, doc: Document, path: Path) -> bool:
+        open_replace = getattr(self.storage, "open_replace", None)
+        render_to = getattr(self.renderer, "render_to", None)
+        if open_replace is not None and render_to is not None:
+            m = self.metrics
+            t0 = time.perf_counter() if m is not None else 0.0
+            with open_replace(path) as fp:
+                render_to(doc, fp)
+            if m is not None:
+                m.record("replace", time.perf_counter() - t0)
+            return fp.written
+        return self._replace_text(path, self._render(doc))
+
+    def _replace_text(self, path: Path, text: str) -> bool:
+        open_replace = getattr(self.storage, "open_replace", None)
+        if open_replace is not None:
+            m = self.metrics
+            t0 = time.perf_counter() if m is not None else 0.0
+            with open_replace(path) as fp:
+                fp.write(text)
+            if m is not None:
+                m.record("replace", time.perf_counter() - t0)
+            return fp.written
+        try:
+            if self.storage.read(path) == text:
+                return False
+        except OSError:
+            pass  # missing or unreadable: (re)write it
+        self._write(path, text)
+        return True
+
+    def save_stats(self) -> SaveStats:
+        """これまでの保存で書き込んだ件数・省略した件数を返す（スナップショット）。"""
+        return SaveStats(self._save_stats.written, self._save_stats.skipped)
+
+
+def model_to_document(model: DocConvertible) -> Document:
+    """モデルのノード列とフロントマターから保存用の `Document` を組み立てる。"""
+    nodes = model.to_nodes()
+    # ラッパー Document を生成してレンダラへ渡す。フロントマターはモデル側で必要に応じ提供される想定
+    # Allow models to optionally provide front_matter. Preferred hooks:
+    # - model.to_front_matter() -> dict
+    # - model.front_matter attribute
+    fm = {}
+    if hasattr(model, "to_front_matter") and callable(
+        getattr(model, "to_front_matter")
+    ):
+        try:
+            fm = model.to_front_matter()
+        except Exception:
+            fm = {}
+    elif hasattr(model, "front_matter"):
+        try:
+            fm = getattr(model, "front_matter") or {}
+        except Exception:
+            fm = {}
+
+    return Document(front_matter=fm, nodes=nodes)
@@ -0,0 +1,184 @@
+"""Usecase 層: 段階ごとの計測値を集計する `MetricsCollector` の実装
+
+`ConvertFileUsecase(..., metrics=MetricsAggregator())` のように注入すると、
+読み込み（``read`` / ``parse`` / ``from_nodes``）と保存（``to_nodes`` /
+``render`` / ``write`` など）、レンダラの ``serialize`` / ``mdformat`` の所要時間・
+バイト数・ノード数が段階ごとに集計される。コレクタを渡さない（``None``）場合は
+計測自体を行わない。
+
+1 回の呼び出しだけを調べるときは `profile` を使う::
+
+    with profile(uc) as m:
+        uc.save_model_to_path(model, path)
+    print(m.report())
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from mddocs.interfaces.protocols import MetricsCollector
+
+
+@dataclass
+class StageSummary:
+    """1 段階分の集計。
+
+    Attributes:
+        count: 記録回数。
+        total: 合計秒数。
+        p50: 所要時間の中央値（秒）。
+        p95: 95 パーセンタイル（秒）。
+        p99: 99 パーセンタイル（秒）。
+        max: 最大値（秒）。
+        n_bytes: 合計バイト数。
+        n_nodes: 合計ノード数。
+    """
+
+    count: int
+    total: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+    n_bytes: int
+    n_nodes: int
+
+
+class _Stage:
+    __slots__ = ("count", "total", "max", "n_bytes", "n_nodes", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.n_bytes = 0
+        self.n_nodes = 0
+        self.samples: list[float] = []
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """昇順の ``ordered`` の q パーセンタイル（nearest-rank）。"""
+    if not ordered:
+        return 0.0
+    rank = max(1, -(-len(ordered) * q // 100))  # ceil(n * q / 100)
+    return ordered[int(rank) - 1]
+
+
+class MetricsAggregator(MetricsCollector):
+    """段階ごとに回数・合計・パーセンタイルを集計するコレクタ（スレッドセーフ）。
+
+    パーセンタイルは段階ごとに最大 ``max_samples`` 件の標本（リザーバサンプリング）
+    から求める。回数・合計・最大値・バイト数・ノード数は全記録の正確な値。
+    """
+
+    def __init__(self, max_samples: int = 10_000, seed: int = 0):
+        self.max_samples = max_samples
+        self._stages: dict[str, _Stage] = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def record(
+        self, stage: str, seconds: float, n_bytes: int = 0, n_nodes: int = 0
+    ) -> None:
+        with self._lock:
+            st = self._stages.get(stage)
+            if st is None:
+                st = self._stages[stage] = _Stage()
+            st.count += 1
+            st.total += seconds
+            st.n_bytes += n_bytes
+            st.n_nodes += n_nodes
+            if seconds > st.max:
+                st.max = seconds
+            if len(st.samples) < self.max_samples:
+                st.samples.append(seconds)
+            else:
+                k = self._rng.randrange(st.count)
+                if k < self.max_samples:
+                    st.samples[k] = seconds
+
+    def summary(self) -> dict[str, StageSummary]:
+        """段階名 → `StageSummary`（最初に記録された順）。"""
+        with self._lock:
+            out = {}
+            for name, st in self._stages.items():
+                ordered = sorted(st.samples)
+                out[name] = StageSummary(
+                    st.count,
+                    st.total,
+                    _percentile(ordered, 50),
+                    _percentile(ordered, 95),
+                    _percentile(ordered, 99),
+                    st.max,
+                    st.n_bytes,
+                    st.n_nodes,
+                )
+            return out
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+
+    def report(self) -> str:
+        """集計を表形式の文字列で返す（時間はミリ秒）。"""
+        lines = [
+            f"{'stage':<14}{'count':>8}{'total':>11}{'p50':>10}{'p95':>10}"
+            f"{'p99':>10}{'max':>10}{'bytes':>13}{'nodes':>10}"
+        ]
+        for name, s in self.summary().items():
+            lines.append(
+                f"{name:<14}{s.count:>8}{s.total * 1e3:>11.2f}{s.p50 * 1e3:>10.3f}"
+                f"{s.p95 * 1e3:>10.3f}{s.p99 * 1e3:>10.3f}{s.max * 1e3:>10.3f}"
+                f"{s.n_bytes:>13}{s.n_nodes:>10}"
+            )
+        return "\n".join(lines)
+
+
+class _Tee(MetricsCollector):
+    """記録を 2 つのコレクタへ転送する（`profile` 中も既存のコレクタに届ける）。"""
+
+    def __init__(self, first: MetricsCollector, second: MetricsCollector):
+        self.first = first
+        self.second = second
+
+    def record(
+        self, stage: str, seconds: float, n_bytes: int = 0, n_nodes: int = 0
+    ) -> None:
+        self.first.record(stage, seconds, n_bytes, n_nodes)
+        self.second.record(stage, seconds, n_bytes, n_nodes)
+
+
+@contextmanager
+def profile(*targets: Any) -> Iterator[MetricsAggregator]:
+    """ブロック内の呼び出しだけを計測する新しい `MetricsAggregator` を返す。
+
+    ``targets``（通常は `ConvertFileUsecase`）とその ``renderer`` / ``parser`` /
+    ``storage`` のうち ``metrics`` 属性を持つものに一時的にコレクタを設定し、
+    抜けると元に戻す。元のコレクタがあれば記録はそちらにも転送される。
+    """
+    agg = MetricsAggregator()
+    saved: list[tuple[Any, Any]] = []
+    seen: set[int] = set()
+    for target in targets:
+        for obj in (
+            target,
+            getattr(target, "renderer", None),
+            getattr(target, "parser", None),
+            getattr(target, "storage", None),
+        ):
+            if obj is None or id(obj) in seen or not hasattr(obj, "metrics"):
+                continue
+            seen.add(id(obj))
+            old = obj.metrics
+            saved.append((obj, old))
+            obj.metrics = agg if old is None else _Tee(old, agg)
+    try:
+        yield agg
+    finally:
+        for obj, old in reversed(saved):
+            obj.metrics = old
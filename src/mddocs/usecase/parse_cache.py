@@ -0,0 +1,174 @@
+"""Usecase 層: `Storage` と `DocumentParser` の間に挟むパース結果キャッシュ
+
+同じファイルを繰り返し読み込むサービス向けに、パース済み `Document` を
+内容アドレス（ソーステキストの SHA-256）で保持する。
+
+- パスごとに最後に見たスタンプ（`StatStorage.stat` の ``(mtime_ns, size)``）と
+  ダイジェストを記録し、スタンプが一致すれば読み込み自体を省略する。
+- スタンプが変わった／取得できない場合は読み込んでハッシュを取り、同じ内容の
+  エントリがあればパースを省略する（touch されただけのファイルや同一内容の別パス）。
+- エントリ数と合計バイト数（ソースの UTF-8 バイト数）で上限を設けた LRU。
+- 返す `Document` は常に複製なので、モデル側の `from_nodes` / `from_cursor` が
+  ノードを変更してもキャッシュは汚れない。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from mddocs.domain.doc_ir import Document
+from mddocs.interfaces.protocols import DocumentParser, Storage
+
+
+@dataclass
+class CacheStats:
+    """キャッシュのカウンタのスナップショット。
+
+    Attributes:
+        hits: パースを省略できた回数（`stat_hits` + `content_hits`）。
+        stat_hits: スタンプ一致により読み込みも省略できた回数。
+        content_hits: 読み込み後、内容ハッシュの一致でパースを省略できた回数。
+        misses: パースが必要だった回数。
+        evictions: LRU 上限により追い出したエントリ数。
+        entries: 現在のエントリ数。
+        bytes: 現在のエントリの合計バイト数。
+    """
+
+    hits: int = 0
+    stat_hits: int = 0
+    content_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class _Entry:
+    doc: Document
+    size: int
+    paths: set[Path]
+
+
+class ParseCache:
+    """内容アドレス方式のパース結果キャッシュ（LRU）。
+
+    `ConvertFileUsecase(..., cache=ParseCache())` のように注入して使う。
+    スレッドセーフ。
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 256 << 20):
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError("ParseCache: max_entries and max_bytes must be positive")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[bytes, _Entry] = OrderedDict()
+        self._paths: dict[Path, tuple[tuple[int, int] | None, bytes]] = {}
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def load(self, path: Path, storage: Storage, parser: DocumentParser) -> Document:
+        """`path` の `Document` を返す。必要な場合のみ読み込み・パースする。
+
+        Raises:
+            Exception: 読み込み・パースの例外はそのまま伝搬する（キャッシュされない）。
+        """
+        stat = getattr(storage, "stat", None)
+        stamp = stat(path) if stat is not None else None
+        with self._lock:
+            known = self._paths.get(path)
+            if stamp is not None and known is not None and known[0] == stamp:
+                entry = self._entries.get(known[1])
+                if entry is not None:
+                    self._entries.move_to_end(known[1])
+                    self._stats.hits += 1
+                    self._stats.stat_hits += 1
+                    return entry.doc.copy()
+
+        text = storage.read(path)
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).digest()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._entries.move_to_end(digest)
+                self._remember(path, stamp, digest, entry)
+                self._stats.hits += 1
+                self._stats.content_hits += 1
+                return entry.doc.copy()
+            self._stats.misses += 1
+
+        doc = parser.parse(text)
+        if len(data) <= self.max_bytes:
+            with self._lock:
+                if digest not in self._entries:
+                    entry = _Entry(doc.copy(), len(data), set())
+                    self._entries[digest] = entry
+                    self._bytes += entry.size
+                    self._remember(path, stamp, digest, entry)
+                    self._evict()
+        return doc
+
+    def invalidate(self, path: Path) -> None:
+        """`path` に関する記録を破棄する。同じ内容の他パスのエントリは残す。"""
+        with self._lock:
+            known = self._paths.pop(path, None)
+            if known is None:
+                return
+            entry = self._entries.get(known[1])
+            if entry is not None:
+                entry.paths.discard(path)
+                if not entry.paths:
+                    self._drop(known[1])
+
+    def clear(self) -> None:
+        """すべてのエントリを破棄する（カウンタは保持する）。"""
+        with self._lock:
+            self._entries.clear()
+            self._paths.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """現在のカウンタのスナップショットを返す。"""
+        with self._lock:
+            s = self._stats
+            return CacheStats(
+                hits=s.hits,
+                stat_hits=s.stat_hits,
+                content_hits=s.content_hits,
+                misses=s.misses,
+                evictions=s.evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    # 以下はロック取得済みの前提で呼ぶ内部ヘルパ
+
+    def _remember(
+        self, path: Path, stamp: tuple[int, int] | None, digest: bytes, entry: _Entry
+    ) -> None:
+        previous = self._paths.get(path)
+        if previous is not None and previous[1] != digest:
+            old = self._entries.get(previous[1])
+            if old is not None:
+                old.paths.discard(path)
+        self._paths[path] = (stamp, digest)
+        entry.paths.add(path)
+
+    def _drop(self, digest: bytes) -> _Entry:
+        entry = self._entries.pop(digest)
+        self._bytes -= entry.size
+        for p in entry.paths:
+            if self._paths.get(p, (None, b""))[1] == digest:
+                del self._paths[p]
+        return entry
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._drop(next(iter(self._entries)))
+            self._stats.evictions += 1
@@ -0,0 +1,244 @@
+"""Usecase 層: ディレクトリを監視し、変更されたファイルのモデルだけを読み直す
+
+`DirectoryWatcher`（inotify やポーリングの実装はアダプタ層）から変更を受け取り、
+短時間に続く変更（エディタの保存、一括コピーなど）をまとめてから、変更された
+ファイルだけを `ConvertFileUsecase.load_models_from_paths` で読み直す。結果は
+`ModelUpdate` としてコールバックと非同期イテレータ（`WatchModelsUsecase.updates`）に
+通知する。読み直しのコストは変更されたファイル数に比例し、文書群の大きさには
+よらない（ポーリング実装の走査コストは除く）。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterable, Optional, Type
+
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.interfaces.protocols import DirectoryWatcher
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+
+
+@dataclass
+class ModelUpdate:
+    """1 ファイル分のモデルの更新。
+
+    Attributes:
+        path: 変更されたファイル。
+        model: 読み直したモデル。削除・失敗時は `None`。
+        error: 読み込み・パース・変換で発生した例外。成功・削除時は `None`。
+        removed: ファイルが削除された（移動を含む）場合 ``True``。
+    """
+
+    path: Path
+    model: Optional[DocConvertible] = None
+    error: Optional[BaseException] = None
+    removed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# Items of an `updates` queue: an update, the error that stopped the
+# background thread, or ``None`` once `stop` was called.
+_Item = ModelUpdate | BaseException | None
+
+
+class WatchModelsUsecase:
+    """ディレクトリ以下のファイルとモデルを同期し続けるユースケース。
+
+    ``models`` はパスから最新のモデルへの辞書。読み込みに失敗したファイルは直前の
+    モデルを残し、エラーだけを通知する。`poll_once` を呼び出し側のループで使うか、
+    `start` / `stop`（またはコンテキストマネージャ）でバックグラウンドスレッドに任せる。
+
+    Args:
+        usecase: 読み込みに使う `ConvertFileUsecase`。
+        watcher: 変更を受け取る `DirectoryWatcher`（`close` は呼び出し側が行う）。
+        model_cls: 各ファイルから作るモデルのクラス。
+        on_update: 更新ごとに呼ぶコールバック（読み直しを行ったスレッドで呼ばれる）。
+        debounce: 最後の変更からこの秒数だけ変更がなければ読み直す。
+        max_delay: 変更が続いていても、最初の変更からこの秒数で読み直す。
+        executor: 読み直しに使う executor（`load_models_from_paths` に渡す）。省略すると
+            読み直しを行うスレッドで順に読む。変更されたファイルは通常わずかなので、
+            バッチごとにプロセスプールを作るより速い。大量の変更に備えて並列化する
+            場合は、呼び出し側のスレッドで `ProcessPoolExecutor` を作って渡し、
+            監視が終わった後に閉じる（監視スレッドから fork しないため）。
+    """
+
+    def __init__(
+        self,
+        usecase: ConvertFileUsecase,
+        watcher: DirectoryWatcher,
+        model_cls: Type[DocConvertible],
+        on_update: Callable[[ModelUpdate], None] | None = None,
+        debounce: float = 0.1,
+        max_delay: float = 2.0,
+        executor: Executor | None = None,
+    ):
+        if debounce < 0 or max_delay < debounce:
+            raise ValueError("WatchModelsUsecase: need 0 <= debounce <= max_delay")
+        self.usecase = usecase
+        self.watcher = watcher
+        self.model_cls = model_cls
+        self.on_update = on_update
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.executor = executor
+        self.models: dict[Path, DocConvertible] = {}
+        self._subscribers: list[
+            tuple[asyncio.AbstractEventLoop, asyncio.Queue[_Item]]
+        ] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+
+    def load_all(self) -> list[ModelUpdate]:
+        """監視対象のすべてのファイルを読み込む（起動時に 1 度呼ぶ）。"""
+        return self.reload(self.watcher.files())
+
+    def reload(self, paths: Iterable[Path]) -> list[ModelUpdate]:
+        """``paths`` を読み直して ``models`` を更新し、パス順に通知して返す。
+
+        存在しないファイルは削除として扱う。
+        """
+        results = self.usecase.load_models_from_paths(
+            sorted(set(paths)), self.model_cls, workers=1, executor=self.executor
+        )
+        updates = []
+        for r in results:
+            if isinstance(r.error, FileNotFoundError):
+                self.models.pop(r.path, None)
+                update = ModelUpdate(r.path, removed=True)
+            elif r.error is not None:
+                update = ModelUpdate(r.path, error=r.error)
+            else:
+                assert r.model is not None
+                self.models[r.path] = r.model
+                update = ModelUpdate(r.path, r.model)
+            updates.append(update)
+            self._publish(update)
+        return updates
+
+    def poll_once(self, timeout: float | None = None) -> list[ModelUpdate]:
+        """変更を最大 ``timeout`` 秒待ち、落ち着くのを待ってから読み直す。
+
+        最初の変更の後は ``debounce`` 秒間変更がなくなるまで（最長 ``max_delay``
+        秒）変更を集め、重複を除いて 1 度だけ読み直す。変更がなければ空リストを返す。
+        """
+        changed = self.watcher.poll(timeout)
+        if not changed:
+            return []
+        deadline = time.monotonic() + self.max_delay
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            more = self.watcher.poll(min(self.debounce, remaining))
+            if not more:
+                break
+            changed |= more
+        return self.reload(changed)
+
+    def _publish(self, update: ModelUpdate) -> None:
+        if self.on_update is not None:
+            self.on_update(update)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, update)
+            except RuntimeError:
+                pass  # the subscriber's loop is closed
+
+    async def updates(self) -> AsyncIterator[ModelUpdate]:
+        """以降の更新を順に返す非同期イテレータ（`stop` で終わる）。
+
+        ``async for`` を始めた時点から購読する。読み直しは別スレッド（`start`）で
+        行う必要がある。
+
+        Raises:
+            Exception: バックグラウンドスレッドが例外（コールバックの例外など）で
+                止まった場合、その例外（`stop` も同じ例外を送出する）。
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[_Item] = asyncio.Queue()
+        entry = (loop, queue)
+        with self._lock:
+            if self._error is not None:
+                raise self._error
+            self._subscribers.append(entry)
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+
+    def start(self, poll_interval: float = 0.5) -> None:
+        """バックグラウンドスレッドで `poll_once` を繰り返す。
+
+        ``poll_interval`` は 1 回の待ち時間の上限（`stop` への応答の遅れの上限）。
+        """
+        if self._thread is not None:
+            raise RuntimeError("WatchModelsUsecase: already started")
+        self._stop.clear()
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._run, args=(poll_interval,), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, poll_interval: float) -> None:
+        try:
+            while not self._stop.is_set():
+                self.poll_once(poll_interval)
+        except BaseException as e:
+            with self._lock:
+                self._error = e
+            # Wake the `updates` consumers: nothing will be published any more.
+            self._end_subscribers(e)
+
+    def _end_subscribers(self, item: BaseException | None) -> None:
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, item)
+            except RuntimeError:
+                pass  # the subscriber's loop is closed
+
+    def stop(self) -> None:
+        """バックグラウンドスレッドを止め、`updates` の購読を終わらせる。
+
+        Raises:
+            Exception: スレッドが例外（コールバックの例外など）で止まっていた場合、
+                その例外。
+        """
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+        self._end_subscribers(None)
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def __enter__(self) -> WatchModelsUsecase:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
@@ -6,6 +6,8 @@
 
 from __future__ import annotations
 
+import random
+
 import pytest
 
 from mddocs.adapters.markdown_parser import MarkdownParserImpl
@@ -14,6 +16,15 @@ from mddocs.adapters.markdown_adapter import (
     MarkdownRendererAdapter,
 )
 from mddocs.adapters.file_storage import FileStorage
+from mddocs.domain.doc_ir import (
+    BulletList,
+    Document,
+    Heading,
+    Image,
+    NumberedList,
+    Paragraph,
+    Table,
+)
 
 
 @pytest.fixture
@@ -45,3 +56,52 @@ def parse_text(parser_impl):
         return parser_impl.parse(text)
 
     return _parse
+
+
+# Plain words dominate so that many generated documents take the fast path;
+# the tricky pieces exercise escaping, whitespace and block-start edge cases.
+_PLAIN = ["alpha", "beta", "仕様", "表", "é", "1", "2024", "v1.2", " ", " ", "  "]
+_TRICKY = (
+    list(".,;:?!'\"()/%+=@$^{}-|")
+    + ["1. ", "- ", "+ ", "*", "_", "`", "<", ">", "&", "#", "~", "[", "]", "\\"]
+    + ["\t", "\xa0", "　", "-->", "\n", "\n  ", "\n- "]
+)
+
+
+def _text(rng: random.Random) -> str:
+    return "".join(
+        rng.choice(_PLAIN if rng.random() < 0.85 else _TRICKY)
+        for _ in range(rng.randint(0, 6))
+    )
+
+
+def _node(rng: random.Random):
+    kind = rng.randrange(6)
+    if kind == 0:
+        return Heading(rng.randint(0, 7), _text(rng))
+    if kind == 1:
+        return Paragraph(_text(rng))
+    if kind == 2:
+        return BulletList([_text(rng) for _ in range(rng.randint(0, 3))])
+    if kind == 3:
+        return NumberedList([_text(rng) for _ in range(rng.randint(1, 3))])
+    if kind == 4:
+        n = rng.randint(0, 3)
+        return Table(
+            [_text(rng) for _ in range(n)],
+            [[_text(rng) for _ in range(n)] for _ in range(rng.randint(0, 3))],
+        )
+    return Image(_text(rng), rng.choice(["a.png", "img/x.png", "a b.png", "日本.png"]))
+
+
+def _random_document(seed: int) -> Document:
+    rng = random.Random(seed)
+    fm = {_text(rng): _text(rng) for _ in range(rng.randint(0, 2))}
+    return Document(fm, [_node(rng) for _ in range(rng.randint(0, 6))])
+
+
+@pytest.fixture
+def random_document():
+    """Helper fixture: build a seeded random `Document` (mostly plain text, with
+    Markdown-significant characters mixed in) for differential tests."""
+    return _random_document
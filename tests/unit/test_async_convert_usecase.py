@@ -0,0 +1,122 @@
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from mddocs.adapters.file_storage import AsyncFileStorage
+from mddocs.adapters.markdown_adapter import MarkdownRendererAdapter
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_cursor import NodeCursor
+from mddocs.domain.doc_ir import Paragraph
+from mddocs.usecase.async_convert_usecase import AsyncConvertFileUsecase
+
+
+class TextModel(DocConvertible):
+    def __init__(self, text: str, fm: dict | None = None):
+        self.text = text
+        self.fm = fm or {}
+
+    @classmethod
+    def from_cursor(cls, cur: NodeCursor):
+        return cls(cur.collect_paragraph_text(), cur.front_matter)
+
+    def to_nodes(self):
+        return [Paragraph(self.text)]
+
+    def to_front_matter(self):
+        return self.fm
+
+
+def test_async_roundtrip(tmp_path: Path):
+    uc = AsyncConvertFileUsecase(
+        MarkdownParserImpl(), MarkdownRendererAdapter(), AsyncFileStorage()
+    )
+
+    async def main():
+        await uc.save_model_to_path(
+            TextModel("hello", {"title": "t"}), tmp_path / "a.md"
+        )
+        return await uc.load_model_from_path(tmp_path / "a.md", TextModel)
+
+    model = asyncio.run(main())
+    assert model.text == "hello"
+    assert model.fm == {"title": "t"}
+
+
+def test_cpu_work_does_not_block_the_event_loop():
+    class SlowParser(MarkdownParserImpl):
+        def parse(self, markdown_text: str):
+            time.sleep(0.2)
+            return super().parse(markdown_text)
+
+    class MemoryStorage:
+        async def read(self, path: Path) -> str:
+            return "text"
+
+        async def write(self, path: Path, content: str) -> None:
+            pass
+
+    uc = AsyncConvertFileUsecase(
+        SlowParser(), MarkdownRendererAdapter(), MemoryStorage()
+    )
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        model = await uc.load_model_from_path(Path("x.md"), TextModel)
+        task.cancel()
+        return model, ticks
+
+    model, ticks = asyncio.run(main())
+    assert model.text == "text"
+    assert ticks >= 5
+
+
+def test_concurrency_limit():
+    active = 0
+    peak = 0
+
+    class SlowStorage:
+        async def read(self, path: Path) -> str:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return "text"
+
+        async def write(self, path: Path, content: str) -> None:
+            pass
+
+    uc = AsyncConvertFileUsecase(
+        MarkdownParserImpl(),
+        MarkdownRendererAdapter(),
+        SlowStorage(),
+        max_concurrency=3,
+    )
+
+    async def main():
+        return await asyncio.gather(
+            *(uc.load_model_from_path(Path(f"{i}.md"), TextModel) for i in range(12))
+        )
+
+    assert len(asyncio.run(main())) == 12
+    assert peak == 3
+    # the same instance works in a second event loop
+    peak = 0
+    assert len(asyncio.run(main())) == 12
+    assert peak == 3
+
+
+def test_invalid_concurrency_is_rejected():
+    with pytest.raises(ValueError):
+        AsyncConvertFileUsecase(None, None, None, max_concurrency=0)
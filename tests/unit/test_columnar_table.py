@@ -0,0 +1,126 @@
+import pickle
+
+import pytest
+
+from mddocs.adapters.ir_cache import decode_document, encode_document
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_ir import (
+    ColumnarTable,
+    ColumnarTableBuilder,
+    Document,
+    Table,
+    copy_node,
+)
+from mddocs.domain.ir_serializers import document_to_markdown
+
+ROWS = [["a", "1", "x"], ["b", "", "y"], ["", "1", "z"], ["aa", "11", "x"]]
+RAGGED = [["a", "1"], ["b"], ["c", "3", "extra"], []]
+
+
+def _md_table(n_rows: int) -> str:
+    lines = ["| id | name | flag |", "|----|------|------|"]
+    lines += [f"| {i} | n{i % 7} | {'yes' if i % 3 else ''} |" for i in range(n_rows)]
+    return "\n".join(lines) + "\n"
+
+
+@pytest.mark.parametrize("rows", [ROWS, RAGGED, []], ids=["full", "ragged", "empty"])
+def test_compatibility_views(rows):
+    plain = Table(["k", "v", "w"], [list(r) for r in rows])
+    table = ColumnarTable(["k", "v", "w"], rows)
+    assert table == plain and plain == table
+    assert len(table.rows) == len(rows)
+    assert list(table.rows) == rows
+    assert table.rows[-1:] == rows[-1:]
+    assert table.to_table() == plain
+    assert repr(table) == repr(plain).replace("Table(", "ColumnarTable(", 1)
+    assert pickle.loads(pickle.dumps(table)) == plain
+    assert copy_node(table) == plain
+    assert document_to_markdown(Document({}, [table])) == document_to_markdown(
+        Document({}, [plain])
+    )
+
+
+def test_column_views_do_not_build_rows(monkeypatch):
+    table = ColumnarTable(["k", "v", "w"], ROWS)
+    monkeypatch.setattr(
+        ColumnarTable, "_row", lambda self, r: pytest.fail("row materialized")
+    )
+    col = table.column("v")
+    assert list(col) == ["1", "", "1", "11"]
+    assert col[-1] == "11" and col[1:3] == ["", "1"]
+    assert col.index("1") == 0 and col.index("1", 1) == 2
+    assert col.index("") == 1
+    assert col.count("1") == 2 and col.count("11") == 1
+    assert "11" in col and "2" not in col and 1 not in col
+    with pytest.raises(ValueError):
+        col.index("x")
+    # a value that only occurs inside or across cells is not a match
+    assert "a1" not in table.column(0) and table.column(0).index("aa") == 3
+
+
+def test_column_lookup_errors_and_missing_cells():
+    table = ColumnarTable(["k", "v", "w", "unused"], RAGGED)
+    assert list(table.column(1)) == ["1", "", "3", ""]
+    assert list(table.column("unused")) == ["", "", "", ""]
+    assert list(table.column("w")) == ["", "", "extra", ""]
+    with pytest.raises(KeyError):
+        table.column("nope")
+    with pytest.raises(IndexError):
+        table.column(4)
+
+
+def test_as_dict_matches_table():
+    pairs = [["k1", "v1"], ["k2", "v2"]]
+    assert ColumnarTable(["k", "v"], pairs).as_dict() == {"k1": "v1", "k2": "v2"}
+    wide = ColumnarTable(["k", "v", "w"], ROWS)
+    assert wide.as_dict(ignore_extra_columns=True) == Table(
+        ["k", "v", "w"], ROWS
+    ).as_dict(ignore_extra_columns=True)
+    for rows in (ROWS, RAGGED, [["k", "1"], ["k", "2"]]):
+        with pytest.raises(ValueError):
+            ColumnarTable(["k", "v"], rows).as_dict()
+
+
+def test_rows_setter_and_read_only_view():
+    table = ColumnarTable(["k"], [["a"]])
+    with pytest.raises(AttributeError):
+        table.rows.append(["b"])
+    table.rows = [["b"], ["c"]]
+    assert list(table.column(0)) == ["b", "c"]
+
+
+def test_builder_flushes_large_tables():
+    builder = ColumnarTableBuilder(["i", "sq"])
+    for i in range(10_000):
+        builder.append([str(i), str(i * i)])
+    table = builder.build()
+    assert table.rows[9_999] == ["9999", str(9_999 * 9_999)]
+    assert table.column("sq").index("4") == 2
+
+
+@pytest.mark.parametrize("threshold", [0, 1, 50, 1000])
+def test_parser_builds_columnar_tables_over_threshold(threshold):
+    text = "# t\n\n" + _md_table(120) + "\n" + _md_table(3)
+    expected = MarkdownParserImpl().parse(text)
+    doc = MarkdownParserImpl(columnar_min_rows=threshold).parse(text)
+    assert doc == expected
+    kinds = [type(n) for n in doc.nodes if isinstance(n, Table)]
+    assert kinds == [
+        ColumnarTable if 120 >= threshold else Table,
+        ColumnarTable if 3 >= threshold else Table,
+    ]
+
+
+def test_parser_cache_version_reflects_columnar_setting():
+    assert MarkdownParserImpl().cache_version == MarkdownParserImpl.cache_version
+    assert MarkdownParserImpl(columnar_min_rows=10).cache_version != (
+        MarkdownParserImpl.cache_version
+    )
+
+
+def test_ir_cache_round_trip_keeps_columns():
+    doc = MarkdownParserImpl(columnar_min_rows=0).parse(_md_table(50))
+    doc.nodes.append(ColumnarTable(["k", "v", "w"], RAGGED))
+    decoded = decode_document(encode_document(doc))
+    assert all(type(n) is ColumnarTable for n in decoded.nodes)
+    assert decoded == doc
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_parser import MarkdownParseError, MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_cursor import NodeCursor
+from mddocs.domain.doc_ir import Heading
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+
+
+class TitleModel(DocConvertible):
+    def __init__(self, title: str, fm: dict):
+        self.title = title
+        self.fm = fm
+
+    @classmethod
+    def from_cursor(cls, cur: NodeCursor):
+        return cls(cur.expect(Heading).text, cur.front_matter)
+
+    def to_nodes(self):
+        return [Heading(1, self.title)]
+
+
+def _write_corpus(tmp_path: Path, n: int) -> list[Path]:
+    paths = []
+    for i in range(n):
+        p = tmp_path / f"{i:03d}.md"
+        if i % 7 == 3:
+            p.write_text("#\n", encoding="utf-8")  # malformed
+        else:
+            p.write_text(f"<!--\nid: {i}\n-->\n\n# doc {i}\n", encoding="utf-8")
+        paths.append(p)
+    return paths
+
+
+def _usecase() -> ConvertFileUsecase:
+    return ConvertFileUsecase(MarkdownParserImpl(), None, FileStorage())
+
+
+def _check(results, paths):
+    assert [r.path for r in results] == paths
+    for i, r in enumerate(results):
+        if i % 7 == 3:
+            assert not r.ok and isinstance(r.error, MarkdownParseError)
+            assert r.model is None
+        else:
+            assert r.ok
+            assert r.model.title == f"doc {i}"
+            assert r.model.fm == {"id": str(i)}
+
+
+def test_batch_load_in_process_keeps_order_and_collects_errors(tmp_path: Path):
+    paths = _write_corpus(tmp_path, 20)
+    _check(_usecase().load_models_from_paths(paths, TitleModel, workers=1), paths)
+
+
+def test_batch_load_over_process_pool(tmp_path: Path):
+    paths = _write_corpus(tmp_path, 30)
+    paths.append(tmp_path / "missing.md")
+    results = _usecase().load_models_from_paths(
+        paths, TitleModel, workers=2, max_files_per_chunk=4
+    )
+    _check(results[:-1], paths[:-1])
+    assert isinstance(results[-1].error, FileNotFoundError)
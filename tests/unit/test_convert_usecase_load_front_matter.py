@@ -0,0 +1,96 @@
+from pathlib import Path
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_adapter import MarkdownParserAdapter
+from mddocs.adapters.markdown_parser import (
+    MarkdownParserImpl,
+    ReferenceMarkdownParserImpl,
+)
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+
+
+class CountingStorage(FileStorage):
+    def __init__(self):
+        self.head_reads: list[int] = []
+        self.full_reads = 0
+
+    def read_head(self, path: Path, size: int):
+        self.head_reads.append(size)
+        return super().read_head(path, size)
+
+    def read(self, path: Path) -> str:
+        self.full_reads += 1
+        return super().read(path)
+
+
+def _write(tmp_path, text: str) -> Path:
+    path = tmp_path / "doc.md"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_front_matter_is_read_from_the_head_only(tmp_path):
+    body = "# h\n\n" + "| a | b |\n| - | - |\n" + "| x | y |\n" * 50_000
+    path = _write(tmp_path, "<!--\ntitle: T\nid: 1\n-->\n\n" + body)
+    storage = CountingStorage()
+    uc = ConvertFileUsecase(MarkdownParserImpl(), None, storage)
+    assert uc.load_front_matter(path) == {"title": "T", "id": "1"}
+    assert storage.head_reads == [4096]
+    assert storage.full_reads == 0
+
+
+def test_long_front_matter_grows_the_read(tmp_path):
+    keys = {f"k{i}": "v" * 50 for i in range(300)}  # ~17 KB of front matter
+    fm = "".join(f"{k}: {v}\n" for k, v in keys.items())
+    path = _write(tmp_path, f"<!--\n{fm}-->\n\n# body\n" + "text\n" * 10_000)
+    storage = CountingStorage()
+    uc = ConvertFileUsecase(MarkdownParserImpl(), None, storage)
+    assert uc.load_front_matter(path) == keys
+    assert storage.head_reads == [4096, 16384, 65536]
+
+
+def test_document_without_front_matter(tmp_path):
+    path = _write(tmp_path, "# title\n" + "para\n" * 10_000)
+    storage = CountingStorage()
+    uc = ConvertFileUsecase(MarkdownParserImpl(), None, storage)
+    assert uc.load_front_matter(path) == {}
+    assert storage.head_reads == [4096]
+
+
+def test_unterminated_front_matter_matches_full_parse(tmp_path):
+    text = "<!--\na: 1\n" + "b: 2\n" * 3000
+    path = _write(tmp_path, text)
+    uc = ConvertFileUsecase(MarkdownParserImpl(), None, FileStorage())
+    assert uc.load_front_matter(path) == MarkdownParserImpl().parse(text).front_matter
+
+
+def test_parse_front_matter_needs_the_closing_line():
+    parser = MarkdownParserImpl()
+    assert parser.parse_front_matter("<!--\na: 1\n--", complete=False) is None
+    assert parser.parse_front_matter("<!", complete=False) is None
+    assert parser.parse_front_matter("<!--\na: 1\n-->", complete=False) == {"a": "1"}
+    assert parser.parse_front_matter("# no front matter", complete=False) == {}
+    assert parser.parse_front_matter("<!--\na: 1\n--") == {"a": "1"}
+
+
+def test_adapter_falls_back_to_full_parse(tmp_path):
+    path = _write(tmp_path, "<!--\na: 1\n-->\n\n# h\n")
+    storage = CountingStorage()
+    adapter = MarkdownParserAdapter(ReferenceMarkdownParserImpl())
+    uc = ConvertFileUsecase(adapter, None, storage)
+    assert uc.load_front_matter(path) == {"a": "1"}
+    assert storage.full_reads == 0
+    assert storage.head_reads == [4096]
+
+
+def test_storage_without_read_head_reads_the_document(tmp_path):
+    class PlainStorage:
+        def read(self, path):
+            return path.read_text(encoding="utf-8")
+
+        def write(self, path, content):
+            raise NotImplementedError
+
+    path = _write(tmp_path, "<!--\na: 1\n-->\n")
+    uc = ConvertFileUsecase(MarkdownParserImpl(), None, PlainStorage())
+    assert uc.load_front_matter(path) == {"a": "1"}
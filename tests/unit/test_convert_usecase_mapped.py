@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from mddocs.adapters.file_storage import FileStorage, MmapFileStorage
+from mddocs.adapters.markdown_adapter import MarkdownParserAdapter
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_ir import Heading, Paragraph
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+
+MD = "<!--\ntitle: t\n-->\n\n# 見出し\r\n\r\n本文\n"
+
+
+class NoReadStorage(MmapFileStorage):
+    """Fails if the usecase falls back to reading the file as one `str`."""
+
+    def __init__(self):
+        self.mapped = []
+
+    def read(self, path):
+        raise AssertionError("read() was called")
+
+    def open_mapped(self, path):
+        self.mapped.append(path)
+        return super().open_mapped(path)
+
+
+class CountingParser(MarkdownParserImpl):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def parse(self, text):
+        self.calls.append("parse")
+        return super().parse(text)
+
+    def parse_bytes(self, data):
+        self.calls.append("parse_bytes")
+        return super().parse_bytes(data)
+
+
+class NodesModel(DocConvertible):
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    @classmethod
+    def from_nodes(cls, nodes, front_matter=None):
+        return cls(list(nodes))
+
+    def to_nodes(self):
+        return self.nodes
+
+
+def test_load_document_parses_the_mapped_file(tmp_path: Path):
+    path = tmp_path / "a.md"
+    path.write_bytes(MD.encode("utf-8"))
+    storage = NoReadStorage()
+    parser = CountingParser()
+    uc = ConvertFileUsecase(parser, None, storage)
+
+    doc = uc.load_document(path)
+
+    assert doc == MarkdownParserImpl().parse(MD)
+    assert doc.nodes == [Heading(1, "見出し"), Paragraph("本文")]
+    assert storage.mapped == [path] and parser.calls == ["parse_bytes"]
+
+
+def test_batch_load_and_adapter_use_the_mapped_file(tmp_path: Path):
+    paths = [tmp_path / f"{i}.md" for i in range(3)]
+    for p in paths:
+        p.write_bytes(MD.encode("utf-8"))
+    storage = NoReadStorage()
+    uc = ConvertFileUsecase(MarkdownParserAdapter(), None, storage)
+    results = uc.load_models_from_paths(paths, NodesModel, workers=1)
+    assert all(r.ok for r in results) and storage.mapped == paths
+
+
+def test_plain_storage_reads_text(tmp_path: Path):
+    path = tmp_path / "a.md"
+    path.write_bytes(MD.encode("utf-8"))
+    parser = CountingParser()
+    doc = ConvertFileUsecase(parser, None, FileStorage()).load_document(path)
+    assert doc == MarkdownParserImpl().parse(MD)
+    assert parser.calls == ["parse"]
@@ -0,0 +1,177 @@
+from pathlib import Path
+
+import pytest
+
+from mddocs.adapters import markdown_renderer
+from mddocs.adapters.file_storage import FileStorage, MmapFileStorage
+from mddocs.adapters.markdown_adapter import MarkdownRendererAdapter
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_ir import Heading, Paragraph
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+from mddocs.usecase.metrics import MetricsAggregator, _percentile, profile
+
+
+class TextModel(DocConvertible):
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    @classmethod
+    def from_nodes(cls, nodes, front_matter=None):
+        return cls(list(nodes))
+
+    def to_nodes(self):
+        return self.nodes
+
+
+class ListCollector:
+    def __init__(self):
+        self.records = []
+
+    def record(self, stage, seconds, n_bytes=0, n_nodes=0):
+        self.records.append((stage, n_bytes, n_nodes))
+
+
+class FakeMdformat:
+    @staticmethod
+    def text(s: str) -> str:
+        return s
+
+
+@pytest.fixture(autouse=True)
+def _no_mdformat(monkeypatch):
+    monkeypatch.setattr(markdown_renderer, "mdformat", FakeMdformat)
+
+
+class MemoryStorage:
+    def __init__(self):
+        self.files = {}
+
+    def read(self, path: Path) -> str:
+        return self.files[path]
+
+    def write(self, path: Path, content: str) -> None:
+        self.files[path] = content
+
+
+def test_load_and_save_record_each_stage():
+    metrics = ListCollector()
+    renderer = MarkdownRendererAdapter(metrics=metrics)
+    storage = MemoryStorage()
+    storage.files[Path("a.md")] = "# T\n\nあ\n"
+    uc = ConvertFileUsecase(MarkdownParserImpl(), renderer, storage, metrics=metrics)
+
+    model = uc.load_model_from_path(Path("a.md"), TextModel)
+    uc.save_model_to_path(model, Path("b.md"))
+
+    out = len(storage.files[Path("b.md")].encode())
+    assert metrics.records == [
+        ("read", len("# T\n\nあ\n".encode()), 0),
+        ("parse", 0, 2),
+        ("from_nodes", 0, 2),
+        ("to_nodes", 0, 2),
+        ("serialize", out, 2),
+        ("mdformat", out, 2),
+        ("render", out, 0),
+        ("write", out, 0),
+    ]
+
+
+def test_mapped_load_records_one_parse_stage(tmp_path: Path):
+    path = tmp_path / "a.md"
+    path.write_text("# T\n\nあ\n", encoding="utf-8")
+    metrics = ListCollector()
+    uc = ConvertFileUsecase(
+        MarkdownParserImpl(), None, MmapFileStorage(), metrics=metrics
+    )
+    uc.load_document(path)
+    assert metrics.records == [("parse", len("# T\n\nあ\n".encode()), 2)]
+
+
+def test_streaming_and_replace_paths(tmp_path: Path):
+    metrics = ListCollector()
+    uc = ConvertFileUsecase(
+        None, MarkdownRendererAdapter(), FileStorage(), metrics=metrics
+    )
+    model = TextModel([Heading(1, "T"), Paragraph("x")])
+    uc.save_model_to_path(model, tmp_path / "a.md")
+    uc.save_model_to_path(model, tmp_path / "a.md", skip_unchanged=True)
+    assert [r[0] for r in metrics.records] == [
+        "to_nodes",
+        "render_write",
+        "to_nodes",
+        "replace",
+    ]
+
+
+@pytest.mark.parametrize("mode", ["mdformat", "canonical"])
+def test_streaming_save_reports_render_and_write_stages(tmp_path: Path, mode):
+    metrics = ListCollector()
+    renderer = MarkdownRendererAdapter(mode=mode, metrics=metrics)
+    uc = ConvertFileUsecase(None, renderer, FileStorage(), metrics=metrics)
+    path = tmp_path / "a.md"
+    uc.save_model_to_path(TextModel([Heading(1, "T"), Paragraph("あ")]), path)
+
+    out = path.stat().st_size
+    if mode == "canonical":
+        render_stages = [("canonical", out, 2)]
+    else:
+        # the fake mdformat returns each block unchanged; the blank line
+        # between the two blocks is added when writing
+        render_stages = [("serialize", out - 1, 2), ("mdformat", out, 2)]
+    assert metrics.records == [
+        ("to_nodes", 0, 2),
+        *render_stages,
+        ("write", out, 0),
+        ("render_write", 0, 0),
+    ]
+
+
+def test_no_metrics_by_default():
+    uc = ConvertFileUsecase(None, MarkdownRendererAdapter(), MemoryStorage())
+    assert uc.metrics is None
+    uc.save_model_to_path(TextModel([Paragraph("x")]), Path("a.md"))
+    assert uc.storage.files[Path("a.md")].startswith("x\n")
+
+
+def test_aggregator_summary_and_percentiles():
+    agg = MetricsAggregator()
+    for i in range(1, 101):
+        agg.record("parse", i / 1000, n_bytes=10, n_nodes=1)
+    s = agg.summary()["parse"]
+    assert s.count == 100
+    assert s.total == pytest.approx(5.05)
+    assert (s.p50, s.p95, s.p99, s.max) == (0.05, 0.095, 0.099, 0.1)
+    assert (s.n_bytes, s.n_nodes) == (1000, 100)
+    assert "parse" in agg.report()
+    agg.reset()
+    assert agg.summary() == {}
+
+
+def test_aggregator_reservoir_is_bounded():
+    agg = MetricsAggregator(max_samples=10)
+    for i in range(1000):
+        agg.record("read", float(i))
+    assert len(agg._stages["read"].samples) == 10
+    s = agg.summary()["read"]
+    assert s.count == 1000 and s.max == 999.0
+
+
+def test_percentile_nearest_rank():
+    assert _percentile([], 50) == 0.0
+    assert _percentile([1.0], 99) == 1.0
+    assert _percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+
+
+def test_profile_sets_tees_and_restores():
+    existing = ListCollector()
+    renderer = MarkdownRendererAdapter()
+    uc = ConvertFileUsecase(None, renderer, MemoryStorage(), metrics=existing)
+
+    with profile(uc) as m:
+        uc.save_model_to_path(TextModel([Paragraph("x")]), Path("a.md"))
+
+    assert uc.metrics is existing
+    assert renderer.metrics is None
+    assert set(m.summary()) == {"to_nodes", "serialize", "mdformat", "render", "write"}
+    assert [r[0] for r in existing.records] == ["to_nodes", "render", "write"]
@@ -0,0 +1,160 @@
+from pathlib import Path
+
+import pytest
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_adapter import MarkdownRendererAdapter
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_ir import Paragraph, Table
+from mddocs.domain.ir_serializers import document_to_markdown
+from mddocs.usecase.convert_usecase import ConvertFileUsecase, SaveStats
+
+SOURCE = """<!--
+title: spec
+-->
+
+#   Spec
+
+Hand   wrapped
+paragraph.
+
+|name|value|
+|-|-|
+|a|1|
+|b|2|
+
+*   keep
+*   these
+"""
+
+
+class NodesModel(DocConvertible):
+    def __init__(self, nodes, front_matter):
+        self.nodes = nodes
+        self.front_matter = front_matter
+
+    @classmethod
+    def from_nodes(cls, nodes, front_matter=None):
+        return cls(list(nodes), dict(front_matter or {}))
+
+    def to_nodes(self):
+        return self.nodes
+
+    def to_front_matter(self):
+        return self.front_matter
+
+
+class CountingRenderer:
+    def __init__(self):
+        self.rendered = []
+
+    def render(self, doc):
+        self.rendered.append(doc.nodes)
+        return document_to_markdown(doc)
+
+
+def _usecase(renderer=None, parser=None):
+    return ConvertFileUsecase(
+        parser or MarkdownParserImpl(),
+        renderer or MarkdownRendererAdapter(),
+        FileStorage(),
+    )
+
+
+def test_only_the_changed_table_is_rerendered(tmp_path: Path):
+    path = tmp_path / "spec.md"
+    path.write_text(SOURCE, encoding="utf-8")
+    renderer = CountingRenderer()
+    uc = _usecase(renderer)
+    model = uc.load_model_from_path(path, NodesModel)
+    model.nodes[2] = Table(["name", "value"], [["a", "1"], ["b", "3"]])
+
+    assert uc.save_model_to_path(model, path, preserve_source=True)
+
+    assert renderer.rendered == [[model.nodes[2]]]
+    text = path.read_text(encoding="utf-8")
+    assert text.startswith(SOURCE[: SOURCE.index("|name|")])
+    assert text.endswith("\n\n*   keep\n*   these\n")
+    assert uc.load_document(path).nodes == model.nodes
+
+
+def test_unchanged_model_keeps_the_file_byte_for_byte(tmp_path: Path):
+    path = tmp_path / "spec.md"
+    path.write_text(SOURCE, encoding="utf-8")
+    uc = _usecase()
+    model = uc.load_model_from_path(path, NodesModel)
+    mtime = path.stat().st_mtime_ns
+
+    written = uc.save_model_to_path(
+        model, path, skip_unchanged=True, preserve_source=True
+    )
+
+    assert not written
+    assert path.stat().st_mtime_ns == mtime
+    assert path.read_text(encoding="utf-8") == SOURCE
+    assert uc.save_stats() == SaveStats(written=0, skipped=1)
+
+
+def test_missing_file_is_rendered_in_full(tmp_path: Path):
+    path = tmp_path / "new.md"
+    renderer = CountingRenderer()
+    uc = _usecase(renderer)
+    model = NodesModel([Paragraph("x")], {})
+    assert uc.save_model_to_path(model, path, preserve_source=True)
+    assert renderer.rendered == [[Paragraph("x")]]
+    assert uc.load_document(path).nodes == [Paragraph("x")]
+
+
+def test_parser_without_source_maps_falls_back_to_full_render(tmp_path: Path):
+    class PlainParser:
+        def parse(self, text):
+            return MarkdownParserImpl().parse(text)
+
+    path = tmp_path / "spec.md"
+    path.write_text(SOURCE, encoding="utf-8")
+    renderer = CountingRenderer()
+    uc = _usecase(renderer, PlainParser())
+    model = uc.load_model_from_path(path, NodesModel)
+    uc.save_model_to_path(model, path, preserve_source=True)
+    assert renderer.rendered == [model.nodes]
+
+
+def test_crlf_file_keeps_its_line_endings(tmp_path: Path):
+    path = tmp_path / "crlf.md"
+    path.write_bytes(b"# T\r\n\r\nhello\r\n")
+    uc = _usecase()
+    model = uc.load_model_from_path(path, NodesModel)
+
+    assert not uc.save_model_to_path(
+        model, path, skip_unchanged=True, preserve_source=True
+    )
+    assert path.read_bytes() == b"# T\r\n\r\nhello\r\n"
+
+    model.nodes.append(Paragraph("more"))
+    assert uc.save_model_to_path(model, path, preserve_source=True)
+    assert path.read_bytes() == b"# T\r\n\r\nhello\r\n\r\nmore\r\n"
+
+
+def test_unparsable_file_is_rendered_in_full(tmp_path: Path):
+    path = tmp_path / "broken.md"
+    path.write_text("#\n", encoding="utf-8")  # empty heading: a parse error
+    renderer = CountingRenderer()
+    uc = _usecase(renderer)
+    model = NodesModel([Paragraph("x")], {})
+    assert uc.save_model_to_path(model, path, preserve_source=True)
+    assert renderer.rendered == [[Paragraph("x")]]
+    assert uc.load_document(path).nodes == [Paragraph("x")]
+
+
+def test_parser_bugs_are_not_mistaken_for_unparsable_files(tmp_path: Path):
+    class BrokenParser(MarkdownParserImpl):
+        def parse_with_source(self, text):
+            raise AttributeError("bug in the parser")
+
+    path = tmp_path / "spec.md"
+    path.write_text(SOURCE, encoding="utf-8")
+    uc = _usecase(parser=BrokenParser())
+    with pytest.raises(AttributeError, match="bug in the parser"):
+        uc.save_model_to_path(NodesModel([], {}), path, preserve_source=True)
+    assert path.read_text(encoding="utf-8") == SOURCE
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_adapter import MarkdownRendererAdapter
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_ir import Paragraph
+from mddocs.usecase.convert_usecase import ConvertFileUsecase, SaveStats
+
+
+class TextModel(DocConvertible):
+    def __init__(self, text: str):
+        self.text = text
+
+    def to_nodes(self):
+        return [Paragraph(self.text)]
+
+
+class MemoryStorage:
+    def __init__(self):
+        self.files = {}
+        self.writes = 0
+
+    def read(self, path: Path) -> str:
+        try:
+            return self.files[path]
+        except KeyError:
+            raise FileNotFoundError(path) from None
+
+    def write(self, path: Path, content: str) -> None:
+        self.writes += 1
+        self.files[path] = content
+
+
+def test_skip_unchanged_with_file_storage(tmp_path: Path):
+    uc = ConvertFileUsecase(None, MarkdownRendererAdapter(), FileStorage())
+    a, b = tmp_path / "a.md", tmp_path / "b.md"
+    assert uc.save_model_to_path(TextModel("x"), a, skip_unchanged=True)
+    assert uc.save_model_to_path(TextModel("y"), b, skip_unchanged=True)
+    mtime = a.stat().st_mtime_ns
+
+    assert not uc.save_model_to_path(TextModel("x"), a, skip_unchanged=True)
+    assert uc.save_model_to_path(TextModel("z"), b, skip_unchanged=True)
+    assert a.stat().st_mtime_ns == mtime
+    assert b.read_text(encoding="utf-8") == "z\n"
+    assert uc.save_stats() == SaveStats(written=3, skipped=1)
+
+
+def test_skip_unchanged_falls_back_to_read_and_compare():
+    storage = MemoryStorage()
+    uc = ConvertFileUsecase(None, MarkdownRendererAdapter(), storage)
+    path = Path("a.md")
+    assert uc.save_model_to_path(TextModel("x"), path, skip_unchanged=True)
+    assert not uc.save_model_to_path(TextModel("x"), path, skip_unchanged=True)
+    assert uc.save_model_to_path(TextModel("x"), path)  # default always writes
+    assert storage.writes == 2
+    assert uc.save_stats() == SaveStats(written=2, skipped=1)
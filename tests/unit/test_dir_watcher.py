@@ -0,0 +1,121 @@
+import os
+
+import pytest
+
+from mddocs.adapters.dir_watcher import (
+    InotifyWatcher,
+    PollingWatcher,
+    open_watcher,
+)
+
+
+def _inotify_or_skip(root):
+    try:
+        return InotifyWatcher(root)
+    except OSError as e:
+        pytest.skip(f"inotify is not available: {e}")
+
+
+def _watchers(root):
+    yield PollingWatcher(root, interval=0.01)
+    yield _inotify_or_skip(root)
+
+
+def _corpus(root):
+    (root / "sub" / "deep").mkdir(parents=True)
+    (root / "a.md").write_text("# a\n", encoding="utf-8")
+    (root / "sub" / "b.md").write_text("# b\n", encoding="utf-8")
+    (root / "sub" / "deep" / "c.md").write_text("# c\n", encoding="utf-8")
+    (root / "notes.txt").write_text("x", encoding="utf-8")
+
+
+@pytest.mark.parametrize("kind", ["polling", "inotify"])
+def test_reports_added_changed_and_removed_files(tmp_path, kind):
+    _corpus(tmp_path)
+    if kind == "polling":
+        watcher = PollingWatcher(tmp_path, interval=0.01)
+    else:
+        watcher = _inotify_or_skip(tmp_path)
+    with watcher:
+        assert watcher.files() == [
+            tmp_path / "a.md",
+            tmp_path / "sub" / "b.md",
+            tmp_path / "sub" / "deep" / "c.md",
+        ]
+        assert watcher.poll(0) == set()
+
+        (tmp_path / "a.md").write_text("# a changed\n", encoding="utf-8")
+        (tmp_path / "sub" / "new.md").write_text("# new\n", encoding="utf-8")
+        (tmp_path / "sub" / "deep" / "c.md").unlink()
+        (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+        changed = set()
+        while len(changed) < 3:
+            more = watcher.poll(2.0)
+            assert more, changed
+            changed |= more
+        assert changed == {
+            tmp_path / "a.md",
+            tmp_path / "sub" / "new.md",
+            tmp_path / "sub" / "deep" / "c.md",
+        }
+        assert watcher.files() == [
+            tmp_path / "a.md",
+            tmp_path / "sub" / "b.md",
+            tmp_path / "sub" / "new.md",
+        ]
+        assert watcher.poll(0.05) == set()
+
+
+@pytest.mark.parametrize("kind", ["polling", "inotify"])
+def test_directory_moves_report_their_files(tmp_path, kind):
+    root = tmp_path / "docs"
+    root.mkdir()
+    _corpus(root)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "x.md").write_text("# x\n", encoding="utf-8")
+    if kind == "polling":
+        watcher = PollingWatcher(root, interval=0.01)
+    else:
+        watcher = _inotify_or_skip(root)
+    with watcher:
+        os.rename(root / "sub", tmp_path / "moved-away")
+        os.rename(outside, root / "moved-in")
+        changed = set()
+        while len(changed) < 3:
+            more = watcher.poll(2.0)
+            assert more, changed
+            changed |= more
+        assert changed == {
+            root / "sub" / "b.md",
+            root / "sub" / "deep" / "c.md",
+            root / "moved-in" / "x.md",
+        }
+        # files in a directory that moved in are watched from now on
+        (root / "moved-in" / "x.md").write_text("# x2\n", encoding="utf-8")
+        assert watcher.poll(2.0) == {root / "moved-in" / "x.md"}
+        assert watcher.files() == [root / "a.md", root / "moved-in" / "x.md"]
+
+
+def test_atomic_replace_is_reported(tmp_path):
+    (tmp_path / "a.md").write_text("# a\n", encoding="utf-8")
+    for watcher in _watchers(tmp_path):
+        with watcher:
+            tmp = tmp_path / ".a.md.tmp"
+            tmp.write_text("# a again\n", encoding="utf-8")
+            os.replace(tmp, tmp_path / "a.md")
+            assert watcher.poll(2.0) == {tmp_path / "a.md"}
+
+
+def test_open_watcher_falls_back_to_polling(tmp_path, monkeypatch):
+    import mddocs.adapters.dir_watcher as dir_watcher
+
+    def unavailable():
+        raise OSError("no inotify")
+
+    monkeypatch.setattr(dir_watcher, "_libc", unavailable)
+    with open_watcher(tmp_path, interval=0.5) as watcher:
+        assert isinstance(watcher, PollingWatcher)
+        assert watcher.interval == 0.5
+    with pytest.raises(NotADirectoryError):
+        open_watcher(tmp_path / "missing")
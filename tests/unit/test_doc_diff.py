@@ -0,0 +1,154 @@
+import random
+
+import pytest
+
+from mddocs.domain.doc_diff import (
+    CellChange,
+    DocDiff,
+    NodeEdit,
+    TableDiff,
+    diff_documents,
+    diff_nodes,
+    diff_sequences,
+    diff_tables,
+    node_opcodes,
+)
+from mddocs.domain.doc_ir import (
+    BulletList,
+    ColumnarTable,
+    Document,
+    Heading,
+    Image,
+    NumberedList,
+    Paragraph,
+    Table,
+)
+
+
+def _lcs_distance(a, b) -> int:
+    n, m = len(a), len(b)
+    dp = [[0] * (m + 1) for _ in range(n + 1)]
+    for i in range(n - 1, -1, -1):
+        for j in range(m - 1, -1, -1):
+            if a[i] == b[j]:
+                dp[i][j] = dp[i + 1][j + 1] + 1
+            else:
+                dp[i][j] = max(dp[i + 1][j], dp[i][j + 1])
+    return n + m - 2 * dp[0][0]
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_diff_sequences_is_a_minimal_edit_script(seed: int):
+    rng = random.Random(seed)
+    alphabet = rng.choice([2, 5, 20])
+    a = [rng.randrange(alphabet) for _ in range(rng.randint(0, 30))]
+    b = [rng.randrange(alphabet) for _ in range(rng.randint(0, 30))]
+
+    ops = diff_sequences(a, b)
+
+    out = []
+    i = j = 0
+    for tag, i1, i2, j1, j2 in ops:
+        assert (i1, j1) == (i, j)
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+        out += b[j1:j2]
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    assert out == b
+    cost = sum(i2 - i1 + j2 - j1 for tag, i1, i2, j1, j2 in ops if tag != "equal")
+    assert cost == _lcs_distance(a, b)
+    # adjacent deletes and inserts are merged
+    tags = [op[0] for op in ops]
+    assert all((x == "equal") != (y == "equal") for x, y in zip(tags, tags[1:]))
+
+
+def test_node_opcodes_trims_common_prefix_and_suffix():
+    a, b, c, d = (Paragraph(x) for x in "abcd")
+    assert node_opcodes([a, b, c], [a, d, c]) == [
+        ("equal", 0, 1, 0, 1),
+        ("replace", 1, 2, 1, 2),
+        ("equal", 2, 3, 2, 3),
+    ]
+    assert node_opcodes([a, b], [a, b]) == [("equal", 0, 2, 0, 2)]
+    assert node_opcodes([], [a]) == [("insert", 0, 0, 0, 1)]
+
+
+def test_equal_nodes_match_across_hash_summaries():
+    # Same headers, row count and first row: only the full comparison tells
+    # these tables apart.
+    t1 = Table(["k", "v"], [["a", "1"], ["b", "2"]])
+    t2 = Table(["k", "v"], [["a", "1"], ["b", "3"]])
+    old = [Heading(1, "x"), t1, Paragraph("p"), t2]
+    new = [Heading(1, "x"), t2, Paragraph("p"), t1]
+    ops = node_opcodes(old, new)
+    assert sum(i2 - i1 for tag, i1, i2, _, _ in ops if tag == "equal") == 2
+
+
+def test_diff_tables_reports_rows_and_cells():
+    old = Table(["k", "v"], [["a", "1"], ["b", "2"], ["c", "3"], ["d", "4"]])
+    new = Table(["key", "v"], [["a", "1"], ["b", "20", "x"], ["d", "4"], ["e", "5"]])
+    assert diff_tables(old, new) == TableDiff(
+        headers=(["k", "v"], ["key", "v"]),
+        rows=[("delete", 2, 3, 2, 2), ("insert", 4, 4, 3, 4)],
+        cells=[CellChange(1, 1, 1, "2", "20"), CellChange(1, 1, 2, None, "x")],
+    )
+
+
+def test_columnar_tables_are_compared_by_content():
+    rows = [[str(i), "v"] for i in range(50)]
+    old = ColumnarTable.from_table(Table(["k", "v"], rows))
+    changed = [list(r) for r in rows]
+    changed[25][1] = "w"
+    new = Table(["k", "v"], changed)
+    assert diff_nodes([old], [Table(["k", "v"], rows)]) == []
+    (edit,) = diff_nodes([old], [new])
+    assert edit.tag == "table"
+    assert edit.table is not None
+    assert edit.table.cells == [CellChange(25, 25, 1, "v", "w")]
+
+
+def test_diff_nodes_splits_replacements_around_tables():
+    t_old = Table(["k"], [["1"]])
+    t_new = Table(["k"], [["2"]])
+    old = [Paragraph("a"), t_old, Heading(2, "h"), Image("i", "p.png")]
+    new = [Paragraph("b"), t_new, Heading(2, "H"), Image("i", "p.png")]
+    assert diff_nodes(old, new) == [
+        NodeEdit("replace", 0, 1, 0, 1),
+        NodeEdit("table", 1, 2, 1, 2, TableDiff(cells=[CellChange(0, 0, 0, "1", "2")])),
+        NodeEdit("replace", 2, 3, 2, 3),
+    ]
+
+
+def test_diff_documents():
+    old = Document(
+        {"title": "a", "gone": "x"},
+        [Heading(1, "T"), BulletList(["a"]), NumberedList(["1"])],
+    )
+    new = Document(
+        {"title": "b", "new": "y"},
+        [Heading(1, "T"), NumberedList(["1"]), Paragraph("tail")],
+    )
+    diff = diff_documents(old, new)
+    assert diff == DocDiff(
+        front_matter={"title": ("a", "b"), "gone": ("x", None), "new": (None, "y")},
+        edits=[NodeEdit("delete", 1, 2, 1, 1), NodeEdit("insert", 3, 3, 2, 3)],
+    )
+    assert diff
+    assert not diff_documents(old, old)
+
+
+def test_large_document_with_scattered_edits():
+    nodes = [
+        Heading(2, f"s{i}") if i % 3 == 0 else Paragraph(f"p{i}") for i in range(30_000)
+    ]
+    new = list(nodes)
+    new[10] = Paragraph("changed")
+    del new[15_000]
+    new.insert(29_000, Paragraph("added"))
+    edits = diff_nodes(nodes, new)
+    assert edits == [
+        NodeEdit("replace", 10, 11, 10, 11),
+        NodeEdit("delete", 15_000, 15_001, 15_000, 15_000),
+        NodeEdit("insert", 29_001, 29_001, 29_000, 29_001),
+    ]
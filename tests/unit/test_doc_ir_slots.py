@@ -0,0 +1,43 @@
+import pickle
+
+import pytest
+
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_ir import (
+    BulletList,
+    Document,
+    Heading,
+    Image,
+    NumberedList,
+    Paragraph,
+    Table,
+)
+
+NODES = [
+    Heading(1, "h"),
+    Paragraph("p"),
+    BulletList(["a"]),
+    NumberedList(["b"]),
+    Table(["k", "v"], [["1", "x"]]),
+    Image("alt", "img.png"),
+]
+
+
+@pytest.mark.parametrize("node", NODES, ids=lambda n: type(n).__name__)
+def test_nodes_are_slotted_and_picklable(node):
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        node.extra = 1
+    assert pickle.loads(pickle.dumps(node)) == node
+
+
+def test_parser_shares_repeated_table_cells():
+    text = "| k | v |\n|---|---|\n| a | yes |\n| b | yes |\n\n| k | v |\n| c | yes |\n"
+    doc = MarkdownParserImpl().parse(text)
+    first, second = (n for n in doc.nodes if isinstance(n, Table))
+    assert first.rows[0][1] is first.rows[1][1] is second.rows[0][1]
+    assert first.headers[0] is second.headers[0]
+    # the lists themselves stay independent
+    first.rows[0][1] = "no"
+    assert first.rows[1][1] == "yes"
+    assert isinstance(doc, Document)
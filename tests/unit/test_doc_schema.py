@@ -0,0 +1,228 @@
+import pytest
+
+from mddocs.adapters.markdown_parser import parse_markdown
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_cursor import NodeCursor
+from mddocs.domain.doc_ir import BulletList, Heading, Paragraph, Table
+from mddocs.domain.doc_schema import (
+    DocSchema,
+    FrontMatter,
+    Items,
+    KeyValueTable,
+    SchemaPlan,
+    Text,
+    Title,
+)
+
+
+class ApiSpec(DocSchema):
+    title = Title()
+    summary = Text("概要")
+    params = KeyValueTable("パラメータ", headers=("名前", "説明"))
+    tags = Items("タグ")
+    author = FrontMatter("author")
+
+
+MD = """<!--
+author: alice
+-->
+
+# get_user
+
+## 概要
+
+ユーザを取得する。
+
+ID で検索する。
+
+## パラメータ
+
+| 名前 | 説明 |
+| - | - |
+| id | ユーザ ID |
+
+### 補足
+
+補足の段落は概要に含まれない。
+
+## タグ
+
+- user
+- read
+"""
+
+
+def test_schema_loads_fields_from_document():
+    doc = parse_markdown(MD)
+    spec = ApiSpec.from_nodes(doc.nodes, doc.front_matter)
+    assert spec.title == "get_user"
+    assert spec.summary == "ユーザを取得する。\n\nID で検索する。"
+    assert spec.params == {"id": "ユーザ ID"}
+    assert spec.tags == ["user", "read"]
+    assert spec.author == "alice"
+
+
+def test_schema_round_trips_through_nodes():
+    spec = ApiSpec(
+        title="t", summary="a\n\nb", params={"k": "v"}, tags=["x"], author="bob"
+    )
+    nodes = spec.to_nodes()
+    assert nodes == [
+        Heading(1, "t"),
+        Heading(2, "概要"),
+        Paragraph("a"),
+        Paragraph("b"),
+        Heading(2, "パラメータ"),
+        Table(headers=["名前", "説明"], rows=[["k", "v"]]),
+        Heading(2, "タグ"),
+        BulletList(items=["x"]),
+    ]
+    assert spec.to_front_matter() == {"author": "bob"}
+    assert ApiSpec.from_nodes(nodes, spec.to_front_matter()) == spec
+
+
+def test_missing_fields_use_defaults_and_are_not_dumped():
+    class WithDefault(DocSchema):
+        title = Title()
+        tags = Items("タグ", default=())
+
+    m = WithDefault.from_nodes([Heading(1, "only")])
+    assert m.title == "only" and m.tags == ()
+    assert WithDefault(title="t", tags=None).to_nodes() == [Heading(1, "t")]
+    assert WithDefault().title is None
+
+
+def test_required_field_raises_when_missing():
+    class Strict(DocSchema):
+        title = Title(required=True)
+
+    with pytest.raises(ValueError):
+        Strict.from_nodes([Paragraph("no heading")])
+
+
+def test_unknown_constructor_field_raises():
+    with pytest.raises(TypeError):
+        ApiSpec(nope=1)
+
+
+def test_first_matching_heading_wins_and_level_must_match():
+    nodes = [
+        Heading(3, "概要"),
+        Paragraph("深い"),
+        Heading(2, "概要"),
+        Paragraph("1"),
+        Heading(2, "概要"),
+        Paragraph("2"),
+    ]
+    assert ApiSpec.from_nodes(nodes).summary == "1"
+
+
+def test_plan_is_compiled_once_per_class_and_inherited():
+    class Base(DocSchema):
+        title = Title()
+
+    class Child(Base):
+        summary = Text("概要")
+
+    assert isinstance(Child.__schema_plan__, SchemaPlan)
+    assert Child.__schema_plan__ is not Base.__schema_plan__
+    assert [f.name for f in Child.__schema_plan__.fields] == ["title", "summary"]
+    assert [f.name for f in Base.__schema_plan__.fields] == ["title"]
+
+
+def test_shared_field_instances_keep_their_own_names():
+    shared = Text("概要")
+
+    class Two(DocSchema):
+        a = b = shared
+
+    class Other(DocSchema):
+        summary = shared
+
+    assert [f.name for f in Two.__schema_plan__.fields] == ["a", "b"]
+    assert [f.name for f in Other.__schema_plan__.fields] == ["summary"]
+    assert shared.name == ""
+    m = Two.from_nodes([Heading(2, "概要"), Paragraph("x")])
+    assert (m.a, m.b) == ("x", "x")
+    assert Other.from_nodes([Heading(2, "概要"), Paragraph("y")]).summary == "y"
+
+
+def test_slotted_subclass_loads():
+    class Slotted(DocSchema):
+        __slots__ = ("extra",)
+        title = Title()
+
+    m = Slotted.from_nodes([Heading(1, "T")])
+    assert m.title == "T" and m == Slotted(title="T")
+
+
+def test_plan_stops_scanning_after_last_field():
+    class Probe(list):
+        reads = 0
+
+        def __iter__(self):
+            for n in super().__iter__():
+                Probe.reads += 1
+                yield n
+
+    nodes = Probe(
+        [Heading(1, "t"), Heading(2, "概要"), Paragraph("s"), Heading(2, "x")]
+        + [Paragraph("tail")] * 100
+    )
+
+    class Small(DocSchema):
+        title = Title()
+        summary = Text("概要")
+
+    assert Small.from_nodes(nodes).summary == "s"
+    assert Probe.reads == 4
+
+
+def test_from_cursor_loads_a_section_window():
+    nodes = [
+        Heading(1, "doc"),
+        Heading(2, "A"),
+        Heading(3, "概要"),
+        Paragraph("a"),
+        Heading(2, "B"),
+        Heading(3, "概要"),
+        Paragraph("b"),
+    ]
+
+    class Part(DocSchema):
+        name = Title(level=2)
+        summary = Text("概要", level=3)
+
+    cur = NodeCursor(nodes)
+    cur.seek_heading("B")
+    part = Part.from_cursor(cur.section())
+    assert part == Part(name="B", summary="b")
+    # from_nodes 経由でも同じ（DocConvertible の既定の from_cursor 解決を使わない）
+    assert Part.from_nodes(nodes[4:]) == part
+
+
+def test_docconvertible_resolves_from_cursor_per_call():
+    class Plain(DocConvertible):
+        def __init__(self, n):
+            self.n = n
+
+        @classmethod
+        def from_cursor(cls, cur):
+            return cls(len(cur.nodes))
+
+        def to_nodes(self):
+            return []
+
+    class NoCursor(DocConvertible):
+        def to_nodes(self):
+            return []
+
+    assert Plain.from_nodes([Paragraph("x")]).n == 1
+    with pytest.raises(NotImplementedError):
+        NoCursor.from_nodes([])
+
+    # from_cursor assigned after the class was defined is used as well
+    Plain.from_cursor = classmethod(lambda cls, cur: cls(-1))
+    assert Plain.from_nodes([Paragraph("x")]).n == -1
+    NoCursor.from_cursor = classmethod(lambda cls, cur: "late")
+    assert NoCursor.from_nodes([]) == "late"
@@ -0,0 +1,98 @@
+import pytest
+
+from mddocs.domain.doc_ir import BulletList, Heading, Paragraph
+from mddocs.domain.doc_sections import NodeView, SectionTree
+from mddocs.domain.document_inspector import DocumentInspector
+
+NODES = [
+    Paragraph("preamble"),  # 0
+    Heading(1, "Spec"),  # 1
+    Paragraph("intro"),  # 2
+    Heading(2, "API"),  # 3
+    Paragraph("api body"),  # 4
+    Heading(3, "Errors"),  # 5
+    BulletList(["E1"]),  # 6
+    Heading(2, "Data"),  # 7
+    Heading(4, "Deep"),  # 8  (skips level 3)
+    Paragraph("deep body"),  # 9
+    Heading(1, "Appendix"),  # 10
+    Heading(2, "API"),  # 11
+]
+
+
+def _naive_end(nodes, i):
+    level = nodes[i].level
+    for j in range(i + 1, len(nodes)):
+        if isinstance(nodes[j], Heading) and nodes[j].level <= level:
+            return j
+    return len(nodes)
+
+
+def test_spans_match_naive_scan(random_document):
+    for seed in range(200):
+        nodes = random_document(seed).nodes
+        tree = SectionTree(nodes)
+        heads = [i for i, n in enumerate(nodes) if isinstance(n, Heading)]
+        assert [s.start for s in tree.sections] == heads
+        for s in tree.sections:
+            assert s.end == _naive_end(nodes, s.start)
+            for c in s.children:
+                assert s.start < c.start and c.end <= s.end
+        for i in range(len(nodes)):
+            s = tree.section_at(i)
+            assert s.start <= i < s.end
+            assert all(not (c.start <= i < c.end) for c in s.children)
+
+
+def test_tree_shape_and_views():
+    tree = SectionTree(NODES)
+    assert [c.title for c in tree.root.children] == ["Spec", "Appendix"]
+    assert list(tree.root.body) == [Paragraph("preamble")]
+
+    api = tree.find(("Spec", "API"))
+    assert api is not None
+    assert (api.start, api.end) == (3, 7)
+    assert api.nodes == NODES[3:7]
+    assert api.body == [Paragraph("api body")]
+    assert [c.title for c in api.children] == ["Errors"]
+
+    deep = tree.find(["Spec", "Data", "Deep"])
+    assert deep is not None and deep.parent is tree.find(("Spec", "Data"))
+    assert tree.find(("API",)) is None
+    assert [s.start for s in tree.find_all(("Appendix", "API"))] == [11]
+    assert tree.section_at(9) is deep and tree.section_at(0) is tree.root
+    assert [s.title for s in tree.root.walk()][1:] == [
+        "Spec",
+        "API",
+        "Errors",
+        "Data",
+        "Deep",
+        "Appendix",
+        "API",
+    ]
+    assert tree.root.child("Spec").child("API") is api
+
+
+def test_views_do_not_copy():
+    nodes = list(NODES)
+    view = SectionTree(nodes).find(("Spec", "API")).nodes
+    assert view[0] is nodes[3]
+    nodes[4] = Paragraph("changed")
+    assert view[1] == Paragraph("changed")  # same underlying list
+    sub = view[1:]
+    assert isinstance(sub, NodeView) and (sub.start, sub.end) == (4, 7)
+    assert NodeView(sub, 1).start == 5  # views of views stay flat
+    copy = view.to_list()
+    nodes[4] = Paragraph("again")
+    assert copy[1] == Paragraph("changed")
+    with pytest.raises(IndexError):
+        NodeView(nodes, 5, 99)
+    with pytest.raises(ValueError):
+        view[::2]
+
+
+def test_inspector_section_lookup():
+    ins = DocumentInspector(list(NODES))
+    assert ins.section("Spec", "API", "Errors").body == [BulletList(["E1"])]
+    assert ins.section("missing") is None
+    assert ins.sections() is ins.sections()
@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_ir import (
+    BulletList,
+    Document,
+    Heading,
+    Image,
+    NumberedList,
+    Paragraph,
+    Table,
+)
+from mddocs.domain.doc_source import splice_source
+from mddocs.domain.ir_serializers import document_to_markdown
+
+PARSER = MarkdownParserImpl()
+
+_LINES = [
+    "",
+    "",
+    "# Title",
+    "##  Spaced   heading",
+    "- item",
+    "*   star item",
+    "1. one",
+    "|a|b|",
+    "|-|-|",
+    "|  x  |  y  |",
+    "![alt](img.png)",
+    "plain   paragraph   text",
+    "  indented text",
+]
+
+_NEW_NODES = [
+    Heading(2, "New"),
+    Paragraph("changed text"),
+    BulletList(["n1", "n2"]),
+    NumberedList(["first"]),
+    Table(["k", "v"], [["1", "2"]]),
+    Image("pic", "new.png"),
+]
+
+
+def _edit(rng: random.Random, doc: Document) -> Document:
+    nodes = list(doc.nodes)
+    for _ in range(rng.randint(0, 3)):
+        op = rng.choice(["replace", "insert", "delete"])
+        if op == "insert" or not nodes:
+            nodes.insert(rng.randint(0, len(nodes)), rng.choice(_NEW_NODES))
+        elif op == "replace":
+            nodes[rng.randrange(len(nodes))] = rng.choice(_NEW_NODES)
+        else:
+            del nodes[rng.randrange(len(nodes))]
+    front_matter = dict(doc.front_matter)
+    if rng.random() < 0.3:
+        front_matter["title"] = "changed"
+    return Document(front_matter, nodes)
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_random_edits_parse_back_to_the_new_document(seed: int):
+    rng = random.Random(seed)
+    lines = [rng.choice(_LINES) for _ in range(rng.randint(0, 30))]
+    if rng.random() < 0.5:
+        lines = ["<!--", "title: t", "-->", *lines]
+    eol = rng.choice(["\n", "\r\n"])
+    text = eol.join(lines) + rng.choice(["", eol])
+    old = PARSER.parse_with_source(text)
+    new = _edit(rng, old)
+
+    out = splice_source(old, new, document_to_markdown)
+
+    assert PARSER.parse(out) == new
+    if new == old:
+        assert out == text
+    if "\r\n" in text:
+        assert "\n" not in out.replace("\r\n", "")
+
+
+def test_untouched_nodes_keep_their_formatting():
+    text = "#   Title\n\n|a|b|\n|-|-|\n|1|2|\n\n\n*   one\n*   two\n\nsome   text\n"
+    old = PARSER.parse_with_source(text)
+    nodes = list(old.nodes)
+    nodes[1] = Table(["a", "b"], [["1", "3"]])
+    calls = []
+
+    def render(doc):
+        calls.append(doc.nodes)
+        return document_to_markdown(doc)
+
+    out = splice_source(old, Document({}, nodes), render)
+    assert out == (
+        "#   Title\n\n| a | b |\n| ---- | ---- |\n| 1 | 3 |\n\n\n"
+        "*   one\n*   two\n\nsome   text\n"
+    )
+    assert calls == [[nodes[1]]]
+
+
+def test_front_matter_changes_only_rerender_the_front_matter():
+    text = "<!--\nb: 2\n-->\n# T\n"
+    old = PARSER.parse_with_source(text)
+    out = splice_source(
+        old, Document({"b": "3"}, list(old.nodes)), document_to_markdown
+    )
+    assert out == "<!--\nb: 3\n-->\n\n# T\n"
+    out = splice_source(old, Document({}, list(old.nodes)), document_to_markdown)
+    assert out == "# T\n"
+
+
+def test_blocks_without_a_blank_line_get_one_when_neighbours_change():
+    old = PARSER.parse_with_source("para\n- x\nmore")
+    new = Document({}, [Paragraph("para"), Paragraph("more")])
+    out = splice_source(old, new, document_to_markdown)
+    assert out == "para\n\nmore"
+    assert PARSER.parse(out) == new
+
+
+def test_requires_a_source_map():
+    doc = PARSER.parse("# a\n")
+    with pytest.raises(ValueError):
+        splice_source(doc, doc, document_to_markdown)
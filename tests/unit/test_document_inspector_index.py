@@ -0,0 +1,106 @@
+"""The indexed `DocumentInspector` must answer exactly like the linear scans."""
+
+from mddocs.domain.doc_ir import (
+    BulletList,
+    ColumnarTable,
+    Document,
+    Heading,
+    Paragraph,
+    Table,
+)
+from mddocs.domain.document_inspector import DocumentInspector
+
+
+def _scan_bullet_list_after(nodes, text, level):
+    for i, n in enumerate(nodes):
+        if (
+            isinstance(n, Heading)
+            and n.level == level
+            and n.text == text
+            and i + 1 < len(nodes)
+            and isinstance(nodes[i + 1], BulletList)
+        ):
+            return nodes[i + 1].items
+    return []
+
+
+def _check(nodes):
+    ins = DocumentInspector(nodes)
+    for level in range(0, 8):
+        expected = [n for n in nodes if isinstance(n, Heading) and n.level == level]
+        assert ins.find_heading(level) == expected
+        assert ins.first_heading(level) is (expected[0] if expected else None)
+    texts = {n.text for n in nodes if isinstance(n, Heading)} | {"missing"}
+    for text in texts:
+        for level in range(1, 7):
+            got = ins.bullet_list_after(text, level)
+            assert got is not None
+            assert got == _scan_bullet_list_after(nodes, text, level)
+    tables = ins.tables()
+    assert len(tables) == sum(isinstance(n, Table) for n in nodes)
+    assert all(
+        a is b for a, b in zip(tables, (n for n in nodes if isinstance(n, Table)))
+    )
+
+
+def test_matches_linear_scans(random_document):
+    for seed in range(300):
+        doc = random_document(seed)
+        # repeated headings so that (level, text) keys collide
+        doc.nodes[1:1] = [Heading(2, "dup"), Paragraph("p"), Heading(2, "dup")]
+        doc.nodes.append(BulletList(["after dup"]))
+        _check(doc.nodes)
+
+
+def test_tables_include_subclasses_in_document_order():
+    nodes = [Table(["a"], []), ColumnarTable(["b"], [["1"]]), Table(["c"], [])]
+    ins = DocumentInspector(nodes)
+    assert [t.headers for t in ins.tables()] == [["a"], ["b"], ["c"]]
+    assert ins.of_type(ColumnarTable) == [nodes[1]]
+    assert ins.of_type(Paragraph) == []
+
+
+def test_index_follows_structural_changes():
+    nodes = [Heading(1, "a")]
+    ins = DocumentInspector(nodes)
+    assert ins.find_heading(1) == [Heading(1, "a")]
+    nodes.append(Heading(1, "b"))  # length change is detected
+    assert [h.text for h in ins.find_heading(1)] == ["a", "b"]
+    ins.nodes = [Heading(2, "c")]  # replaced list is detected
+    assert ins.find_heading(1) == []
+    ins.nodes[0].level = 1  # in-place edits need reindex()
+    ins.reindex()
+    assert ins.first_heading(1) is ins.nodes[0]
+
+
+def test_index_follows_in_place_list_edits():
+    nodes = [Heading(1, "a"), Paragraph("p"), Heading(2, "b"), BulletList(["x"])]
+    doc = Document({}, nodes)
+    ins = DocumentInspector(doc.nodes)
+    _check(doc.nodes)
+    assert ins.first_heading(1) == Heading(1, "a")
+
+    doc.nodes[0] = Heading(2, "renamed")  # same length, replaced element
+    assert ins.first_heading(1) is None
+    assert [h.text for h in ins.find_heading(2)] == ["renamed", "b"]
+    _check(doc.nodes)
+
+    doc.nodes[1:3] = [Table(["h"], []), Heading(1, "new")]  # slice assignment
+    assert ins.tables() == [Table(["h"], [])]
+    assert ins.first_heading(1) is doc.nodes[2]
+    assert ins.bullet_list_after("new", 1) == ["x"]
+    _check(doc.nodes)
+
+    del doc.nodes[0]
+    doc.nodes.insert(2, Heading(3, "c"))  # length restored, contents shifted
+    assert ins.bullet_list_after("new", 1) == []
+    assert ins.section("new", "c") is not None
+    _check(doc.nodes)
+
+
+def test_results_are_copies():
+    ins = DocumentInspector([Heading(1, "a"), Table(["h"], [])])
+    ins.find_heading(1).clear()
+    ins.tables().clear()
+    assert len(ins.find_heading(1)) == 1
+    assert len(ins.tables()) == 1
@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import pytest
+
+from mddocs.adapters.file_storage import MmapFileStorage
+from mddocs.adapters.markdown_parser import MarkdownParseError, MarkdownParserImpl
+
+MD = """<!--
+title: マップ
+-->
+
+# 見出し
+
+段落の
+テキスト
+
+| キー | 値 |
+| - | - |
+| a | 1 |
+
+1. one
+2. two
+
+![図](img.png)
+"""
+
+
+def test_parse_bytes_from_mapped_file_matches_parse(tmp_path: Path):
+    p = tmp_path / "doc.md"
+    p.write_text(MD, encoding="utf-8")
+    storage = MmapFileStorage()
+    parser = MarkdownParserImpl()
+
+    with storage.open_mapped(p) as data:
+        doc = parser.parse_bytes(data)
+    # The mapping must be closable after parsing (no exported buffers left).
+    assert doc == parser.parse(MD)
+    assert storage.read(p) == MD
+
+
+def test_parse_bytes_handles_crlf_and_missing_final_newline():
+    parser = MarkdownParserImpl()
+    text = MD.replace("\n", "\r\n").rstrip()
+    assert parser.parse_bytes(text.encode("utf-8")) == parser.parse(MD)
+
+
+def test_empty_file_is_mapped_as_empty_bytes(tmp_path: Path):
+    p = tmp_path / "empty.md"
+    p.write_bytes(b"")
+    storage = MmapFileStorage()
+    with storage.open_mapped(p) as data:
+        assert data == b""
+        doc = MarkdownParserImpl().parse_bytes(data)
+    assert doc.front_matter == {} and doc.nodes == []
+    assert storage.read(p) == ""
+
+
+def test_parse_bytes_reports_line_numbers(tmp_path: Path):
+    p = tmp_path / "bad.md"
+    p.write_bytes("# ok\n\n本文\n![壊れた](\n".encode("utf-8"))
+    with MmapFileStorage().open_mapped(p) as data:
+        with pytest.raises(MarkdownParseError, match="line 4"):
+            MarkdownParserImpl().parse_bytes(data)
+
+
+@pytest.mark.parametrize("window", [1, 2, 3, 7, 64])
+def test_buffer_lines_are_split_the_same_for_any_window(window: int):
+    from mddocs.adapters.markdown_parser import _iter_buffer_lines
+
+    text = MD.replace("\n\n", "\r\n\r\n") + "末尾"
+    lines = list(_iter_buffer_lines(text.encode("utf-8"), window=window))
+    assert lines == text.splitlines()
+
+
+_EOLS = ["\r", "\u2028", "\x0c", "\x85", "\r\n", "\n"]
+
+
+@pytest.mark.parametrize("eol", _EOLS)
+def test_parse_bytes_splits_lines_like_parse(eol: str):
+    text = MD.replace("\n", eol) + "tail\rline x\n"
+    parser = MarkdownParserImpl()
+    assert parser.parse_bytes(text.encode("utf-8")) == parser.parse(text)
+
+
+@pytest.mark.parametrize("eol", _EOLS)
+@pytest.mark.parametrize("window", [1, 2, 5, 64])
+def test_buffer_lines_match_splitlines_for_every_separator(eol: str, window: int):
+    from mddocs.adapters.markdown_parser import _iter_buffer_lines
+
+    text = MD.replace("\n", eol) + "a\r\nb\rc\n\rd"
+    lines = list(_iter_buffer_lines(text.encode("utf-8"), window=window))
+    assert lines == text.splitlines()
+
+
+@pytest.mark.parametrize("eol", ["\r", "\r\n", "\u2028"])
+def test_mapped_read_matches_file_storage_read(tmp_path: Path, eol: str):
+    from mddocs.adapters.file_storage import FileStorage
+
+    p = tmp_path / "doc.md"
+    p.write_bytes(MD.replace("\n", eol).encode("utf-8"))
+    assert MmapFileStorage().read(p) == FileStorage().read(p)
+    assert MmapFileStorage().read_exact(p) == FileStorage().read_exact(p)
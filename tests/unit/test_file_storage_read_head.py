@@ -0,0 +1,24 @@
+from mddocs.adapters.file_storage import FileStorage, MmapFileStorage
+
+
+def test_read_head_returns_whole_small_file(tmp_path):
+    path = tmp_path / "a.md"
+    path.write_bytes("héllo\n".encode("utf-8"))
+    assert FileStorage().read_head(path, 64) == ("héllo\n", True)
+    # ちょうど size バイトのファイルも末尾まで読んだことになる
+    assert FileStorage().read_head(path, 7) == ("héllo\n", True)
+
+
+def test_read_head_stops_at_size_and_drops_cut_character(tmp_path):
+    path = tmp_path / "a.md"
+    path.write_bytes("aé bc".encode("utf-8"))  # b"a\xc3\xa9 bc"
+    storage = FileStorage()
+    assert storage.read_head(path, 2) == ("a", False)
+    assert storage.read_head(path, 3) == ("aé", False)
+    assert storage.read_head(path, 5) == ("aé b", False)
+
+
+def test_read_head_is_inherited_by_mmap_storage(tmp_path):
+    path = tmp_path / "a.md"
+    path.write_text("x" * 100, encoding="utf-8")
+    assert MmapFileStorage().read_head(path, 10) == ("x" * 10, False)
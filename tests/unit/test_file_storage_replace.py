@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+from mddocs.adapters.file_storage import FileStorage
+
+
+def _tmp_files(directory):
+    return [p for p in directory.iterdir() if p.name.endswith(".tmp")]
+
+
+def test_replace_creates_and_overwrites(tmp_path):
+    storage = FileStorage()
+    path = tmp_path / "a.md"
+    assert storage.replace(path, "one\n") is True
+    assert path.read_text(encoding="utf-8") == "one\n"
+    assert storage.replace(path, "two\n") is True
+    assert path.read_text(encoding="utf-8") == "two\n"
+    assert _tmp_files(tmp_path) == []
+
+
+def test_unchanged_content_is_not_written(tmp_path):
+    storage = FileStorage()
+    path = tmp_path / "a.md"
+    storage.write(path, "same ü\n")
+    os.utime(path, ns=(1, 1))
+    assert storage.replace(path, "same ü\n") is False
+    assert path.stat().st_mtime_ns == 1
+    assert storage.replace(path, "same ü\n", skip_unchanged=False) is True
+    assert path.stat().st_mtime_ns != 1
+
+
+@pytest.mark.parametrize(
+    "old, pieces",
+    [
+        ("abcdef", ["abc", "deX"]),  # differs after a matched prefix
+        ("abcdef", ["abc"]),  # new content is a prefix of the old one
+        ("abc", ["abc", "def"]),  # old content is a prefix of the new one
+        ("", ["x"]),
+        ("x", [""]),
+    ],
+)
+def test_streamed_writes_compare_incrementally(tmp_path, old, pieces):
+    storage = FileStorage()
+    path = tmp_path / "a.md"
+    path.write_bytes(old.encode())
+    with storage.open_replace(path) as fp:
+        for piece in pieces:
+            fp.write(piece)
+    assert fp.written is True
+    assert path.read_text(encoding="utf-8") == "".join(pieces)
+    assert _tmp_files(tmp_path) == []
+
+
+def test_failure_keeps_existing_file(tmp_path):
+    storage = FileStorage()
+    path = tmp_path / "a.md"
+    storage.write(path, "old\n")
+    with pytest.raises(RuntimeError):
+        with storage.open_replace(path) as fp:
+            fp.write("new")
+            raise RuntimeError("render failed")
+    assert path.read_text(encoding="utf-8") == "old\n"
+    assert _tmp_files(tmp_path) == []
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_replace_keeps_file_mode(tmp_path):
+    storage = FileStorage()
+    path = tmp_path / "a.md"
+    storage.write(path, "old\n")
+    path.chmod(0o640)
+    storage.replace(path, "new\n")
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_exact_read_and_replace_keep_crlf(tmp_path):
+    storage = FileStorage()
+    path = tmp_path / "a.md"
+    path.write_bytes(b"a\r\nb\n")
+    assert storage.read(path) == "a\nb\n"
+    assert storage.read_exact(path) == "a\r\nb\n"
+    assert storage.replace_exact(path, "a\r\nb\n") is False
+    assert storage.replace_exact(path, "a\r\nc\n") is True
+    assert path.read_bytes() == b"a\r\nc\n"
+    assert _tmp_files(tmp_path) == []
+
+
+def test_open_write_replaces_only_on_success(tmp_path):
+    storage = FileStorage()
+    path = tmp_path / "a.md"
+    storage.write(path, "old\n")
+    with pytest.raises(RuntimeError):
+        with storage.open_write(path) as fp:
+            fp.write("new")
+            raise RuntimeError("render failed")
+    assert path.read_text(encoding="utf-8") == "old\n"
+    assert _tmp_files(tmp_path) == []
+    with storage.open_write(path) as fp:
+        fp.write("new\n")
+    assert path.read_text(encoding="utf-8") == "new\n"
+    assert _tmp_files(tmp_path) == []
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions and symlinks")
+def test_open_write_keeps_mode_and_writes_through_symlinks(tmp_path):
+    storage = FileStorage()
+    target = tmp_path / "target.md"
+    storage.write(target, "old\n")
+    target.chmod(0o640)
+    link = tmp_path / "link.md"
+    link.symlink_to(target)
+    with storage.open_write(link) as fp:
+        fp.write("new\n")
+    assert link.is_symlink()
+    assert target.read_text(encoding="utf-8") == "new\n"
+    assert target.stat().st_mode & 0o777 == 0o640
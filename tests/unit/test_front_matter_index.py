@@ -0,0 +1,176 @@
+import contextlib
+import os
+from pathlib import Path
+
+import pytest
+
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.front_matter_index import FrontMatterIndex
+from mddocs.adapters.markdown_parser import MarkdownParseError, MarkdownParserImpl
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+
+
+def _write(path, front_matter: dict, body: str = "# h\n") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fm = "".join(f"{k}: {v}\n" for k, v in front_matter.items())
+    path.write_text(f"<!--\n{fm}-->\n\n{body}", encoding="utf-8")
+
+
+class CountingLoader:
+    def __init__(self):
+        self.uc = ConvertFileUsecase(MarkdownParserImpl(), None, FileStorage())
+        self.calls = []
+
+    def __call__(self, path):
+        self.calls.append(path)
+        return self.uc.load_front_matter(path)
+
+
+def _corpus(root):
+    _write(root / "a.md", {"status": "draft", "owner": "alice"})
+    _write(root / "b.md", {"status": "done", "owner": "bob"})
+    _write(root / "sub" / "c.md", {"status": "draft-2", "owner": "alice"})
+    _write(root / "sub" / "deep" / "d.md", {})
+    (root / "notes.txt").write_text("<!--\nstatus: draft\n-->\n", encoding="utf-8")
+
+
+def test_build_and_query(tmp_path):
+    root = tmp_path / "docs"
+    _corpus(root)
+    loader = CountingLoader()
+    with FrontMatterIndex(tmp_path / "fm.db", root, loader) as index:
+        result = index.update()
+        assert (result.added, result.updated, result.removed) == (4, 0, 0)
+        assert len(index) == 4
+        assert index.find("status", "draft") == [root / "a.md"]
+        assert index.find_prefix("status", "draft") == [
+            root / "a.md",
+            root / "sub" / "c.md",
+        ]
+        assert index.find_prefix("owner", "") == [
+            root / "a.md",
+            root / "b.md",
+            root / "sub" / "c.md",
+        ]
+        assert index.find("owner", "carol") == []
+        assert index.get(root / "b.md") == {"status": "done", "owner": "bob"}
+        assert index.get("sub/deep/d.md") == {}
+        assert index.get("missing.md") is None
+        assert index.keys() == ["owner", "status"]
+
+
+def test_update_rereads_only_changed_files(tmp_path):
+    root = tmp_path / "docs"
+    _corpus(root)
+    db = tmp_path / "fm.db"
+    with FrontMatterIndex(db, root, CountingLoader()) as index:
+        index.update()
+
+    _write(root / "b.md", {"status": "draft", "owner": "bob", "extra": "x"})
+    os.utime(root / "b.md", ns=(1, 1))
+    (root / "sub" / "c.md").unlink()
+    _write(root / "e.md", {"status": "draft"})
+
+    loader = CountingLoader()
+    with FrontMatterIndex(db, root, loader) as index:
+        result = index.update()
+        assert (result.added, result.updated, result.removed) == (1, 1, 1)
+        assert result.unchanged == 2
+        assert sorted(p.name for p in loader.calls) == ["b.md", "e.md"]
+        assert index.find("status", "draft") == [
+            root / "a.md",
+            root / "b.md",
+            root / "e.md",
+        ]
+        assert index.find_prefix("status", "draft-") == []
+        assert index.get("b.md")["extra"] == "x"
+
+        loader.calls.clear()
+        again = index.update()
+        assert loader.calls == [] and again.unchanged == 4
+
+
+def test_unreadable_file_is_recorded_as_error(tmp_path):
+    root = tmp_path / "docs"
+    _corpus(root)
+    (root / "bad.md").write_bytes(b"<!--\nstatus: \xff\n-->\n")
+    with FrontMatterIndex(tmp_path / "fm.db", root, CountingLoader()) as index:
+        result = index.update()
+        assert list(result.errors) == [root / "bad.md"]
+        assert index.get("bad.md") == {}
+        # failed files are retried by every update until they load
+        assert list(index.update().errors) == [root / "bad.md"]
+        _write(root / "bad.md", {"status": "fixed"})
+        again = index.update()
+        assert again.errors == {} and again.updated == 1
+        assert index.get("bad.md") == {"status": "fixed"}
+        assert index.update().unchanged == 5
+
+
+def test_parse_errors_are_recorded_and_other_errors_propagate(tmp_path):
+    root = tmp_path / "docs"
+    _corpus(root)
+
+    def loader(path):
+        if path.name == "a.md":
+            raise MarkdownParseError("line 1: broken")
+        if path.name == "b.md":
+            raise TypeError("bug in the loader")
+        return {}
+
+    with FrontMatterIndex(tmp_path / "fm.db", root, loader) as index:
+        with pytest.raises(TypeError, match="bug in the loader"):
+            index.update()
+        (root / "b.md").unlink()
+        result = index.update()
+        assert list(result.errors) == [root / "a.md"]
+        assert isinstance(result.errors[root / "a.md"], MarkdownParseError)
+
+
+def test_files_removed_during_the_scan_are_skipped(tmp_path, monkeypatch):
+    root = tmp_path / "docs"
+    _corpus(root)
+    real_scandir = os.scandir
+
+    def racing_scandir(path):
+        # list the entries, then delete a file and a directory before the
+        # scan gets to stat them
+        with real_scandir(path) as it:
+            entries = list(it)
+        if Path(path) == root:
+            (root / "b.md").unlink()
+            for p in sorted((root / "sub").rglob("*"), reverse=True):
+                p.unlink() if p.is_file() else p.rmdir()
+            (root / "sub").rmdir()
+        return contextlib.nullcontext(iter(entries))
+
+    with FrontMatterIndex(tmp_path / "fm.db", root, CountingLoader()) as index:
+        monkeypatch.setattr(os, "scandir", racing_scandir)
+        result = index.update()
+        assert result.added == 1 and result.errors == {}
+        assert index.find_prefix("status", "") == [root / "a.md"]
+
+
+def test_outdated_schema_is_rebuilt(tmp_path):
+    import sqlite3
+
+    db = tmp_path / "fm.db"
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE files (x)")
+    conn.commit()
+    conn.close()
+    root = tmp_path / "docs"
+    _corpus(root)
+    with FrontMatterIndex(db, root, CountingLoader()) as index:
+        assert index.update().added == 4
+
+
+def test_prefix_at_the_top_of_unicode_range(tmp_path):
+    root = tmp_path / "docs"
+    top = chr(0x10FFFF)
+    _write(root / "a.md", {"tag": "x" + top + "y"})
+    _write(root / "b.md", {"tag": "y"})
+    with FrontMatterIndex(tmp_path / "fm.db", root, CountingLoader()) as index:
+        index.update()
+        assert index.find_prefix("tag", "x" + top) == [root / "a.md"]
+        assert index.find_prefix("tag", top) == []
@@ -0,0 +1,132 @@
+import marshal
+from pathlib import Path
+
+import pytest
+
+import mddocs.adapters.ir_cache as ir_cache
+from mddocs.adapters.ir_cache import (
+    DiskCachedParser,
+    IRCacheError,
+    decode_document,
+    encode_document,
+)
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_ir import (
+    BulletList,
+    Document,
+    Heading,
+    Image,
+    NumberedList,
+    Paragraph,
+    Table,
+)
+
+DOC = Document(
+    {"title": "キャッシュ", "status": "draft"},
+    [
+        Heading(2, "見出し"),
+        Paragraph("本文"),
+        BulletList(["a", "b"]),
+        NumberedList(["one"]),
+        Table(["k", "v"], [["a", "1"], ["b", ""]]),
+        Image("alt", "img.png"),
+    ],
+)
+
+MD = "<!--\ntitle: t\n-->\n\n# H\n\n| k | v |\n| - | - |\n| a | 1 |\n"
+
+
+class CountingParser(MarkdownParserImpl):
+    def __init__(self):
+        self.calls = 0
+
+    def parse(self, markdown_text: str):
+        self.calls += 1
+        return super().parse(markdown_text)
+
+
+def test_encode_decode_roundtrip():
+    assert decode_document(encode_document(DOC)) == DOC
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"XXXX\x01", b"MDIR\x01garbage", ir_cache._MAGIC + b"short"],
+)
+def test_decode_rejects_invalid_data(data: bytes):
+    with pytest.raises(IRCacheError):
+        decode_document(data)
+
+
+def test_warm_cache_skips_parsing_across_instances(tmp_path: Path):
+    parser = CountingParser()
+    cold = DiskCachedParser(tmp_path, parser)
+    doc = cold.parse(MD)
+    assert (cold.hits, cold.misses) == (0, 1)
+
+    # A new instance (e.g. the next process) finds the entry on disk.
+    warm = DiskCachedParser(tmp_path, parser)
+    assert warm.parse(MD) == doc
+    assert (warm.hits, warm.misses, parser.calls) == (1, 0, 1)
+
+
+def test_parser_version_is_part_of_the_key(tmp_path: Path):
+    parser = CountingParser()
+    DiskCachedParser(tmp_path, parser, version="1").parse(MD)
+    DiskCachedParser(tmp_path, parser, version="2").parse(MD)
+    assert parser.calls == 2
+
+
+@pytest.mark.parametrize("front_matter", [1, [("key",)], [[1, 2, 3]]])
+def test_decode_rejects_corrupt_front_matter(front_matter):
+    data = ir_cache._frame(marshal.dumps((front_matter, [])))
+    with pytest.raises(IRCacheError):
+        decode_document(data)
+
+
+def test_corrupt_entry_is_treated_as_miss(tmp_path: Path):
+    cached = DiskCachedParser(tmp_path)
+    expected = cached.parse(MD)
+    cached.entry_path(MD).write_bytes(b"MDIR\x01broken")
+
+    assert cached.parse(MD) == expected
+    assert cached.misses == 2
+    assert decode_document(cached.entry_path(MD).read_bytes()) == expected
+
+
+@pytest.mark.parametrize("mmap_threshold", [0, 1 << 20])
+def test_flipped_byte_in_entry_is_treated_as_miss(
+    tmp_path: Path, monkeypatch, mmap_threshold: int
+):
+    monkeypatch.setattr(ir_cache, "_MMAP_THRESHOLD", mmap_threshold)
+    md = MD + "\n" + "lorem ipsum " * 40 + "\n"
+    cached = DiskCachedParser(tmp_path)
+    expected = cached.parse(md)
+    entry = cached.entry_path(md)
+    data = bytearray(entry.read_bytes())
+    # the middle byte lies inside the paragraph text, so the payload would
+    # still unmarshal, to a document with the wrong text
+    middle = len(data) // 2
+    assert data[middle : middle + 1] in b"lorem ipsum"
+    data[middle] ^= 0x01
+    entry.write_bytes(data)
+    with pytest.raises(IRCacheError, match="digest"):
+        decode_document(bytes(data))
+
+    assert cached.parse(md) == expected
+    assert cached.misses == 2
+    assert decode_document(entry.read_bytes()) == expected
+
+
+def test_large_entries_are_loaded_through_mmap(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(ir_cache, "_MMAP_THRESHOLD", 0)
+    cached = DiskCachedParser(tmp_path)
+    expected = cached.parse(MD)
+    assert DiskCachedParser(tmp_path).parse(MD) == expected
+
+
+def test_clear_removes_entries(tmp_path: Path):
+    cached = DiskCachedParser(tmp_path)
+    cached.parse(MD)
+    cached.clear()
+    assert not cached.entry_path(MD).exists()
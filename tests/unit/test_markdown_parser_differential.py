@@ -0,0 +1,93 @@
+"""Differential tests: `MarkdownParserImpl` (text and bytes entry points) must
+build the same `Document` as `ReferenceMarkdownParserImpl` (or raise the same
+error)."""
+
+import random
+
+import pytest
+
+from mddocs.adapters.markdown_parser import (
+    MarkdownParseError,
+    MarkdownParserImpl,
+    ReferenceMarkdownParserImpl,
+)
+
+# Lines chosen to hit every block kind and the prefixes that almost match one.
+_LINES = [
+    "",
+    "   ",
+    "　",
+    "# Title",
+    "### Deep heading ",
+    "#NoSpace",
+    "- item",
+    "* star item",
+    "-no space",
+    "-",
+    "*emphasis*",
+    "1. one",
+    "12.\ttab",
+    "1.no space",
+    "٣. arabic digit",
+    "3 not a list",
+    "| a | b |",
+    "| --- | --- |",
+    "|---|:-:|",
+    "| x | y | z |",
+    "|",
+    "![alt](img.png)",
+    "![alt](img.png) trailing",
+    "!not image",
+    "plain paragraph text",
+    "  indented text",
+    "<!-- inline comment -->",
+    "-->",
+    "key: value",
+]
+
+_ERRORS = ["#", "##   ", "![broken](", "![x]"]
+
+
+def _assert_same(text: str) -> None:
+    parser = MarkdownParserImpl()
+    candidates = [parser.parse, lambda t: parser.parse_bytes(t.encode("utf-8"))]
+    try:
+        expected = ReferenceMarkdownParserImpl().parse(text)
+    except MarkdownParseError as e:
+        for parse in candidates:
+            with pytest.raises(MarkdownParseError) as info:
+                parse(text)
+            assert str(info.value) == str(e)
+        return
+    for parse in candidates:
+        assert parse(text) == expected
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_random_documents_match_reference(seed: int):
+    rng = random.Random(seed)
+    lines = [rng.choice(_LINES) for _ in range(rng.randint(0, 40))]
+    if rng.random() < 0.5:
+        lines = ["<!--", "title: t", "bad line", "-->", *lines]
+    if rng.random() < 0.1:
+        lines.insert(rng.randint(0, len(lines)), rng.choice(_ERRORS))
+    _assert_same("\n".join(lines) + rng.choice(["", "\n", "\r\n"]))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "<!--",
+        "<!--\ntitle: x",
+        "<!--\ntitle: x\n-->",
+        "| h |\n| - |",
+        "| h |\nnot a row",
+        "| h |\n| - |\n| - |\n| v |",
+        "para\n# h\npara",
+        "line one\nline two\n\n- a\n- b\n1. c",
+        "# ok\n\n#\n",
+    ],
+)
+def test_edge_cases_match_reference(text: str):
+    _assert_same(text)
@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+from mddocs.adapters.markdown_adapter import MarkdownParserAdapter
+from mddocs.adapters.markdown_parser import MarkdownParseError, MarkdownParserImpl
+from mddocs.domain.doc_ir import Heading, Paragraph
+
+_LINES = [
+    "",
+    "",
+    "   ",
+    "# Title",
+    "### Deep heading ",
+    "- item",
+    "* star item",
+    "1. one",
+    "| a | b |",
+    "| --- | --- |",
+    "| x | y |",
+    "| x | y | z |",
+    "![alt](img.png)",
+    "plain paragraph text",
+    "  indented text",
+]
+
+_SNIPPETS = ["", "x", " ", "\n", "\n\n", "#", "# ", "- ", "1. ", "|", "| - |\n", "-->"]
+
+
+def _full(parser, text):
+    try:
+        return parser.parse_with_source(text)
+    except MarkdownParseError as e:
+        return e
+
+
+def _assert_same(doc, expected):
+    assert doc == expected  # front matter and nodes
+    assert doc.source.text == expected.source.text
+    assert doc.source.spans == expected.source.spans
+    assert doc.source.body_start == expected.source.body_start
+    assert doc.source.body_start_line == expected.source.body_start_line
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_random_edits_match_full_parse(seed: int):
+    rng = random.Random(seed)
+    lines = [rng.choice(_LINES) for _ in range(rng.randint(0, 30))]
+    if rng.random() < 0.4:
+        lines = ["<!--", "title: t", "-->", *lines]
+    eol = rng.choice(["\n", "\n", "\r\n"])
+    text = eol.join(lines) + rng.choice(["", eol])
+    parser = MarkdownParserImpl()
+    doc = _full(parser, text)
+    if isinstance(doc, MarkdownParseError):
+        return
+
+    for _ in range(8):
+        text = doc.source.text
+        offset = rng.randint(0, len(text))
+        removed = rng.randint(0, min(len(text) - offset, 12))
+        if rng.random() < 0.5:
+            inserted = rng.choice(_SNIPPETS).replace("\n", eol)
+        else:
+            inserted = eol.join(rng.choice(_LINES) for _ in range(rng.randint(1, 3)))
+        expected = _full(parser, text[:offset] + inserted + text[offset + removed :])
+        if isinstance(expected, MarkdownParseError):
+            with pytest.raises(MarkdownParseError) as info:
+                parser.reparse(doc, offset, removed, inserted)
+            assert str(info.value) == str(expected)
+            continue
+        result = parser.reparse(doc, offset, removed, inserted)
+        _assert_same(result, expected)
+        doc = result
+
+
+def test_reuses_nodes_outside_the_edited_block():
+    text = "# A\n\npara one\n\n# B\n\npara two\n"
+    parser = MarkdownParserImpl()
+    doc = parser.parse_with_source(text)
+    offset = text.index("one")
+    new = parser.reparse(doc, offset, 3, "1\nmore")
+    assert new.nodes == [
+        Heading(1, "A"),
+        Paragraph("para 1 more"),
+        Heading(1, "B"),
+        Paragraph("para two"),
+    ]
+    assert new.nodes[0] is doc.nodes[0]
+    assert new.nodes[2] is doc.nodes[2] and new.nodes[3] is doc.nodes[3]
+    assert new.source.spans[3].start_line == doc.source.spans[3].start_line + 1
+    # the previous document and its source map are not modified
+    assert doc == parser.parse(text) and doc.source.text == text
+
+
+def test_reparse_rejects_bad_input():
+    parser = MarkdownParserImpl()
+    with pytest.raises(ValueError):
+        parser.reparse(parser.parse("# a\n"), 0, 0, "x")
+    doc = parser.parse_with_source("# a\n")
+    with pytest.raises(ValueError):
+        parser.reparse(doc, 3, 5, "x")
+
+
+def test_adapter_delegates_reparse():
+    class SourceParser:
+        def parse(self, text):
+            return MarkdownParserImpl().parse(text)
+
+        def parse_with_source(self, text):
+            return MarkdownParserImpl().parse_with_source(text)
+
+    for inner in (MarkdownParserImpl(), SourceParser()):
+        adapter = MarkdownParserAdapter(inner)
+        doc = adapter.parse_with_source("# a\n\nb\n")
+        new = adapter.reparse(doc, 5, 1, "c")
+        assert new.nodes == [Heading(1, "a"), Paragraph("c")]
+        assert new.source.text == "# a\n\nc\n"
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from mddocs.adapters.markdown_adapter import MarkdownParserAdapter
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_ir import Heading, Paragraph, SourceSpan
+
+_LINES = [
+    "",
+    "   ",
+    "# Title",
+    "### Deep heading ",
+    "- item",
+    "* star item",
+    "1. one",
+    "| a | b |",
+    "| --- | --- |",
+    "| x | y | z |",
+    "![alt](img.png)",
+    "plain paragraph text",
+    "  indented text",
+    "ｗｉｄｅ テキスト",
+]
+
+
+def test_spans_cover_each_block():
+    text = "<!--\ntitle: t\n-->\n\n# H\npara one\npara two\n\n| a |\n| - |\n| 1 |\n- x"
+    doc = MarkdownParserImpl().parse_with_source(text)
+    assert doc.source is not None
+    assert doc.source.body_start == len("<!--\ntitle: t\n-->\n")
+    assert doc.source.spans == [
+        SourceSpan(4, 5, 19, 23),
+        SourceSpan(5, 7, 23, 41),
+        SourceSpan(8, 11, 42, 60),
+        SourceSpan(11, 12, 60, 63),
+    ]
+    assert [text[s.start : s.end] for s in doc.source.spans] == [
+        "# H\n",
+        "para one\npara two\n",
+        "| a |\n| - |\n| 1 |\n",
+        "- x",
+    ]
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_random_spans_round_trip(seed: int):
+    rng = random.Random(seed)
+    lines = [rng.choice(_LINES) for _ in range(rng.randint(0, 30))]
+    if rng.random() < 0.5:
+        lines = ["<!--", "title: t", "-->", *lines]
+    eol = rng.choice(["\n", "\r\n"])
+    text = eol.join(lines) + rng.choice(["", eol])
+    parser = MarkdownParserImpl()
+
+    doc = parser.parse_with_source(text)
+    assert doc == parser.parse(text)
+    assert doc.source is not None and doc.source.text is text
+    spans = doc.source.spans
+    assert len(spans) == len(doc.nodes)
+    prev = doc.source.body_start
+    for node, span in zip(doc.nodes, spans):
+        assert not text[prev : span.start].strip()  # only blank lines in between
+        assert parser.parse(text[span.start : span.end]).nodes == [node]
+        assert text[span.start : span.end].count(eol) <= span.end_line - span.start_line
+        prev = span.end
+    assert not text[prev:].strip()
+
+
+def test_parse_does_not_record_source():
+    assert MarkdownParserImpl().parse("# a\n").source is None
+
+
+def test_adapter_delegates_parse_with_source():
+    class PlainParser:
+        def parse(self, text):
+            return MarkdownParserImpl().parse(text)
+
+    doc = MarkdownParserAdapter().parse_with_source("# a\n\nb\n")
+    assert doc.nodes == [Heading(1, "a"), Paragraph("b")]
+    assert doc.source is not None
+    assert (
+        MarkdownParserAdapter(PlainParser()).parse_with_source("# a\n").source is None
+    )
@@ -0,0 +1,122 @@
+import io
+import tracemalloc
+
+import pytest
+
+from mddocs.adapters.markdown_parser import (
+    MarkdownParseError,
+    MarkdownParserImpl,
+    _strip_eol,
+    iter_nodes,
+)
+from mddocs.domain.doc_ir import Heading, Paragraph, Table
+
+MD = """<!--
+title: streamed
+-->
+
+# Title
+
+Some text
+continued.
+
+| k | v |
+| - | - |
+| a | 1 |
+
+- x
+- y
+"""
+
+
+def test_parse_stream_matches_parse():
+    p = MarkdownParserImpl()
+    fm, nodes = p.parse_stream(io.StringIO(MD))
+    expected = p.parse(MD)
+    assert fm == expected.front_matter
+    assert list(nodes) == expected.nodes
+
+
+def test_parse_stream_handles_crlf():
+    p = MarkdownParserImpl()
+    text = MD.replace("\n", "\r\n")
+    fm, nodes = p.parse_stream(io.StringIO(text, newline=""))
+    assert fm == {"title": "streamed"}
+    assert list(nodes) == p.parse(MD).nodes
+
+
+def test_nodes_are_yielded_as_soon_as_block_closes():
+    consumed: list[str] = []
+
+    def lines():
+        for line in ["# Title\n", "\n", "para\n", "\n", "| a | b |\n"]:
+            consumed.append(line)
+            yield line
+        raise AssertionError("stream read past the requested node")
+
+    nodes = iter_nodes(lines())
+    assert next(nodes) == Heading(1, "Title")
+    assert len(consumed) == 1  # a heading closes on its own line
+    assert next(nodes) == Paragraph("para")
+    assert len(consumed) == 4  # a paragraph closes at the next blank line
+
+
+def test_front_matter_is_available_before_body_is_read():
+    consumed: list[str] = []
+
+    def lines():
+        for line in ["<!--\n", "a: b\n", "-->\n", "| h |\n", "| v |\n"]:
+            consumed.append(line)
+            yield line
+
+    fm, nodes = MarkdownParserImpl().parse_stream(lines())
+    assert fm == {"a": "b"}
+    # the three comment lines, plus the first body line: the front matter
+    # parser reads one line past "-->" to hand it to the body parser
+    assert len(consumed) == 4
+    assert list(nodes) == [Table(["h"], [["v"]])]
+
+
+def test_strip_eol_removes_exactly_one_terminator():
+    assert _strip_eol("a\r\n") == "a"
+    assert _strip_eol("a\n") == "a"
+    assert _strip_eol("a\r") == "a"
+    assert _strip_eol("a") == "a"
+    assert _strip_eol("a\r\r\n") == "a\r"
+    assert _strip_eol("a\n\n") == "a\n"
+    assert _strip_eol("a\n\r") == "a\n"
+
+
+def test_errors_are_raised_from_the_iterator():
+    nodes = iter_nodes(io.StringIO("# ok\n#\n"))
+    assert next(nodes) == Heading(1, "ok")
+    with pytest.raises(MarkdownParseError, match="line 2"):
+        next(nodes)
+
+
+def _many_tables(n: int):
+    yield "# Tables\n"
+    for i in range(n):
+        yield "\n"
+        yield f"| key{i} | value{i} |\n"
+        yield "| --- | --- |\n"
+        yield f"| a{i} | b{i} |\n"
+
+
+def _stream_peak(n: int) -> int:
+    tracemalloc.start()
+    try:
+        count = 0
+        for _ in iter_nodes(_many_tables(n)):
+            count += 1
+        assert count == n + 1
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_streaming_memory_does_not_grow_with_distinct_cells():
+    # Every table has distinct cells; nothing may be kept after its block.
+    small, large = _stream_peak(1_000), _stream_peak(10_000)
+    assert large < 64 * 1024
+    assert large < small * 2
@@ -0,0 +1,94 @@
+"""Differential tests: the canonical renderer must be byte-identical to the
+mdformat pass whenever it does not fall back."""
+
+import pytest
+
+import mddocs.adapters.markdown_renderer as mr
+from mddocs.adapters.markdown_renderer import (
+    CanonicalRenderMismatch,
+    canonical_markdown,
+    document_to_markdown,
+)
+from mddocs.domain.doc_ir import (
+    BulletList,
+    Document,
+    Heading,
+    Image,
+    NumberedList,
+    Paragraph,
+    Table,
+)
+from mddocs.domain.ir_serializers import document_to_markdown as raw_markdown
+
+mdformat = pytest.importorskip("mdformat")
+
+
+def test_generated_documents_match_mdformat(random_document):
+    fast = 0
+    for seed in range(800):
+        doc = random_document(seed)
+        expected = mdformat.text(raw_markdown(doc))
+        out = canonical_markdown(doc)
+        if out is not None:
+            fast += 1
+            assert out == expected, doc
+        assert document_to_markdown(doc, mode="canonical") == expected, doc
+    assert fast > 50  # the fast path is actually exercised
+
+
+@pytest.mark.parametrize(
+    "doc",
+    [
+        Document({}, []),
+        Document({"title": "t"}, []),
+        Document({}, [Heading(2, "1. Intro"), Paragraph("2024 was a year.")]),
+        Document({}, [NumberedList(["a", "b", "c"]), BulletList(["x"])]),
+        Document({}, [Table(["k", ""], [["a", "1"], []])]),
+        Document({}, [Paragraph("a   b"), Image("alt  text", "img/a.png")]),
+    ],
+)
+def test_fast_path_cases_match_mdformat(doc: Document):
+    out = canonical_markdown(doc)
+    assert out is not None
+    assert out == mdformat.text(raw_markdown(doc))
+
+
+@pytest.mark.parametrize(
+    "doc",
+    [
+        Document({}, [Paragraph("1. looks like a list")]),
+        Document({}, [Paragraph("has *emphasis*")]),
+        Document({}, [BulletList(["a"]), BulletList(["b"])]),
+        Document({}, [Heading(7, "too deep")]),
+        Document({"k": "a --> b"}, []),
+    ],
+)
+def test_non_plain_documents_fall_back(doc: Document):
+    assert canonical_markdown(doc) is None
+    assert document_to_markdown(doc, mode="canonical") == mdformat.text(
+        raw_markdown(doc)
+    )
+
+
+def test_canonical_mode_skips_mdformat_for_plain_documents(monkeypatch):
+    calls = {"count": 0}
+
+    def fake_text(s):
+        calls["count"] += 1
+        return s
+
+    monkeypatch.setattr(
+        mr, "mdformat", type("M", (), {"text": staticmethod(fake_text)})
+    )
+    document_to_markdown(Document({}, [Paragraph("plain")]), mode="canonical")
+    assert calls["count"] == 0
+    document_to_markdown(Document({}, [Paragraph("*x*")]), mode="canonical")
+    assert calls["count"] == 1
+
+
+def test_verify_mode_raises_on_mismatch(monkeypatch):
+    monkeypatch.setattr(
+        mr, "mdformat", type("M", (), {"text": staticmethod(lambda s: "different")})
+    )
+    with pytest.raises(CanonicalRenderMismatch):
+        document_to_markdown(Document({}, [Paragraph("plain")]), mode="verify")
@@ -0,0 +1,109 @@
+"""Per-block memoized formatting must match formatting the whole document."""
+
+import pytest
+
+from mddocs.adapters.markdown_adapter import MarkdownRendererAdapter
+from mddocs.adapters.markdown_renderer import FormattingCache, document_to_markdown
+from mddocs.domain.doc_ir import (
+    BulletList,
+    Document,
+    Heading,
+    NumberedList,
+    Paragraph,
+    Table,
+)
+from mddocs.domain.ir_serializers import document_to_markdown as raw_markdown
+
+mdformat = pytest.importorskip("mdformat")
+
+
+def test_generated_documents_match_whole_document_format(random_document):
+    cache = FormattingCache()
+    for seed in range(1500):
+        doc = random_document(seed)
+        expected = mdformat.text(raw_markdown(doc))
+        assert document_to_markdown(doc, cache=cache) == expected, doc
+        # second render comes from the cache
+        assert document_to_markdown(doc, cache=cache) == expected, doc
+    assert cache.hits > 0
+
+
+@pytest.mark.parametrize(
+    "nodes",
+    [
+        # adjacent lists merge / alternate markers across the chunk boundary
+        [BulletList(["a"]), BulletList(["b"])],
+        [NumberedList(["a", ""]), BulletList([]), NumberedList(["b"])],
+        [BulletList(["a", ""]), BulletList([]), BulletList(["b"])],
+        [NumberedList(["a"]), BulletList(["b"]), NumberedList(["c"])],
+        # indented text continues the previous block
+        [Paragraph("a"), Paragraph("  b")],
+        # link reference definitions affect other blocks
+        [Paragraph("[x]"), Paragraph("[x]: /url")],
+    ],
+)
+def test_context_sensitive_blocks(nodes):
+    doc = Document(front_matter={}, nodes=nodes)
+    expected = mdformat.text(raw_markdown(doc))
+    assert document_to_markdown(doc, cache=FormattingCache()) == expected
+
+
+def test_front_matter_closing_marker_falls_back():
+    doc = Document(front_matter={"a-->": "b"}, nodes=[Paragraph("p")])
+    expected = mdformat.text(raw_markdown(doc))
+    assert document_to_markdown(doc, cache=FormattingCache()) == expected
+
+
+def test_resave_formats_only_changed_block(monkeypatch):
+    calls = []
+    original = mdformat.text
+
+    def counting(text, *args, **kwargs):
+        calls.append(text)
+        return original(text, *args, **kwargs)
+
+    monkeypatch.setattr(mdformat, "text", counting)
+    table = Table(headers=["k", "v"], rows=[["1", "a"], ["2", "b"]])
+    doc = Document(
+        front_matter={"title": "t"},
+        nodes=[Heading(level=1, text="H"), table, Paragraph("body")],
+    )
+    cache = FormattingCache()
+    renderer = MarkdownRendererAdapter(cache=cache)
+    renderer.render(doc)
+    assert len(calls) == 4
+
+    calls.clear()
+    table.rows[1][1] = "changed"
+    out = renderer.render(doc)
+    assert len(calls) == 1 and "changed" in calls[0]
+    assert out == original(raw_markdown(doc))
+
+
+def test_lru_eviction_and_stats():
+    cache = FormattingCache(max_entries=2)
+    upper = str.upper
+    assert cache.format("a", upper) == "A"
+    assert cache.format("b", upper) == "B"
+    assert cache.format("a", upper) == "A"  # hit, "a" becomes most recent
+    cache.format("c", upper)  # evicts "b"
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    cache.format("b", upper)
+    assert (cache.hits, cache.misses) == (1, 4)
+    assert cache.hit_rate == pytest.approx(0.2)
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_byte_budget_bounds_entries():
+    cache = FormattingCache(max_bytes=10)
+    for i in range(5):
+        cache.format(f"{i}" * 4, str.upper)
+    assert len(cache) == 2
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        FormattingCache(max_entries=0)
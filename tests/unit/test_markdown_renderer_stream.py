@@ -0,0 +1,123 @@
+"""`render_to` must write exactly what `document_to_markdown` returns."""
+
+import io
+
+import pytest
+
+import mddocs.adapters.markdown_renderer as mr
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_adapter import (
+    MarkdownParserAdapter,
+    MarkdownRendererAdapter,
+)
+from mddocs.adapters.markdown_renderer import (
+    FormattingCache,
+    document_to_markdown,
+    render_to,
+)
+from mddocs.domain.doc_ir import Document, Paragraph, Table
+from mddocs.domain.ir_serializers import document_to_markdown as raw_markdown
+from mddocs.domain.ir_serializers import iter_markdown
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+from mddocs.usecase.metrics import MetricsAggregator
+
+
+def _streamed(doc, *args):
+    fp = io.StringIO()
+    render_to(doc, fp, *args)
+    return fp.getvalue()
+
+
+def test_iter_markdown_matches_domain_renderer(random_document):
+    for seed in range(300):
+        doc = random_document(seed)
+        assert "".join(iter_markdown(doc)) == raw_markdown(doc)
+
+
+@pytest.mark.parametrize("mode", ["mdformat", "canonical", "verify"])
+def test_render_to_matches_document_to_markdown(random_document, mode):
+    pytest.importorskip("mdformat")
+    cache = FormattingCache()
+    for seed in range(300):
+        doc = random_document(seed)
+        expected = document_to_markdown(doc, mode)
+        assert _streamed(doc, mode) == expected, doc
+        assert _streamed(doc, mode, cache) == expected, doc
+        assert _streamed(doc, mode, cache, MetricsAggregator()) == expected, doc
+
+
+def test_render_to_without_mdformat_streams_raw(monkeypatch, random_document):
+    monkeypatch.setattr(mr, "_get_mdformat", lambda: None)
+    for seed in range(50):
+        doc = random_document(seed)
+        assert _streamed(doc) == raw_markdown(doc)
+        assert _streamed(doc, "mdformat", None, MetricsAggregator()) == raw_markdown(
+            doc
+        )
+
+
+def test_render_to_formats_block_by_block(monkeypatch):
+    calls = []
+    fake = type("M", (), {"text": staticmethod(lambda s: calls.append(s) or s)})
+    monkeypatch.setattr(mr, "mdformat", fake)
+    doc = Document(
+        front_matter={"a": "b"},
+        nodes=[Paragraph("x"), Table(headers=["h"], rows=[["1"], ["2"]])],
+    )
+    _streamed(doc)
+    assert calls == [
+        "<!--\na: b\n-->\n",
+        "x\n",
+        "| h |\n| ---- |\n| 1 |\n| 2 |\n",
+    ]
+
+
+def test_save_streams_through_storage(tmp_path):
+    table = Table(headers=["k", "v"], rows=[[str(i), "x"] for i in range(500)])
+    doc = Document(front_matter={"title": "t"}, nodes=[table])
+
+    class Model:
+        def to_nodes(self):
+            return doc.nodes
+
+        def to_front_matter(self):
+            return doc.front_matter
+
+    opened = []
+
+    class RecordingStorage(FileStorage):
+        def open_write(self, path):
+            opened.append(path)
+            return super().open_write(path)
+
+        def open_replace(self, path, skip_unchanged=True, newline=None):
+            raise AssertionError("a default save should not fsync and rename")
+
+        def write(self, path, content):
+            raise AssertionError("write() should not be used")
+
+    renderer = MarkdownRendererAdapter()
+    usecase = ConvertFileUsecase(MarkdownParserAdapter(), renderer, RecordingStorage())
+    path = tmp_path / "out.md"
+    usecase.save_model_to_path(Model(), path)
+    assert opened == [path]
+    assert path.read_text(encoding="utf-8") == renderer.render(doc)
+
+
+def test_failed_streaming_save_keeps_the_existing_file(tmp_path):
+    class Unknown:
+        pass
+
+    class Model:
+        def to_nodes(self):
+            return [Paragraph("first"), Unknown()]
+
+    path = tmp_path / "keep.md"
+    path.write_text("# keep me\n", encoding="utf-8")
+    usecase = ConvertFileUsecase(
+        MarkdownParserAdapter(), MarkdownRendererAdapter(), FileStorage()
+    )
+    with pytest.raises(TypeError):
+        usecase.save_model_to_path(Model(), path)
+    assert path.read_text(encoding="utf-8") == "# keep me\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["keep.md"]
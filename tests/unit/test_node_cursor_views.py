@@ -0,0 +1,168 @@
+from mddocs.domain.doc_cursor import NodeCursor
+from mddocs.domain.doc_ir import BulletList, Heading, Paragraph, Table
+from mddocs.domain.doc_sections import NodeView
+
+
+def _nodes():
+    return [
+        Heading(level=1, text="Spec"),
+        Paragraph(text="intro"),
+        Heading(level=2, text="A"),
+        Paragraph(text="a1"),
+        Heading(level=3, text="A.1"),
+        Paragraph(text="a11"),
+        Heading(level=2, text="B"),
+        Table(headers=["k", "v"], rows=[["x", "1"]]),
+        Heading(level=1, text="Appendix"),
+        BulletList(items=["z"]),
+    ]
+
+
+def test_cursor_does_not_copy_nodes():
+    nodes = _nodes()
+    cur = NodeCursor(nodes)
+    assert isinstance(cur.view, NodeView)
+    assert cur.view._nodes is nodes
+    cur.next()
+    f = cur.fork()
+    assert f.view._nodes is nodes
+    assert f.index == 0 and f.peek() is nodes[1]
+    assert len(f.view) == len(nodes) - 1
+
+
+def test_fork_is_independent_of_parent_position():
+    cur = NodeCursor(_nodes(), front_matter={"a": 1})
+    f = cur.fork()
+    f.next()
+    f.next()
+    assert cur.index == 0
+    f.front_matter["a"] = 2
+    assert cur.front_matter == {"a": 1}
+
+
+def test_take_returns_bounded_sub_cursor():
+    nodes = _nodes()
+    cur = NodeCursor(nodes)
+    cur.next()
+    sub = cur.take(2)
+    assert list(sub.nodes) == nodes[1:3]
+    assert cur.peek() is nodes[3]
+    sub.next()
+    sub.next()
+    assert sub.done and sub.peek() is None
+    # 残りより多く要求した場合は末尾まで
+    rest = cur.take(100)
+    assert len(rest.nodes) == len(nodes) - 3
+    assert cur.done
+
+
+def test_seek_heading_by_text_and_level():
+    nodes = _nodes()
+    cur = NodeCursor(nodes)
+    h = cur.seek_heading("B")
+    assert h is nodes[6] and cur.peek() is h
+    # 現在位置の見出し自身も対象になる（消費しない）
+    assert cur.seek_heading(level=2) is h
+    cur.next()
+    assert cur.seek_heading(level=2) is None
+    assert cur.peek() is nodes[7]
+    assert cur.seek_heading(level=1, text="Appendix") is nodes[8]
+    assert cur.seek_heading("A") is None
+
+
+def test_seek_heading_stays_inside_window():
+    nodes = _nodes()
+    cur = NodeCursor(nodes)
+    cur.seek_heading("A")
+    sec = cur.section()
+    assert sec.seek_heading("B") is None
+    assert sec.seek_heading("A.1") is nodes[4]
+
+
+def test_section_spans_until_next_heading_of_same_or_higher_level():
+    nodes = _nodes()
+    cur = NodeCursor(nodes)
+    spec = cur.section()
+    assert list(spec.nodes) == nodes[:8]
+    assert cur.peek() is nodes[8]
+
+    spec.next()
+    assert spec.collect_paragraph_text() == "intro"
+    a = spec.section()
+    assert list(a.nodes) == nodes[2:6]
+    b = spec.section()
+    assert list(b.nodes) == nodes[6:8]
+    assert spec.done
+
+    b.expect(Heading)
+    assert b.parse_table_as_dict() == {"x": "1"}
+    assert b.done
+
+
+def test_section_requires_heading():
+    cur = NodeCursor([Paragraph(text="p")])
+    try:
+        cur.section()
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+
+def test_cursor_over_node_view_uses_underlying_list():
+    nodes = _nodes()
+    cur = NodeCursor(NodeView(nodes, 2, 6))
+    assert cur.view._nodes is nodes
+    assert cur.seek_heading("A.1") is nodes[4]
+    assert cur.index == 2
+    assert cur.seek_heading("B") is None
+
+
+def test_cursor_aliases_the_callers_list():
+    nodes = _nodes()
+    cur = NodeCursor(nodes)
+    f = cur.fork()
+    # element replacements are visible through the cursor and its forks
+    nodes[0] = Heading(level=1, text="Renamed")
+    assert cur.peek() is nodes[0] and f.peek() is nodes[0]
+    # the view is read-only; copy it to get a list of one's own
+    try:
+        cur.view[0] = Paragraph(text="x")
+        assert False, "expected TypeError"
+    except TypeError:
+        pass
+    own = cur.view.to_list()
+    own.append(Paragraph(text="extra"))
+    assert len(cur.view) == len(nodes)
+
+
+def test_nodes_is_a_list_owned_by_the_cursor():
+    nodes = _nodes()
+    cur = NodeCursor(nodes)
+    f = cur.fork()
+    assert isinstance(cur.nodes, list) and cur.nodes == nodes
+    assert cur.nodes is cur.nodes and cur.nodes is not nodes
+    # edits go to the cursor's own copy, not to the caller's list or to forks
+    cur.nodes.append(Paragraph(text="extra"))
+    cur.nodes[1:2] = [Heading(level=2, text="New"), Paragraph(text="n")]
+    assert len(nodes) == 10 and len(f.view) == 10
+    assert len(cur.view) == 12
+    assert cur.seek_heading("New") is cur.nodes[1]
+    cur.index = 9
+    assert cur.next() == Heading(level=1, text="Appendix")
+    cur.take_while(lambda n: True)
+    assert cur.done and cur.nodes[-1] == Paragraph(text="extra")
+    del cur.nodes[5:]
+    assert cur.done and cur.peek() is None
+    sub = NodeCursor(nodes).take(3)
+    assert sub.nodes == nodes[:3]
+
+
+def test_assigning_nodes_rebinds_only_that_cursor():
+    cur = NodeCursor(_nodes())
+    f = cur.fork()
+    cur.next()
+    cur.nodes = [Paragraph(text="a"), Heading(level=1, text="H")]
+    assert cur.index == 1 and cur.peek() == Heading(level=1, text="H")
+    assert cur.seek_heading("Spec") is None
+    assert f.peek() == Heading(level=1, text="Spec")
+    assert f.seek_heading("Appendix") == Heading(level=1, text="Appendix")
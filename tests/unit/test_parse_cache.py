@@ -0,0 +1,182 @@
+from pathlib import Path
+
+import pytest
+
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_cursor import NodeCursor
+from mddocs.domain.doc_ir import Table
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+from mddocs.usecase.parse_cache import ParseCache
+
+
+class MemoryStorage:
+    """`StatStorage` を満たすインメモリ実装（読み込み回数を数える）。"""
+
+    def __init__(self, files: dict[str, str]):
+        self.files = files
+        self.stamps = {k: (1, len(v)) for k, v in files.items()}
+        self.reads = 0
+
+    def read(self, path: Path) -> str:
+        self.reads += 1
+        return self.files[str(path)]
+
+    def write(self, path: Path, content: str) -> None:
+        self.files[str(path)] = content
+        self.stamps[str(path)] = (self.stamps.get(str(path), (0, 0))[0] + 1, 0)
+
+    def stat(self, path: Path) -> tuple[int, int]:
+        return self.stamps[str(path)]
+
+
+class CountingParser(MarkdownParserImpl):
+    def __init__(self):
+        self.calls = 0
+
+    def parse(self, markdown_text: str):
+        self.calls += 1
+        return super().parse(markdown_text)
+
+
+TABLE_MD = "# T\n\n| k | v |\n| - | - |\n| a | 1 |\n"
+
+
+def test_stat_hit_skips_read_and_parse():
+    storage = MemoryStorage({"a.md": TABLE_MD})
+    parser = CountingParser()
+    cache = ParseCache()
+
+    first = cache.load(Path("a.md"), storage, parser)
+    second = cache.load(Path("a.md"), storage, parser)
+
+    assert first == second
+    assert (storage.reads, parser.calls) == (1, 1)
+    s = cache.stats()
+    assert (s.hits, s.stat_hits, s.misses, s.entries) == (1, 1, 1, 1)
+
+
+def test_changed_stamp_with_same_content_is_a_content_hit():
+    storage = MemoryStorage({"a.md": TABLE_MD, "b.md": TABLE_MD})
+    parser = CountingParser()
+    cache = ParseCache()
+
+    cache.load(Path("a.md"), storage, parser)
+    storage.stamps["a.md"] = (2, len(TABLE_MD))  # touched
+    cache.load(Path("a.md"), storage, parser)
+    cache.load(Path("b.md"), storage, parser)  # same content, other path
+
+    assert parser.calls == 1
+    assert cache.stats().content_hits == 2
+
+
+def test_modified_file_is_reparsed():
+    storage = MemoryStorage({"a.md": "# old\n"})
+    parser = CountingParser()
+    cache = ParseCache()
+
+    cache.load(Path("a.md"), storage, parser)
+    storage.write(Path("a.md"), "# new\n")
+    doc = cache.load(Path("a.md"), storage, parser)
+
+    assert doc.nodes[0].text == "new"
+    assert parser.calls == 2
+
+
+def test_lru_bounds_entries_and_bytes():
+    files = {f"{i}.md": f"# doc {i}\n" for i in range(5)}
+    storage = MemoryStorage(files)
+    parser = CountingParser()
+
+    cache = ParseCache(max_entries=2)
+    for name in files:
+        cache.load(Path(name), storage, parser)
+    s = cache.stats()
+    assert (s.entries, s.evictions) == (2, 3)
+
+    cache.load(Path("0.md"), storage, parser)  # evicted -> parsed again
+    assert parser.calls == 6
+
+    size = len(files["0.md"].encode())
+    by_bytes = ParseCache(max_bytes=2 * size)
+    for name in files:
+        by_bytes.load(Path(name), storage, parser)
+    assert by_bytes.stats().entries == 2
+    assert by_bytes.stats().bytes == 2 * size
+
+
+def test_invalidate_forces_reload():
+    storage = MemoryStorage({"a.md": TABLE_MD})
+    parser = CountingParser()
+    cache = ParseCache()
+
+    cache.load(Path("a.md"), storage, parser)
+    cache.invalidate(Path("a.md"))
+    cache.load(Path("a.md"), storage, parser)
+
+    assert parser.calls == 2
+    assert storage.reads == 2
+    cache.clear()
+    assert cache.stats().entries == 0
+
+
+def test_storage_without_stat_falls_back_to_content_hash():
+    class PlainStorage:
+        def read(self, path: Path) -> str:
+            return TABLE_MD
+
+        def write(self, path: Path, content: str) -> None:
+            raise NotImplementedError()
+
+    parser = CountingParser()
+    cache = ParseCache()
+    cache.load(Path("a.md"), PlainStorage(), parser)
+    cache.load(Path("a.md"), PlainStorage(), parser)
+
+    assert parser.calls == 1
+    assert cache.stats().content_hits == 1
+
+
+class MutatingModel(DocConvertible):
+    def __init__(self, table: Table):
+        self.table = table
+
+    @classmethod
+    def from_cursor(cls, cur: NodeCursor):
+        cur.next()  # heading
+        table = cur.expect(Table)
+        table.rows.append(["mutated", "!"])
+        table.headers[0] = "changed"
+        return cls(table)
+
+    def to_nodes(self):
+        return [self.table]
+
+
+def test_cached_documents_are_protected_from_model_mutation():
+    storage = MemoryStorage({"a.md": TABLE_MD})
+    uc = ConvertFileUsecase(
+        parser=MarkdownParserImpl(), renderer=None, storage=storage, cache=ParseCache()
+    )
+
+    for _ in range(3):
+        model = uc.load_model_from_path(Path("a.md"), MutatingModel)
+        assert model.table.rows == [["a", "1"], ["mutated", "!"]]
+        assert model.table.headers == ["changed", "v"]
+
+
+def test_usecase_with_file_storage(tmp_path: Path, file_storage):
+    p = tmp_path / "doc.md"
+    p.write_text(TABLE_MD, encoding="utf-8")
+    cache = ParseCache()
+    uc = ConvertFileUsecase(
+        parser=MarkdownParserImpl(), renderer=None, storage=file_storage, cache=cache
+    )
+
+    assert uc.load_document(p) == uc.load_document(p)
+    assert cache.stats().stat_hits == 1
+
+
+def test_invalid_bounds_are_rejected():
+    with pytest.raises(ValueError):
+        ParseCache(max_entries=0)
@@ -0,0 +1,249 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from mddocs.adapters.dir_watcher import PollingWatcher
+from mddocs.adapters.file_storage import FileStorage
+from mddocs.adapters.markdown_parser import MarkdownParserImpl
+from mddocs.domain.doc_convertible import DocConvertible
+from mddocs.domain.doc_cursor import NodeCursor
+from mddocs.domain.doc_ir import Paragraph
+from mddocs.usecase.convert_usecase import ConvertFileUsecase
+from mddocs.usecase.watch_usecase import ModelUpdate, WatchModelsUsecase
+
+
+class TextModel(DocConvertible):
+    def __init__(self, text: str):
+        self.text = text
+
+    @classmethod
+    def from_cursor(cls, cur: NodeCursor):
+        return cls(cur.collect_paragraph_text())
+
+    def to_nodes(self):
+        return [Paragraph(self.text)]
+
+
+class ScriptedWatcher:
+    """Returns the queued batches one `poll` at a time, then nothing."""
+
+    def __init__(self, files, batches):
+        self._files = files
+        self.batches = list(batches)
+        self.timeouts = []
+
+    def files(self):
+        return list(self._files)
+
+    def poll(self, timeout=None):
+        self.timeouts.append(timeout)
+        return set(self.batches.pop(0)) if self.batches else set()
+
+    def close(self):
+        pass
+
+
+class CountingStorage(FileStorage):
+    def __init__(self):
+        super().__init__()
+        self.reads = []
+
+    def read(self, path):
+        self.reads.append(path)
+        return super().read(path)
+
+
+def _usecase(storage=None):
+    return ConvertFileUsecase(MarkdownParserImpl(), None, storage or FileStorage())
+
+
+def _write(path: Path, text: str) -> None:
+    path.write_text(text + "\n", encoding="utf-8")
+
+
+def test_burst_is_debounced_and_only_changed_files_are_read(tmp_path):
+    paths = [tmp_path / f"{i}.md" for i in range(50)]
+    for i, p in enumerate(paths):
+        _write(p, f"doc {i}")
+    storage = CountingStorage()
+    a, b = paths[3], paths[7]
+    watcher = ScriptedWatcher(paths, [{a}, {b}, {a}])
+    seen = []
+    uc = WatchModelsUsecase(
+        _usecase(storage), watcher, TextModel, on_update=seen.append
+    )
+    assert len(uc.load_all()) == 50
+    storage.reads.clear()
+
+    _write(a, "edited a")
+    _write(b, "edited b")
+    updates = uc.poll_once(0)
+    # three polls merged into one reload; the fourth (empty) ended the burst
+    assert watcher.timeouts == [0, uc.debounce, uc.debounce, uc.debounce]
+    assert sorted(storage.reads) == [a, b]
+    assert [u.path for u in updates] == [a, b]
+    assert [u.model.text for u in updates] == ["edited a", "edited b"]
+    assert seen[-2:] == updates
+    assert uc.models[a].text == "edited a"
+    assert uc.poll_once(0) == []
+
+
+def test_max_delay_bounds_a_continuous_burst(tmp_path):
+    p = tmp_path / "a.md"
+    _write(p, "x")
+
+    class Endless(ScriptedWatcher):
+        def poll(self, timeout=None):
+            self.timeouts.append(timeout)
+            return {p}
+
+    watcher = Endless([p], [])
+    uc = WatchModelsUsecase(
+        _usecase(), watcher, TextModel, debounce=0.01, max_delay=0.05
+    )
+    assert [u.path for u in uc.poll_once(0)] == [p]
+    assert len(watcher.timeouts) >= 2
+
+
+def test_removed_and_broken_files(tmp_path):
+    good, broken = tmp_path / "good.md", tmp_path / "broken.md"
+    _write(good, "ok")
+    _write(broken, "ok too")
+    uc = WatchModelsUsecase(_usecase(), ScriptedWatcher([good, broken], []), TextModel)
+    uc.load_all()
+    good.unlink()
+    _write(broken, "#")  # empty heading: a parse error
+    updates = {u.path: u for u in uc.reload([good, broken])}
+    assert updates[good] == ModelUpdate(good, removed=True)
+    assert not updates[broken].ok and updates[broken].model is None
+    # the last good model of a broken file is kept
+    assert list(uc.models) == [broken]
+    assert uc.models[broken].text == "ok too"
+
+
+def test_rejects_bad_debounce():
+    with pytest.raises(ValueError):
+        WatchModelsUsecase(
+            _usecase(), ScriptedWatcher([], []), TextModel, debounce=1, max_delay=0.5
+        )
+
+
+def test_background_thread_publishes_to_async_iterator(tmp_path):
+    p = tmp_path / "a.md"
+    _write(p, "v1")
+    watcher = PollingWatcher(tmp_path, interval=0.01)
+    uc = WatchModelsUsecase(_usecase(), watcher, TextModel, debounce=0.02)
+    uc.load_all()
+
+    async def main():
+        received = []
+        subscribed = asyncio.Event()
+
+        async def consume():
+            iterator = uc.updates()
+            first = asyncio.ensure_future(iterator.__anext__())
+            await asyncio.sleep(0)  # let the iterator subscribe
+            subscribed.set()
+            received.append(await first)
+            async for update in iterator:
+                received.append(update)
+
+        task = asyncio.create_task(consume())
+        await subscribed.wait()
+        uc.start(poll_interval=0.05)
+        await asyncio.to_thread(_write, p, "version 2")
+        for _ in range(200):
+            if received:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.to_thread(uc.stop)
+        await asyncio.wait_for(task, 2.0)
+        return received
+
+    received = asyncio.run(main())
+    assert [(u.path, u.model.text) for u in received] == [(p, "version 2")]
+    assert uc.models[p].text == "version 2"
+
+
+def test_stop_reraises_callback_errors(tmp_path):
+    p = tmp_path / "a.md"
+    _write(p, "x")
+    called = threading.Event()
+
+    def boom(update):
+        called.set()
+        raise RuntimeError("callback failed")
+
+    uc = WatchModelsUsecase(
+        _usecase(), ScriptedWatcher([p], [{p}]), TextModel, on_update=boom
+    )
+    uc.start(poll_interval=0.01)
+    assert called.wait(2.0)
+    with pytest.raises(RuntimeError, match="callback failed"):
+        uc.stop()
+
+
+def test_reloads_do_not_start_a_process_pool(tmp_path, monkeypatch):
+    import mddocs.usecase.convert_usecase as convert_usecase
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a process pool was started")
+
+    monkeypatch.setattr(convert_usecase, "ProcessPoolExecutor", no_pool)
+    monkeypatch.setattr(convert_usecase.os, "cpu_count", lambda: 8)
+    paths = [tmp_path / f"{i}.md" for i in range(300)]  # more than one chunk
+    for p in paths:
+        _write(p, p.stem)
+    uc = WatchModelsUsecase(_usecase(), ScriptedWatcher(paths, []), TextModel)
+    assert all(u.ok for u in uc.load_all())
+    assert len(uc.models) == 300
+
+
+def test_given_executor_is_reused_across_reloads(tmp_path):
+    class CountingExecutor(ThreadPoolExecutor):
+        submitted = 0
+
+        def submit(self, *args, **kwargs):
+            self.submitted += 1
+            return super().submit(*args, **kwargs)
+
+    p = tmp_path / "a.md"
+    _write(p, "x")
+    with CountingExecutor(2) as executor:
+        uc = WatchModelsUsecase(
+            _usecase(), ScriptedWatcher([p], []), TextModel, executor=executor
+        )
+        uc.load_all()
+        _write(p, "y")
+        assert [u.model.text for u in uc.reload([p])] == ["y"]
+        assert executor.submitted == 2
+
+
+def test_thread_failure_ends_async_iterators_with_the_error(tmp_path):
+    p = tmp_path / "a.md"
+    _write(p, "x")
+
+    def boom(update):
+        raise RuntimeError("callback failed")
+
+    uc = WatchModelsUsecase(
+        _usecase(), ScriptedWatcher([p], [{p}]), TextModel, on_update=boom
+    )
+
+    async def main():
+        iterator = uc.updates()
+        first = asyncio.ensure_future(iterator.__anext__())
+        await asyncio.sleep(0)  # let the iterator subscribe
+        uc.start(poll_interval=0.01)
+        with pytest.raises(RuntimeError, match="callback failed"):
+            await asyncio.wait_for(first, 2.0)
+        # a late subscriber does not wait for updates that never come
+        with pytest.raises(RuntimeError, match="callback failed"):
+            await uc.updates().__anext__()
+
+    asyncio.run(main())
+    with pytest.raises(RuntimeError, match="callback failed"):
+        uc.stop()